@@ -1,4 +1,5 @@
 """Chart creation and management endpoints"""
+import asyncio
 import uuid
 from datetime import datetime
 from typing import Any, Dict
@@ -6,7 +7,7 @@ from typing import Any, Dict
 from fastapi import APIRouter, HTTPException, status
 from loguru import logger
 
-from app.calculators.ephemeris import EphemerisService
+from app.calculators.ephemeris import SWISSEPH_LOCK, ephemeris
 from app.calculators.almuten import almuten_figuris, Point
 from app.calculators.zodiac_releasing import ZRCalculator
 from app.calculators.profection import ProfectionCalculator
@@ -41,7 +42,6 @@ async def create_chart(birth: BirthInput):
         birth_date_value = datetime.fromisoformat(chart_birth.date).date()
 
         # Initialize services
-        ephemeris = EphemerisService()
         zr_calc = ZRCalculator()
         profection_calc = ProfectionCalculator()
         firdaria_calc = FirdariaCalculator()
@@ -52,165 +52,153 @@ async def create_chart(birth: BirthInput):
         midpoints_calc = MidpointsCalculator()
         fixed_stars_calc = FixedStarsCalculator()
         
-        try:
-            # Calculate Julian Day
-            jd = ephemeris.julian_day(birth_dt_utc)
-            
-            # Get planet positions
-            planets = ephemeris.get_all_planets(jd)
-            
-            # Calculate houses
-            house_system = "whole_sign" if birth.house == "W" else "placidus"
-            houses = ephemeris.get_houses(jd, birth.lat, birth.lon, house_system)
-            
-            # Determine day/night birth
-            is_day = ephemeris.is_day_birth(planets, houses)
-            
-            # Calculate lots
-            lots = ephemeris.calculate_lots(planets, houses, is_day)
-            
-            # Prepare points for Almuten calculation
-            almuten_points = [
-                Point("Sun", planets['Sun'].longitude, planets['Sun'].sign, planets['Sun'].degree_in_sign),
-                Point("Moon", planets['Moon'].longitude, planets['Moon'].sign, planets['Moon'].degree_in_sign),
-                Point("ASC", houses.asc, _longitude_to_sign(houses.asc), houses.asc % 30),
-                Point("MC", houses.mc, _longitude_to_sign(houses.mc), houses.mc % 30),
-                Point("Fortune", lots['Fortune'], _longitude_to_sign(lots['Fortune']), lots['Fortune'] % 30),
-                Point("Spirit", lots['Spirit'], _longitude_to_sign(lots['Spirit']), lots['Spirit'] % 30)
-            ]
-            
-            # Calculate Almuten Figuris
-            chart_data = {"is_day": is_day}
-            almuten_result = almuten_figuris(almuten_points, chart_data)
-            
-            # Calculate Zodiacal Releasing timeline
-            zr_timeline = zr_calc.compute_zr_timeline(
-                planets['Sun'].longitude,
-                planets['Moon'].longitude,
-                houses.asc,
-                is_day,
-                birth_date_value
-            )
-            
-            # Calculate Profection
-            profection_result = profection_calc.calculate_profection(
-                birth_date_value,
-                houses.asc
-            )
-            
-            # Calculate Firdaria
-            firdaria_result = firdaria_calc.get_current_firdaria(
-                birth_date_value,
-                is_day
-            )
-            
-            # Calculate Antiscia
-            planet_longitudes = {name: pos.longitude for name, pos in planets.items()}
-            antiscia_result = antiscia_calc.get_antiscia_summary(planet_longitudes)
+        # swisseph state is process-global; compute positions in a worker thread
+        # under the shared lock so concurrent chart builds are never disturbed.
+        house_system = "whole_sign" if birth.house == "W" else "placidus"
+        planets, houses, is_day, lots, ephemeris_status = await asyncio.to_thread(
+            _compute_positions, birth_dt_utc, birth.lat, birth.lon, house_system
+        )
+        
+        # Prepare points for Almuten calculation
+        almuten_points = [
+            Point("Sun", planets['Sun'].longitude, planets['Sun'].sign, planets['Sun'].degree_in_sign),
+            Point("Moon", planets['Moon'].longitude, planets['Moon'].sign, planets['Moon'].degree_in_sign),
+            Point("ASC", houses.asc, _longitude_to_sign(houses.asc), houses.asc % 30),
+            Point("MC", houses.mc, _longitude_to_sign(houses.mc), houses.mc % 30),
+            Point("Fortune", lots['Fortune'], _longitude_to_sign(lots['Fortune']), lots['Fortune'] % 30),
+            Point("Spirit", lots['Spirit'], _longitude_to_sign(lots['Spirit']), lots['Spirit'] % 30)
+        ]
+        
+        # Calculate Almuten Figuris
+        chart_data = {"is_day": is_day}
+        almuten_result = almuten_figuris(almuten_points, chart_data)
+        
+        # Calculate Zodiacal Releasing timeline
+        zr_timeline = zr_calc.compute_zr_timeline(
+            planets['Sun'].longitude,
+            planets['Moon'].longitude,
+            houses.asc,
+            is_day,
+            birth_date_value
+        )
+        
+        # Calculate Profection
+        profection_result = profection_calc.calculate_profection(
+            birth_date_value,
+            houses.asc
+        )
+        
+        # Calculate Firdaria
+        firdaria_result = firdaria_calc.get_current_firdaria(
+            birth_date_value,
+            is_day
+        )
+        
+        # Calculate Antiscia
+        planet_longitudes = {name: pos.longitude for name, pos in planets.items()}
+        antiscia_result = antiscia_calc.get_antiscia_summary(planet_longitudes)
 
-            # Calculate Progressions (Secondary)
-            progressions_result = progressions_calc.get_current_progressions(planet_longitudes, birth_date_value)
+        # Calculate Progressions (Secondary)
+        progressions_result = progressions_calc.get_current_progressions(planet_longitudes, birth_date_value)
 
-            # Calculate Solar Arc Directions
-            solar_arc_result = solar_arc_calc.get_current_solar_arc_directions(planet_longitudes, birth_date_value)
+        # Calculate Solar Arc Directions
+        solar_arc_result = solar_arc_calc.get_current_solar_arc_directions(planet_longitudes, birth_date_value)
 
-            # Calculate Transits (current)
-            # Note: For transits we need current positions, using simplified calculation
-            transits_result = transits_calc.get_major_transits(planet_longitudes, planet_longitudes)
+        # Calculate Transits (current)
+        # Note: For transits we need current positions, using simplified calculation
+        transits_result = transits_calc.get_major_transits(planet_longitudes, planet_longitudes)
 
-            # Calculate Midpoints
-            midpoints_result = midpoints_calc.get_major_midpoints_summary(planet_longitudes)
+        # Calculate Midpoints
+        midpoints_result = midpoints_calc.get_major_midpoints_summary(planet_longitudes)
 
-            # Calculate Fixed Stars
-            fixed_stars_result = fixed_stars_calc.get_star_contacts_summary(planet_longitudes)
-            
-            # Prepare calculations data for storage
-            calculations_data = {
-                "planets": {
-                    name: {
-                        "longitude": pos.longitude,
-                        "sign": pos.sign,
-                        "degree_in_sign": pos.degree_in_sign,
-                        "is_retrograde": pos.is_retrograde,
-                        "speed": pos.speed_longitude
-                    }
-                    for name, pos in planets.items()
-                },
-                "houses": {
-                    "system": house_system,
-                    "cusps": houses.cusps,
-                    "asc": houses.asc,
-                    "mc": houses.mc,
-                    "asc_sign": _longitude_to_sign(houses.asc),
-                    "mc_sign": _longitude_to_sign(houses.mc)
-                },
-                "almuten": {
-                    "winner": almuten_result.winner,
-                    "scores": almuten_result.scores,
-                    "tie_break_reason": almuten_result.tie_break_reason,
-                    "diagnostics": almuten_result.diagnostics
-                },
-                "zodiacal_releasing": {
-                    "lot_used": zr_timeline.lot_used,
-                    "current_periods": _get_current_zr_periods(zr_timeline, datetime.now().date()),
-                    "next_peaks": _get_next_peaks(zr_timeline, datetime.now().date()),
-                    "diagnostics": zr_timeline.diagnostics
-                },
-                "profection": {
-                    "age": profection_result.age,
-                    "profected_house": profection_result.profected_house,
-                    "profected_sign": profection_result.profected_sign,
-                    "year_lord": profection_result.year_lord,
-                    "activated_topics": profection_result.activated_topics
-                },
-                "firdaria": firdaria_result,
-                                    "antiscia": {
-                        "summary": antiscia_result["summary"],
-                        "strongest_contacts": antiscia_calc.get_strongest_antiscia_contacts(planet_longitudes, limit=3)
-                    },
-                    "progressions": progressions_result,
-                    "solar_arc": solar_arc_result,
-                    "transits": transits_result,
-                    "midpoints": midpoints_result,
-                    "fixed_stars": fixed_stars_result,
-                    "lots": lots,
-                    "is_day_birth": is_day,
-                    "ephemeris_status": ephemeris.status,
+        # Calculate Fixed Stars
+        fixed_stars_result = fixed_stars_calc.get_star_contacts_summary(planet_longitudes)
+        
+        # Prepare calculations data for storage
+        calculations_data = {
+            "planets": {
+                name: {
+                    "longitude": pos.longitude,
+                    "sign": pos.sign,
+                    "degree_in_sign": pos.degree_in_sign,
+                    "is_retrograde": pos.is_retrograde,
+                    "speed": pos.speed_longitude
                 }
-
-            # Save to database
-            saved = ChartService.save_chart(
-                chart_id=chart_id,
-                birth_data={
-                    "birth_date": chart_birth.date,
-                    "birth_time": chart_birth.time,
-                    "latitude": chart_birth.lat,
-                    "longitude": chart_birth.lng,
-                    "timezone": chart_birth.tz,
-                    "house": birth.house,
-                    "orb": birth.orb,
+                for name, pos in planets.items()
+            },
+            "houses": {
+                "system": house_system,
+                "cusps": houses.cusps,
+                "asc": houses.asc,
+                "mc": houses.mc,
+                "asc_sign": _longitude_to_sign(houses.asc),
+                "mc_sign": _longitude_to_sign(houses.mc)
+            },
+            "almuten": {
+                "winner": almuten_result.winner,
+                "scores": almuten_result.scores,
+                "tie_break_reason": almuten_result.tie_break_reason,
+                "diagnostics": almuten_result.diagnostics
+            },
+            "zodiacal_releasing": {
+                "lot_used": zr_timeline.lot_used,
+                "current_periods": _get_current_zr_periods(zr_timeline, datetime.now().date()),
+                "next_peaks": _get_next_peaks(zr_timeline, datetime.now().date()),
+                "diagnostics": zr_timeline.diagnostics
+            },
+            "profection": {
+                "age": profection_result.age,
+                "profected_house": profection_result.profected_house,
+                "profected_sign": profection_result.profected_sign,
+                "year_lord": profection_result.year_lord,
+                "activated_topics": profection_result.activated_topics
+            },
+            "firdaria": firdaria_result,
+                                "antiscia": {
+                    "summary": antiscia_result["summary"],
+                    "strongest_contacts": antiscia_calc.get_strongest_antiscia_contacts(planet_longitudes, limit=3)
                 },
-                calculations=calculations_data
-            )
+                "progressions": progressions_result,
+                "solar_arc": solar_arc_result,
+                "transits": transits_result,
+                "midpoints": midpoints_result,
+                "fixed_stars": fixed_stars_result,
+                "lots": lots,
+                "is_day_birth": is_day,
+                "ephemeris_status": ephemeris_status,
+            }
 
-            if not saved:
-                logger.warning("Failed to persist chart to database", extra={"chart_id": chart_id})
+        # Save to database
+        saved = ChartService.save_chart(
+            chart_id=chart_id,
+            birth_data={
+                "birth_date": chart_birth.date,
+                "birth_time": chart_birth.time,
+                "latitude": chart_birth.lat,
+                "longitude": chart_birth.lng,
+                "timezone": chart_birth.tz,
+                "house": birth.house,
+                "orb": birth.orb,
+            },
+            calculations=calculations_data
+        )
 
-            # Format response
-            response = {
-                "chart_id": chart_id,
-                "status": "completed",
-                "birth_data": birth.model_dump(),
-                "calculations": calculations_data,
-                "created_at": datetime.now(),
-                "stored_in_db": saved,
-                "ephemeris_status": ephemeris.status,
-            }
+        if not saved:
+            logger.warning("Failed to persist chart to database", extra={"chart_id": chart_id})
 
-            return response
-            
-        finally:
-            ephemeris.close()
+        # Format response
+        response = {
+            "chart_id": chart_id,
+            "status": "completed",
+            "birth_data": birth.model_dump(),
+            "calculations": calculations_data,
+            "created_at": datetime.now(),
+            "stored_in_db": saved,
+            "ephemeris_status": ephemeris_status,
+        }
+
+        return response
+        
             
     except Exception as e:
         raise HTTPException(
@@ -236,6 +224,18 @@ async def get_chart(chart_id: str):
             detail=f"Error retrieving chart: {str(e)}"
         )
 
+def _compute_positions(birth_dt_utc: datetime, lat: float, lon: float, house_system: str):
+    """Run the swisseph-backed calculations on the shared ephemeris service."""
+    with SWISSEPH_LOCK:
+        ephemeris.prepare()
+        jd = ephemeris.julian_day(birth_dt_utc)
+        planets = ephemeris.get_all_planets(jd)
+        houses = ephemeris.get_houses(jd, lat, lon, house_system)
+        is_day = ephemeris.is_day_birth(planets, houses)
+        lots = ephemeris.calculate_lots(planets, houses, is_day)
+        return planets, houses, is_day, lots, ephemeris.status
+
+
 def _longitude_to_sign(longitude: float) -> str:
     """Convert longitude to zodiac sign"""
     signs = [
@@ -82,7 +82,7 @@ async def predict_horoscope(request: Request, payload: HoroscopeRequest) -> Horo
         )
 
     try:
-        result = HoroscopeService.predict(burc, gun)
+        result = await HoroscopeService.predict_async(burc, gun)
         return HoroscopeResponse(**result)
     except Exception as exc:  # pragma: no cover - runtime guard
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
@@ -223,18 +223,28 @@ class AntisciaCalculator:
                 for ap in result.antiscia_points + result.contra_antiscia_points
             ],
             "contacts": contacts_by_planet,
-            "summary": {
-                "total_contacts": len(result.contacts),
-                "planets_with_contacts": len(contacts_by_planet),
-                "orb_used": self.orb
-            },
+            "summary": self.summarize_contacts(result),
             "diagnostics": result.diagnostics
         }
     
+    def summarize_contacts(self, result: AntisciaResult) -> Dict[str, any]:
+        """Get contact counts without building the per-planet views"""
+        return {
+            "total_contacts": len(result.contacts),
+            "planets_with_contacts": len({c.antiscia_point.original_planet for c in result.contacts}),
+            "orb_used": self.orb
+        }
+    
     def get_strongest_antiscia_contacts(self, planet_positions: Dict[str, float], 
-                                      limit: int = 5) -> List[Dict[str, any]]:
-        """Get the strongest antiscia contacts sorted by orb"""
-        result = self.calculate_all_antiscia(planet_positions)
+                                      limit: int = 5,
+                                      result: Optional[AntisciaResult] = None) -> List[Dict[str, any]]:
+        """Get the strongest antiscia contacts sorted by orb
+        
+        Args:
+            result: Precomputed result for the same positions, to skip recalculation
+        """
+        if result is None:
+            result = self.calculate_all_antiscia(planet_positions)
         
         # Sort contacts by orb (tightest first)
         sorted_contacts = sorted(result.contacts, key=lambda c: c.orb)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import math
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +36,13 @@ if SWISSEPH_AVAILABLE:
                 extra={"path": ephe_path, "error": str(exc)},
             )
 
+# swisseph keeps process-global state, and close() invalidates it for every
+# service. Hold this lock around multi-call computations that must not see a
+# concurrent close(); services re-apply their path after someone else closes.
+SWISSEPH_LOCK = threading.RLock()
+_close_generation = 0
+
+
 @dataclass
 class PlanetPosition:
     """Planet position data"""
@@ -126,19 +134,37 @@ class EphemerisService:
         """Initialize ephemeris service."""
         self._ephemeris_path = ephemeris_path or settings.SWISSEPH_DATA_PATH
         self._mock_used = not SWISSEPH_AVAILABLE
+        self._generation = _close_generation
         if SWISSEPH_AVAILABLE:
-            if self._ephemeris_path:
-                try:
-                    swe.set_ephe_path(str(Path(self._ephemeris_path).expanduser()))
-                except Exception as exc:  # pragma: no cover - environment specific
-                    logger.warning(
-                        "Failed to configure Swiss Ephemeris path",
-                        extra={"path": self._ephemeris_path, "error": str(exc)},
-                    )
+            self._configure_path()
             self.flags = getattr(swe, "FLG_SWIEPH", 0) | getattr(swe, "FLG_SPEED", 0)
         else:
             self.flags = 0
 
+    def _configure_path(self) -> None:
+        """Point swisseph at this service's ephemeris data directory."""
+        self._generation = _close_generation
+        if not self._ephemeris_path:
+            return
+        try:
+            swe.set_ephe_path(str(Path(self._ephemeris_path).expanduser()))
+        except Exception as exc:  # pragma: no cover - environment specific
+            logger.warning(
+                "Failed to configure Swiss Ephemeris path",
+                extra={"path": self._ephemeris_path, "error": str(exc)},
+            )
+
+    def prepare(self) -> None:
+        """Make a long-lived service ready for a new chart computation.
+
+        Re-applies the data path if swisseph was closed since it was last
+        configured and clears the fallback flag so ``status`` describes only
+        the upcoming calculations.
+        """
+        if SWISSEPH_AVAILABLE and self._generation != _close_generation:
+            self._configure_path()
+        self._mock_used = not SWISSEPH_AVAILABLE
+
     @property
     def status(self) -> str:
         """Return execution mode information for observability."""
@@ -411,8 +437,11 @@ class EphemerisService:
 
     def close(self):
         """Close Swiss Ephemeris"""
+        global _close_generation
         if SWISSEPH_AVAILABLE:
-            swe.close()
+            with SWISSEPH_LOCK:
+                swe.close()
+                _close_generation += 1
 
 # Global ephemeris service instance
 ephemeris = EphemerisService()
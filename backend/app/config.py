@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import os
-from typing import ClassVar, Dict, List, Sequence
+from typing import ClassVar, Dict, List, Literal, Sequence
 
 from pydantic import AnyHttpUrl, Field, SecretStr, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -39,7 +39,11 @@ class Settings(BaseSettings):
     )
     REDIS_URL: str = "redis://localhost:6379/0"
     SEMANTIC_CACHE_TTL: int = 604800
+    # Similar-question answer reuse; 0 disables it. Keep it off until a real
+    # semantic embedder replaces the bag-of-words hash embedder.
+    SEMANTIC_CACHE_SIMILARITY: float = 0.0
     CACHE_TTL_SECONDS: int = 3600
+    CHART_CACHE_MAX_ENTRIES: int = 1024
     SWISSEPH_DATA_PATH: str | None = None
     SEARCH_BACKEND: str = "CHROMA"
     BM25_LANGUAGE: str = "turkish"
@@ -59,6 +63,8 @@ class Settings(BaseSettings):
     OPENSEARCH_PASSWORD: SecretStr | None = SecretStr("admin")
     OPENSEARCH_INDEX: str = "astro_docs"
     HYBRID_ALPHA: float = 0.6
+    HYBRID_FUSION: Literal["weighted", "rrf"] = "weighted"
+    HYBRID_RRF_K: int = 60
 
     # LLM provider
     OPENAI_API_KEY: SecretStr | None = None
@@ -77,6 +83,9 @@ class Settings(BaseSettings):
     RAG_DEGRADE_LATENCY_THRESHOLD_MS: int = 2300
     RAG_DEGRADE_MIN_SAMPLES: int = 20
     RAG_DEGRADE_TOP_K: int = 5
+    RAG_DEGRADE_SNAPSHOT_TTL_SECONDS: float = 1.0
+    RAG_DEGRADE_BUDGET_MULTI_HOP_MS: int = 1500
+    RAG_DEGRADE_BUDGET_REVISION_MS: int = 800
     COST_GUARDRAIL_MAX_USD: float = 0.02
     COST_GUARDRAIL_CE_REDUCE_TO: int = 8
     COST_GUARDRAIL_SMALL_RATIO_DELTA: float = 0.2
@@ -95,6 +104,8 @@ class Settings(BaseSettings):
     LLM_ROUTER_MEDIUM_MODEL: str = "gpt-4o-mini"
     LLM_ROUTER_LARGE_PROVIDER: str = "fallback_openai"
     LLM_ROUTER_LARGE_MODEL: str = "gpt-4o-mini"
+    LLM_ROUTER_HEDGE_AFTER_MS: int = 0
+    LLM_ROUTER_MAX_PARALLEL: int = 2
 
     REQUIRED_ENV_VARS: ClassVar[Sequence[str]] = ("OPENAI_API_KEY",)
 
@@ -168,6 +179,8 @@ class Settings(BaseSettings):
             "temperature": self.TEMPERATURE,
             "request_timeout_seconds": self.REQUEST_TIMEOUT_SECONDS,
             "cache_ttl_seconds": self.CACHE_TTL_SECONDS,
+            "semantic_cache_similarity": self.SEMANTIC_CACHE_SIMILARITY,
+            "chart_cache_max_entries": self.CHART_CACHE_MAX_ENTRIES,
             "swisseph_data_path": self.SWISSEPH_DATA_PATH,
             "embedding_model": self.EMBEDDING_MODEL,
             "use_embedding_model": self.USE_EMBEDDING_MODEL,
@@ -179,6 +192,7 @@ class Settings(BaseSettings):
             "opensearch_url": str(self.OPENSEARCH_URL) if self.OPENSEARCH_URL else None,
             "opensearch_index": self.OPENSEARCH_INDEX,
             "hybrid_alpha": self.HYBRID_ALPHA,
+            "hybrid_fusion": self.HYBRID_FUSION,
             "horoscope_model_dir": self.HOROSCOPE_MODEL_DIR,
             "mlflow_tracking_uri": self.MLFLOW_TRACKING_URI,
             "rag_rate_limit_per_minute": self.RAG_RATE_LIMIT_PER_MINUTE,
@@ -1,6 +1,7 @@
 """LLM orchestration with routing, health weighting, and schema validation."""
 from __future__ import annotations
 
+import asyncio
 import math
 import time
 from collections import deque
@@ -288,6 +289,10 @@ class LLMOrchestrator:
             "medium": getattr(settings, "LLM_ROUTER_TIMEOUT_MEDIUM_MS", 1600),
             "large": getattr(settings, "LLM_ROUTER_TIMEOUT_LARGE_MS", 2200),
         }
+        # A positive hedge delay starts the next fallback while a slow attempt
+        # is still pending; zero keeps strictly sequential failover.
+        self._hedge_after_s = max(0, getattr(settings, "LLM_ROUTER_HEDGE_AFTER_MS", 0)) / 1000.0
+        self._max_parallel = max(1, getattr(settings, "LLM_ROUTER_MAX_PARALLEL", 2))
 
     def _build_profiles(self) -> Dict[str, ModelProfile]:
         """Construct the routing profile table from settings."""
@@ -374,18 +379,15 @@ class LLMOrchestrator:
             lora_enabled=used_lora,
         )
 
-        for profile in [selected_model] + fallbacks:
-            provider_candidates = [p for p in profile.providers if self._pool.get_provider(p)]
-            if not provider_candidates:
-                continue
-            attempts += 1
+        async def _attempt(
+            profile: ModelProfile, provider_candidates: List[str]
+        ) -> Tuple[str, LLMResponse]:
             try:
                 base_timeout = self._timeout_table.get(profile.key, self._timeout_table.get("medium", 1600))
                 timeout_ms = int(base_timeout * timeout_factor)
                 best_provider = self._health_monitor.best_provider(provider_candidates)
                 chosen_provider = best_provider or provider_candidates[0]
-                decision.provider = chosen_provider
-                response = await self._pool.generate_with(
+                result = await self._pool.generate_with(
                     provider_name=chosen_provider,
                     messages=styled_messages,
                     json_mode=profile.json_mode,
@@ -393,15 +395,56 @@ class LLMOrchestrator:
                     model=profile.name,
                     timeout_ms=timeout_ms,
                 )
-                latency_ms = (time.perf_counter() - start_time) * 1000
-                self._health_monitor.record_success(chosen_provider, latency_ms)
-                observability.metrics.record_histogram("llm_router_latency", latency_ms)
-                observability.metrics.record_histogram("llm_router_confidence", confidence_score)
-                break
+            except asyncio.CancelledError:
+                raise
             except Exception:  # pragma: no cover - depends on provider failures
                 for candidate in provider_candidates:
                     self._health_monitor.record_failure(candidate)
-                continue
+                raise
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            self._health_monitor.record_success(chosen_provider, latency_ms)
+            observability.metrics.record_histogram("llm_router_latency", latency_ms)
+            observability.metrics.record_histogram("llm_router_confidence", confidence_score)
+            return chosen_provider, result
+
+        remaining = iter([selected_model] + fallbacks)
+        pending: set = set()
+        profiles_left = True
+
+        def _launch_next() -> None:
+            nonlocal attempts, profiles_left
+            for profile in remaining:
+                provider_candidates = [p for p in profile.providers if self._pool.get_provider(p)]
+                if not provider_candidates:
+                    continue
+                attempts += 1
+                pending.add(asyncio.create_task(_attempt(profile, provider_candidates)))
+                return
+            profiles_left = False
+
+        _launch_next()
+        try:
+            while pending and response is None:
+                # With no profiles left to hedge with, just wait for the in-flight attempts.
+                can_hedge = profiles_left and len(pending) < self._max_parallel
+                hedge = self._hedge_after_s if can_hedge else 0
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=hedge or None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    _launch_next()
+                    continue
+                for task in done:
+                    pending.discard(task)
+                    if not task.exception() and response is None:
+                        decision.provider, response = task.result()
+                if response is None and profiles_left:
+                    _launch_next()
+        finally:
+            for task in pending:
+                task.cancel()
 
         if not response:
             return None
@@ -68,6 +68,15 @@ class MetricCollector:
         """Record a histogram value"""
         self._add_point(name, value, tags or {})
     
+    def record_many(self, values: Dict[str, float], tags: Dict[str, str] = None):
+        """Record several histogram values sharing one timestamp and tag set"""
+        timestamp = datetime.now()
+        tags = tags or {}
+        for name, value in values.items():
+            self.metrics[name].append(
+                MetricPoint(name=name, value=value, timestamp=timestamp, tags=tags)
+            )
+    
     def time_function(self, name: str, tags: Dict[str, str] = None):
         """Decorator to time function execution"""
         def decorator(func):
@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional
 from loguru import logger
 
 from backend.app.config import settings
-from backend.app.ml import AdvancedAstrolojiModel
+from backend.app.ml import AdvancedAstrolojiModel, PredictionWorker
 
 VALID_BURCLAR = [
     "koç",
@@ -33,6 +33,7 @@ class HoroscopeService:
     """Prediction orchestration for horoscope API."""
 
     _model_instance: AdvancedAstrolojiModel | None = None
+    _worker: PredictionWorker | None = None
 
     @classmethod
     def sanitize_input(cls, value: Optional[str]) -> str:
@@ -72,10 +73,30 @@ class HoroscopeService:
                 cls._model_instance = AdvancedAstrolojiModel(resolved)
         return cls._model_instance
 
+    @classmethod
+    def get_worker(cls) -> PredictionWorker:
+        model = cls.get_model()
+        if cls._worker is None or cls._worker.model is not model:
+            cls._worker = PredictionWorker(model)
+        return cls._worker
+
     @classmethod
     def predict(cls, burc: str, gun: str) -> Dict[str, Any]:
         model = cls.get_model()
         result = model.predict_categories(burc, gun)
+        return cls._build_payload(model, burc, gun, result)
+
+    @classmethod
+    async def predict_async(cls, burc: str, gun: str) -> Dict[str, Any]:
+        """Predict through the shared batching worker so concurrent calls share one model call."""
+        worker = cls.get_worker()
+        result = await worker.submit(burc, gun)
+        return cls._build_payload(worker.model, burc, gun, result)
+
+    @classmethod
+    def _build_payload(
+        cls, model: AdvancedAstrolojiModel, burc: str, gun: str, result: Dict[str, Any]
+    ) -> Dict[str, Any]:
         horoscope_text = model.generate_horoscope(burc, gun, result.get("kategoriler", []))
         payload = {
             "tahmin": horoscope_text,
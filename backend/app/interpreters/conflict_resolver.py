@@ -73,13 +73,13 @@ class ConflictResolver:
         Returns:
             Tuple of (resolved_results, conflicts_found)
         """
-        self.conflicts_found = []
+        conflicts_found: List[Conflict] = []
         resolved_results = []
         
         for result in scoring_results:
             # Check for internal conflicts within each result
             internal_conflicts = self._find_internal_conflicts(result)
-            self.conflicts_found.extend(internal_conflicts)
+            conflicts_found.extend(internal_conflicts)
             
             # Apply conflict resolution
             resolved_result = self._apply_conflict_resolution(result, internal_conflicts)
@@ -87,12 +87,15 @@ class ConflictResolver:
         
         # Check for conflicts between results
         cross_conflicts = self._find_cross_conflicts(resolved_results)
-        self.conflicts_found.extend(cross_conflicts)
+        conflicts_found.extend(cross_conflicts)
         
         # Apply cross-result conflict resolution
         final_results = self._apply_cross_resolution(resolved_results, cross_conflicts)
         
-        return final_results, self.conflicts_found
+        # Collected locally so a shared resolver stays safe across threads;
+        # the attribute is kept for callers that inspect the last run.
+        self.conflicts_found = conflicts_found
+        return final_results, conflicts_found
     
     def _find_internal_conflicts(self, result: ScoringResult) -> List[Conflict]:
         """Find conflicts within a single scoring result"""
@@ -16,12 +16,18 @@ PII_PATTERNS = [
     re.compile(r"\b\d{1,3}\.\d{2,}\b"),  # coordinates
 ]
 
+# Every PII pattern above needs at least one digit, so a single-digit probe
+# lets digit-free messages skip the substitution passes entirely.
+_DIGIT_PATTERN = re.compile(r"\d")
+
 PII_FIELD_PATTERN = re.compile(
     r"(?i)(birth[_\s]?(date|time|place|location)|timezone|latitude|longitude)"
 )
 
 
 def _mask_text(value: str) -> str:
+    if not _DIGIT_PATTERN.search(value):
+        return value
     masked = value
     for pattern in PII_PATTERNS:
         masked = pattern.sub("[REDACTED]", masked)
@@ -1,24 +1,52 @@
 """
 Observability middleware for automatic metrics collection
 """
+import asyncio
 import time
 import uuid
+from collections import deque
+from typing import Deque, Optional, Tuple
 
 from fastapi import Request
 from loguru import logger
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..evaluation.observability import observability
 from app.evaluation.prometheus_bridge import record_api_request
 
 class ObservabilityMiddleware(BaseHTTPMiddleware):
-    """Middleware to automatically collect observability metrics"""
+    """Middleware to automatically collect observability metrics
+
+    Metric writes are queued and flushed by a background task so the response
+    path never waits on the metric backends. On application shutdown the task
+    is cancelled and whatever is still queued is flushed.
+    """
     
-    def __init__(self, app: ASGIApp):
+    def __init__(self, app: ASGIApp, flush_interval: float = 0.05, max_pending: int = 16384):
         super().__init__(app)
+        self.flush_interval = flush_interval
+        # deque.append/popleft are atomic, so producers never take a lock;
+        # when saturated the oldest samples are dropped instead of blocking.
+        self._pending: Deque[Tuple[str, str, int, float, Optional[str]]] = deque(maxlen=max_pending)
+        self._drain_task: Optional[asyncio.Task] = None
     
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "lifespan":
+            await super().__call__(scope, receive, send)
+            return
+
+        async def receive_until_shutdown():
+            message = await receive()
+            if message["type"] == "lifespan.shutdown":
+                await self.aclose()
+            return message
+
+        await self.app(scope, receive_until_shutdown, send)
+
     async def dispatch(self, request: Request, call_next):
+        self._ensure_drain_task()
+
         # Generate request ID
         request_id = str(uuid.uuid4())
         request.state.request_id = request_id
@@ -39,19 +67,7 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
             response_time = time.time() - start_time
             
             # Track metrics
-            observability.track_api_request(
-                endpoint=path,
-                method=method,
-                status_code=response.status_code,
-                response_time=response_time,
-                user_id=user_id
-            )
-            record_api_request(
-                method=method,
-                endpoint=path,
-                status=response.status_code,
-                latency_seconds=response_time,
-            )
+            self._pending.append((path, method, response.status_code, response_time, user_id))
             
             # Add response headers
             response.headers["X-Request-ID"] = request_id
@@ -64,22 +80,60 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
             response_time = time.time() - start_time
             
             # Track error
+            self._pending.append((path, method, 500, response_time, user_id))
+
+            # Re-raise the exception
+            raise e
+
+    def flush(self) -> int:
+        """Write all queued request metrics; returns the number flushed"""
+        pending = self._pending
+        flushed = 0
+        while pending:
+            path, method, status_code, response_time, user_id = pending.popleft()
             observability.track_api_request(
                 endpoint=path,
                 method=method,
-                status_code=500,
+                status_code=status_code,
                 response_time=response_time,
                 user_id=user_id
             )
             record_api_request(
                 method=method,
                 endpoint=path,
-                status=500,
+                status=status_code,
                 latency_seconds=response_time,
             )
-            
-            # Re-raise the exception
-            raise e
+            flushed += 1
+        return flushed
+
+    async def aclose(self) -> None:
+        """Stop the background flusher and write out anything still queued"""
+        task, self._drain_task = self._drain_task, None
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        try:
+            self.flush()
+        except Exception as exc:
+            logger.warning("Failed to flush request metrics", extra={"error": str(exc)})
+
+    def _ensure_drain_task(self) -> None:
+        """Start (or restart) the background flusher on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._drain_task is None or self._drain_task.done() or self._drain_task.get_loop() is not loop:
+            self._drain_task = loop.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.warning("Failed to flush request metrics", extra={"error": str(exc)})
     
     def _extract_user_id(self, request: Request) -> str:
         """Extract user ID from request (if available)"""
@@ -25,6 +25,7 @@ PII_FIELD_NAMES = {
 
 DATE_PATTERN = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
 TIME_PATTERN = re.compile(r"\b\d{2}:\d{2}(?::\d{2})?\b")
+DIGIT_PATTERN = re.compile(r"\d")
 
 
 class PIIMaskingMiddleware(BaseHTTPMiddleware):
@@ -69,6 +70,9 @@ class PIIMaskingMiddleware(BaseHTTPMiddleware):
         return value
 
     def _mask_text(self, value: str) -> str:
+        # Dates and times always contain digits; skip both passes otherwise.
+        if not DIGIT_PATTERN.search(value):
+            return value
         masked = DATE_PATTERN.sub("[REDACTED]", value)
         masked = TIME_PATTERN.sub("[REDACTED]", masked)
         return masked
@@ -1,4 +1,4 @@
 """Machine learning utilities for horoscope services."""
-from .horoscope_model import AdvancedAstrolojiModel, ModelDeployment
+from .horoscope_model import AdvancedAstrolojiModel, ModelDeployment, PredictionWorker
 
-__all__ = ["AdvancedAstrolojiModel", "ModelDeployment"]
+__all__ = ["AdvancedAstrolojiModel", "ModelDeployment", "PredictionWorker"]
@@ -1,10 +1,14 @@
 """Advanced horoscope model loading, inference, and deployment."""
 from __future__ import annotations
 
+import asyncio
 import json
+import random
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import joblib
 import numpy as np
@@ -17,12 +21,93 @@ try:  # pragma: no cover - optional dependency for deployment workflows
 except ImportError:  # pragma: no cover - mlflow optional at runtime
     mlflow = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
+
 from backend.app.config import settings
 
 PREDICTION_COUNT = Counter("predictions_total", "Total predictions", ["burc", "kategori"])
 PREDICTION_LATENCY = Histogram("prediction_latency_seconds", "Prediction latency")
 MODEL_CONFIDENCE = Gauge("model_confidence", "Model confidence score")
 
+PredictionRequest = Tuple[str, str, Optional[str]]
+
+MODEL_ARTIFACT_FILES = ("model.joblib", "vectorizer.joblib", "label_encoders.joblib", "scaler.joblib")
+METADATA_FILE = "metadata.json"
+
+# Loaded artefacts per resolved model directory, keyed by the files' mtimes so
+# a retrained model on disk is picked up while repeat loads are free.
+_ARTIFACT_CACHE: Dict[Path, Tuple[Tuple[int, ...], Tuple[Any, ...]]] = {}
+
+# Lookup tables replacing get_season/get_moon_phase/get_day_type branches in
+# the batched feature path: indexed by month - 1, (day - 1) // 7 and weekday >= 5.
+SEASON_LABELS = ("kis", "ilkbahar", "yaz", "sonbahar")
+SEASON_LUT = np.array([0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0], dtype=np.intp)
+MOON_PHASE_LABELS = ("yeni_ay", "ilk_dordun", "dolunay", "son_dordun")
+DAY_TYPE_LABELS = ("hafta_ici", "hafta_sonu")
+
+HOROSCOPE_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    "ask": (
+        "Aşk hayatınızda yeni gelişmeler kapıda. Kalbinizin sesini dinleyin.",
+        "Romantik enerjiler yükseliyor. Kendinizi sevgiye açın.",
+    ),
+    "kariyer": (
+        "Kariyerinizde önemli bir dönüm noktasındasınız. Fırsatları değerlendirin.",
+        "İş hayatınızda yaratıcı çözümlere ihtiyaç var.",
+    ),
+    "saglik": (
+        "Sağlığınıza dikkat etme zamanı. Dinlenmeyi ihmal etmeyin.",
+        "Enerjinizi doğru kullanmak size güç katacak.",
+    ),
+    "finans": (
+        "Maddi konularda şanslı bir dönemdesiniz. Akıllı yatırımlar yapın.",
+        "Finansal planlamanızı gözden geçirme zamanı.",
+    ),
+}
+DEFAULT_HOROSCOPE_TEMPLATES: Tuple[str, ...] = (
+    "Kozmik enerjiler sizi destekliyor. Sezgilerinize güvenin.",
+    "Yeni başlangıçlar için uygun bir zaman.",
+    "İlişkilerinizde denge kurmaya çalışın.",
+)
+
+
+def _read_metadata(path: Path) -> Dict[str, Any]:
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_param(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def _load_artifacts(model_path: Path) -> Tuple[Any, ...]:
+    """Load (model, vectorizer, label_encoders, scaler, metadata) for a model directory.
+
+    Artefacts are memory-mapped where joblib stored raw numpy buffers and are
+    shared between instances pointing at the same unchanged directory.
+    """
+    paths = [model_path / name for name in MODEL_ARTIFACT_FILES] + [model_path / METADATA_FILE]
+    signature = tuple(path.stat().st_mtime_ns for path in paths)
+    cache_key = model_path.resolve()
+    cached = _ARTIFACT_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    # Artefacts are independent files; loading them on separate threads overlaps
+    # file reads with unpickling on a cold page cache.
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        futures = [pool.submit(joblib.load, path, mmap_mode="r") for path in paths[:-1]]
+        futures.append(pool.submit(_read_metadata, paths[-1]))
+        loaded = tuple(future.result() for future in futures)
+    _ARTIFACT_CACHE[cache_key] = (signature, loaded)
+    return loaded
+
 
 class AdvancedAstrolojiModel:
     """Wrapper for trained horoscope classifiers and feature preprocessors."""
@@ -33,6 +118,11 @@ class AdvancedAstrolojiModel:
         self.model: Any = None
         self.vectorizer: Any = None
         self.label_encoders: Dict[str, Any] = {}
+        self._label_maps: Dict[str, Dict[str, int]] = {}
+        self._empty_text_vector: Optional[np.ndarray] = None
+        self._positive_columns: Optional[List[int]] = None
+        self._prediction_counters: Dict[Tuple[str, str], Any] = {}
+        self._category_labels: Tuple[str, ...] = ()
         self.scaler: Any = None
         self.metadata: Dict[str, Any] = {}
         self.performance_history: List[Dict[str, Any]] = []
@@ -41,12 +131,19 @@ class AdvancedAstrolojiModel:
     def load_model(self) -> None:
         """Load persisted artefacts into memory."""
         try:
-            self.model = joblib.load(self.model_path / "model.joblib")
-            self.vectorizer = joblib.load(self.model_path / "vectorizer.joblib")
-            self.label_encoders = joblib.load(self.model_path / "label_encoders.joblib")
-            self.scaler = joblib.load(self.model_path / "scaler.joblib")
-            with (self.model_path / "metadata.json").open("r", encoding="utf-8") as handle:
-                self.metadata = json.load(handle)
+            self.model, self.vectorizer, self.label_encoders, self.scaler, metadata = _load_artifacts(
+                self.model_path
+            )
+            self.metadata = dict(metadata)
+            # Requests carry no text, so the TF-IDF block is the same row every time.
+            self._empty_text_vector = self.vectorizer.transform([""]).toarray().astype(np.float32)
+            self._positive_columns = self._resolve_positive_columns()
+            if self._positive_columns is not None:
+                self._category_labels = self._category_labels_for(len(self._positive_columns))
+            self._label_maps = {
+                key: {str(label): code for code, label in enumerate(encoder.classes_)}
+                for key, encoder in self.label_encoders.items()
+            }
             self.model_loaded = True
             logger.info(
                 "Model yüklendi",
@@ -62,109 +159,137 @@ class AdvancedAstrolojiModel:
 
     def preprocess_input(self, burc: str, gun: str, tarih: Optional[str] = None) -> np.ndarray:
         """Transform incoming request into model feature space."""
-        if tarih is None:
-            tarih = datetime.utcnow().date().isoformat()
-
-        date_obj = datetime.strptime(tarih, "%Y-%m-%d")
-        ay = date_obj.month
-        haftanin_gunu = date_obj.weekday()
-        yilin_gunu = date_obj.timetuple().tm_yday
-
-        gun_tipi = self.get_day_type(date_obj)
-        mevsim = self.get_season(date_obj)
-        ay_evresi = self.get_moon_phase(date_obj)
-
-        burc_encoded = self._transform_label("burc", burc)
-        gun_tipi_encoded = self._transform_label("gun_tipi", gun_tipi)
-        mevsim_encoded = self._transform_label("mevsim", mevsim)
-        ay_evresi_encoded = self._transform_label("ay_evresi", ay_evresi)
-
-        numerical_features = np.array(
-            [
-                100,  # metin_uzunlugu placeholder
-                20,  # kelime_sayisi placeholder
-                0,  # duygu_skoru neutral baseline
-                ay,
-                haftanin_gunu,
-                yilin_gunu,
-                burc_encoded,
-                gun_tipi_encoded,
-                mevsim_encoded,
-                ay_evresi_encoded,
-            ]
-        ).reshape(1, -1)
+        return self.preprocess_batch([(burc, gun, tarih)])
+
+    def preprocess_batch(self, items: Sequence[PredictionRequest]) -> np.ndarray:
+        """Transform a batch of (burc, gun, tarih) requests into one feature matrix."""
+        today = datetime.utcnow().date().isoformat()
+        dates = np.array([tarih or today for _burc, _gun, tarih in items], dtype="datetime64[D]")
+        month_starts = dates.astype("datetime64[M]")
+        months = month_starts.astype(np.int64) % 12 + 1
+        days = (dates - month_starts).astype(np.int64) + 1
+        # 1970-01-01 was a Thursday, i.e. weekday() == 3.
+        weekdays = (dates.astype(np.int64) + 3) % 7
+        year_days = (dates - dates.astype("datetime64[Y]")).astype(np.int64) + 1
+
+        season_codes = self._label_codes("mevsim", SEASON_LABELS)
+        moon_codes = self._label_codes("ay_evresi", MOON_PHASE_LABELS)
+        day_type_codes = self._label_codes("gun_tipi", DAY_TYPE_LABELS)
+
+        numerical_features = np.empty((len(items), 10), dtype=np.float32)
+        numerical_features[:, 0] = 100  # metin_uzunlugu placeholder
+        numerical_features[:, 1] = 20  # kelime_sayisi placeholder
+        numerical_features[:, 2] = 0  # duygu_skoru neutral baseline
+        numerical_features[:, 3] = months
+        numerical_features[:, 4] = weekdays
+        numerical_features[:, 5] = year_days
+        numerical_features[:, 6] = [self._transform_label("burc", burc) for burc, _gun, _tarih in items]
+        numerical_features[:, 7] = day_type_codes[(weekdays >= 5).astype(np.intp)]
+        numerical_features[:, 8] = season_codes[SEASON_LUT[months - 1]]
+        numerical_features[:, 9] = moon_codes[np.minimum((days - 1) // 7, 3)]
 
         scaled = self.scaler.transform(numerical_features)
-        empty_text_vector = self.vectorizer.transform([""])
-        combined = np.hstack([scaled, empty_text_vector.toarray()])
+        # float32 end to end: tree ensembles cast to float32 internally anyway,
+        # so handing them a contiguous float32 matrix avoids a copy.
+        combined = np.empty((len(items), 10 + self._empty_text_vector.shape[1]), dtype=np.float32)
+        combined[:, :10] = scaled
+        combined[:, 10:] = self._empty_text_vector
         return combined
 
+    def _label_codes(self, encoder_key: str, labels: Sequence[str]) -> np.ndarray:
+        return np.array([self._transform_label(encoder_key, label) for label in labels], dtype=np.int64)
+
     def predict_categories(self, burc: str, gun: str, tarih: Optional[str] = None) -> Dict[str, Any]:
         """Predict topical categories and aggregate confidence."""
+        return self.predict_batch([(burc, gun, tarih)])[0]
+
+    def predict_batch(self, items: Sequence[PredictionRequest]) -> List[Dict[str, Any]]:
+        """Predict categories for many requests with a single ``predict_proba`` call."""
         if not self.model_loaded:
-            return self.get_fallback_categories()
+            return [self.get_fallback_categories() for _ in items]
+        if not items:
+            return []
 
         try:
-            features = self.preprocess_input(burc, gun, tarih)
+            features = self.preprocess_batch(items)
             with PREDICTION_LATENCY.time():
                 raw_outputs = self.model.predict_proba(features)
-            predicted: List[Dict[str, float]] = []
-            category_labels = self.metadata.get("categories", [])
-            for idx, probabilities in enumerate(raw_outputs):
-                label = category_labels[idx] if idx < len(category_labels) else f"category_{idx}"
-                if probabilities.shape[1] == 1:
-                    pos_prob = float(probabilities[0][0])
-                else:
-                    pos_prob = float(probabilities[0][1])
-                if pos_prob > 0.3:
-                    predicted.append(
-                        {
-                            "kategori": label,
-                            "olasilik": pos_prob,
-                        }
-                    )
-            predicted.sort(key=lambda item: item["olasilik"], reverse=True)
-            overall_confidence = float(np.mean([p["olasilik"] for p in predicted])) if predicted else 0.0
-            MODEL_CONFIDENCE.set(overall_confidence)
-            for item in predicted:
-                PREDICTION_COUNT.labels(burc=burc.lower(), kategori=item["kategori"]).inc()
-            return {
-                "kategoriler": predicted,
-                "toplam_guven": overall_confidence,
-                "model_version": self.metadata.get("version", "unknown"),
-            }
+            positive_columns = self._positive_columns or [
+                0 if probabilities.shape[1] == 1 else 1 for probabilities in raw_outputs
+            ]
+            category_labels = self._category_labels_for(len(positive_columns))
+            # (B, K) positive-class probabilities, one column per category.
+            positives = np.column_stack(
+                [probabilities[:, col] for probabilities, col in zip(raw_outputs, positive_columns)]
+            )
+            # Stable descending order keeps category order on ties, matching the
+            # previous list.sort(reverse=True); rows are then cut at the threshold.
+            orders = np.argsort(-positives, axis=1, kind="stable").tolist()
+            probability_rows = positives.tolist()
+            results: List[Dict[str, Any]] = []
+            for row, (burc, _gun, _tarih) in enumerate(items):
+                row_probs = probability_rows[row]
+                predicted: List[Dict[str, float]] = []
+                for idx in orders[row]:
+                    pos_prob = row_probs[idx]
+                    if pos_prob <= 0.3:
+                        break
+                    predicted.append({"kategori": category_labels[idx], "olasilik": pos_prob})
+                overall_confidence = (
+                    sum(item["olasilik"] for item in predicted) / len(predicted) if predicted else 0.0
+                )
+                MODEL_CONFIDENCE.set(overall_confidence)
+                burc_label = burc.lower()
+                for item in predicted:
+                    self._prediction_counter(burc_label, item["kategori"]).inc()
+                results.append(
+                    {
+                        "kategoriler": predicted,
+                        "toplam_guven": overall_confidence,
+                        "model_version": self.metadata.get("version", "unknown"),
+                    }
+                )
+            return results
         except Exception as exc:  # pragma: no cover - inference safeguards
             logger.exception("Tahmin hatası", error=str(exc))
-            return self.get_fallback_categories()
+            return [self.get_fallback_categories() for _ in items]
+
+    def _category_labels_for(self, output_count: int) -> Tuple[str, ...]:
+        """Label per model output, naming outputs missing from metadata by index."""
+        if len(self._category_labels) == output_count:
+            return self._category_labels
+        categories = self.metadata.get("categories", [])
+        return tuple(
+            categories[idx] if idx < len(categories) else f"category_{idx}" for idx in range(output_count)
+        )
+
+    def _prediction_counter(self, burc: str, kategori: str) -> Any:
+        """Bound PREDICTION_COUNT child for a label pair, memoized per model."""
+        key = (burc, kategori)
+        counter = self._prediction_counters.get(key)
+        if counter is None:
+            counter = PREDICTION_COUNT.labels(burc=burc, kategori=kategori)
+            self._prediction_counters[key] = counter
+        return counter
+
+    def _resolve_positive_columns(self) -> Optional[List[int]]:
+        """Column of the positive class in each per-category ``predict_proba`` output.
+
+        Single-class estimators return one column; their only column is used,
+        matching the shape-based check previously done per request.
+        """
+        estimators = getattr(self.model, "estimators_", None)
+        if not estimators:
+            return None
+        return [0 if len(estimator.classes_) == 1 else 1 for estimator in estimators]
 
     def generate_horoscope(self, burc: str, gun: str, categories: List[Dict[str, Any]]) -> str:
         """Generate horoscope summary using template heuristics."""
-        templates: Dict[str, List[str]] = {
-            "ask": [
-                "Aşk hayatınızda yeni gelişmeler kapıda. Kalbinizin sesini dinleyin.",
-                "Romantik enerjiler yükseliyor. Kendinizi sevgiye açın.",
-            ],
-            "kariyer": [
-                "Kariyerinizde önemli bir dönüm noktasındasınız. Fırsatları değerlendirin.",
-                "İş hayatınızda yaratıcı çözümlere ihtiyaç var.",
-            ],
-            "saglik": [
-                "Sağlığınıza dikkat etme zamanı. Dinlenmeyi ihmal etmeyin.",
-                "Enerjinizi doğru kullanmak size güç katacak.",
-            ],
-            "finans": [
-                "Maddi konularda şanslı bir dönemdesiniz. Akıllı yatırımlar yapın.",
-                "Finansal planlamanızı gözden geçirme zamanı.",
-            ],
-        }
-
         main_category = categories[0]["kategori"] if categories else "genel"
-        options = templates.get(main_category, [
-            "Kozmik enerjiler sizi destekliyor. Sezgilerinize güvenin.",
-            "Yeni başlangıçlar için uygun bir zaman.",
-            "İlişkilerinizde denge kurmaya çalışın.",
-        ])
-        choice_idx = int(datetime.utcnow().timestamp()) % len(options)
+        options = HOROSCOPE_TEMPLATES.get(main_category, DEFAULT_HOROSCOPE_TEMPLATES)
+        # crc32 is stable across processes (unlike hash()), so the same
+        # (burc, gun) always maps to the same template and stays cacheable.
+        choice_idx = zlib.crc32(f"{burc}|{gun}".encode("utf-8")) % len(options)
         summary = options[choice_idx]
         return f"{burc.title()} burcu için {gun}: {summary}"
 
@@ -200,11 +325,74 @@ class AdvancedAstrolojiModel:
         }
 
     def _transform_label(self, encoder_key: str, value: str) -> int:
-        try:
-            encoder = self.label_encoders[encoder_key]
-            return int(encoder.transform([value])[0])
-        except Exception:
-            return 0
+        return self._label_maps.get(encoder_key, {}).get(value, 0)
+
+
+class PredictionWorker:
+    """Coalesce concurrent prediction requests into batched model calls.
+
+    Requests queue up with a future each; a background task drains up to
+    ``max_batch_size`` of them (waiting at most ``max_wait_ms`` after the
+    first) and answers them with one :meth:`AdvancedAstrolojiModel.predict_batch`
+    call on a worker thread.
+    """
+
+    def __init__(self, model: AdvancedAstrolojiModel, max_batch_size: int = 32, max_wait_ms: float = 5.0) -> None:
+        self.model = model
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, burc: str, gun: str, tarih: Optional[str] = None) -> Dict[str, Any]:
+        """Queue a request and wait for its batched prediction."""
+        self._ensure_running()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((burc, gun, tarih), future))
+        return await future
+
+    async def stop(self) -> None:
+        """Cancel the background batcher."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._queue = None
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            items = [item for item, _future in batch]
+            try:
+                results = await asyncio.to_thread(self.model.predict_batch, items)
+            except Exception as exc:  # pragma: no cover - predict_batch already guards inference
+                for _item, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_item, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
 
 
 class ModelDeployment:
@@ -213,6 +401,9 @@ class ModelDeployment:
     def __init__(self) -> None:
         self.current_model: AdvancedAstrolojiModel | None = None
         self.model_versions: Dict[str, AdvancedAstrolojiModel] = {}
+        # (model, traffic share, version) bound as one tuple so routing reads a
+        # consistent snapshot and promotion is a single attribute rebind.
+        self._canary: Optional[Tuple[AdvancedAstrolojiModel, float, str]] = None
         if mlflow and settings.MLFLOW_TRACKING_URI:
             mlflow.set_tracking_uri(settings.MLFLOW_TRACKING_URI)
 
@@ -242,7 +433,7 @@ class ModelDeployment:
                         if isinstance(value, (str, int, float)):
                             mlflow.log_param(key, value)
                         else:
-                            mlflow.log_param(key, json.dumps(value))
+                            mlflow.log_param(key, _dumps_param(value))
                     if numeric_metrics:
                         mlflow.log_metrics(numeric_metrics)
                     mlflow.sklearn.log_model(candidate.model, "model")
@@ -252,6 +443,10 @@ class ModelDeployment:
             logger.exception("Deploy hatası", error=str(exc))
             return False
 
+    async def deploy_model_async(self, model_path: str | Path, version: str) -> bool:
+        """Run :meth:`deploy_model` on a worker thread so the event loop stays responsive."""
+        return await asyncio.to_thread(self.deploy_model, model_path, version)
+
     def validate_model(self, model: AdvancedAstrolojiModel) -> bool:
         metrics = model.metadata.get("metrics", {})
         accuracy = metrics.get("accuracy", 0)
@@ -270,10 +465,41 @@ class ModelDeployment:
         logger.info("Model rollback uygulandı", version=version)
         return True
 
-    def canary_deployment(self, model_path: str | Path, version: str, traffic_percentage: float = 0.1) -> None:
+    def canary_deployment(self, model_path: str | Path, version: str, traffic_percentage: float = 0.1) -> bool:
+        """Route ``traffic_percentage`` of predictions to a candidate model."""
+        candidate = AdvancedAstrolojiModel(model_path)
+        if not candidate.model_loaded or not self.validate_model(candidate):
+            logger.warning("Canary modeli doğrulamadan geçemedi", version=version)
+            return False
+        threshold = min(max(float(traffic_percentage), 0.0), 1.0)
+        self._canary = (candidate, threshold, version)
         logger.info(
-            "Canary deployment henüz uygulanmadı",
+            "Canary deployment başlatıldı",
             version=version,
-            traffic_percentage=traffic_percentage,
+            traffic_percentage=threshold,
             model_path=str(model_path),
         )
+        return True
+
+    def route_model(self) -> AdvancedAstrolojiModel | None:
+        """Pick the model serving the next prediction."""
+        canary = self._canary
+        if canary is not None and random.random() < canary[1]:
+            return canary[0]
+        return self.current_model
+
+    def promote_canary(self) -> bool:
+        """Make the canary the current model for all traffic."""
+        canary = self._canary
+        if canary is None:
+            return False
+        model, _threshold, version = canary
+        self.model_versions[version] = model
+        self.current_model = model
+        self._canary = None
+        logger.info("Canary modeli terfi ettirildi", version=version)
+        return True
+
+    def abort_canary(self) -> None:
+        """Stop routing traffic to the canary model."""
+        self._canary = None
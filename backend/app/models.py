@@ -1,18 +1,36 @@
 """
 Database models for Astro-AA
 """
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, JSON, ForeignKey
+import uuid
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, Float, Text, JSON, ForeignKey, Index, Uuid, false
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 Base = declarative_base()
 
+# Identifiers stay plain strings in Python but are stored as native 16-byte
+# UUIDs on PostgreSQL (CHAR(32) elsewhere) to keep PK/FK indexes compact.
+IdType = Uuid(as_uuid=False)
+
+# Parsed binary JSON on PostgreSQL (no re-parse per read, GIN-indexable);
+# plain JSON on other backends.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
 class Chart(Base):
     """Astrological chart model"""
     __tablename__ = "charts"
+    __table_args__ = (
+        Index("ix_chart_planets_gin", "planets", postgresql_using="gin"),
+        Index("ix_chart_lots_gin", "lots", postgresql_using="gin"),
+    )
 
-    id = Column(String, primary_key=True)
+    id = Column(IdType, primary_key=True, default=_new_id)
     user_id = Column(String, nullable=True)  # For future user association
     birth_date = Column(String, nullable=False)
     birth_time = Column(String, nullable=True)
@@ -22,18 +40,18 @@ class Chart(Base):
     place_name = Column(String, nullable=True)
 
     # Chart data as JSON
-    planets = Column(JSON, nullable=False)
-    houses = Column(JSON, nullable=False)
-    almuten = Column(JSON, nullable=False)
-    zodiacal_releasing = Column(JSON, nullable=False)
-    lots = Column(JSON, nullable=False)
-    lots_data = Column(JSON, nullable=False)  # Additional lots data
+    planets = Column(JSONType, nullable=False)
+    houses = Column(JSONType, nullable=False)
+    almuten = Column(JSONType, nullable=False)
+    zodiacal_releasing = Column(JSONType, nullable=False)
+    lots = Column(JSONType, nullable=False)
+    lots_data = Column(JSONType, nullable=False)  # Additional lots data
     is_day_birth = Column(Integer, nullable=False)  # 0 for night, 1 for day
 
     # Additional calculations
-    profection = Column(JSON, nullable=True)
-    firdaria = Column(JSON, nullable=True)
-    antiscia = Column(JSON, nullable=True)
+    profection = Column(JSONType, nullable=True)
+    firdaria = Column(JSONType, nullable=True)
+    antiscia = Column(JSONType, nullable=True)
 
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -46,17 +64,20 @@ class Chart(Base):
 class Interpretation(Base):
     """Interpretation result model"""
     __tablename__ = "interpretations"
+    __table_args__ = (
+        Index("ix_interpretation_chart_created", "chart_id", "created_at"),
+    )
 
-    id = Column(String, primary_key=True)
-    chart_id = Column(String, ForeignKey('charts.id'), nullable=False)
+    id = Column(IdType, primary_key=True, default=_new_id)
+    chart_id = Column(IdType, ForeignKey("charts.id"), nullable=False)
     query = Column(Text, nullable=False)
     mode = Column(String, default="natal")  # natal, timing, today
 
     # Results
     interpretation = Column(Text, nullable=False)
     confidence_score = Column(Float, nullable=False)
-    sources = Column(JSON, nullable=True)  # RAG sources used
-    metadata_info = Column(JSON, nullable=True)  # Additional metadata
+    sources = Column(JSONType, nullable=True)  # RAG sources used
+    metadata_info = Column(JSONType, nullable=True)  # Additional metadata
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -68,25 +89,31 @@ class Alert(Base):
     """Alert/notification model"""
     __tablename__ = "alerts"
 
-    id = Column(String, primary_key=True)
+    id = Column(IdType, primary_key=True, default=_new_id)
     user_id = Column(String, nullable=True)  # For future user association
     alert_type = Column(String, nullable=False)  # system, chart, interpretation, etc.
     severity = Column(String, default="info")  # info, warning, error, critical
     title = Column(String, nullable=False)
     message = Column(Text, nullable=False)
-    metadata_info = Column(JSON, nullable=True)  # Additional alert data
-    is_read = Column(Integer, default=0)  # 0=unread, 1=read
-    is_resolved = Column(Integer, default=0)  # 0=active, 1=resolved
+    metadata_info = Column(JSONType, nullable=True)  # Additional alert data
+    is_read = Column(Boolean, default=False, server_default=false(), nullable=False)
+    is_resolved = Column(Boolean, default=False, server_default=false(), nullable=False)
 
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     resolved_at = Column(DateTime, nullable=True)
 
+    # Declared after the columns so the partial-index predicate is the same
+    # ``NOT is_resolved`` expression the active-alerts query filters on.
+    __table_args__ = (
+        Index("ix_alert_active", user_id, created_at, postgresql_where=~is_resolved),
+    )
+
 class User(Base):
     """User model for authentication"""
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True)
+    id = Column(IdType, primary_key=True, default=_new_id)
     email = Column(String, unique=True, nullable=False)
     username = Column(String, unique=True, nullable=False)
     hashed_password = Column(String, nullable=False)
@@ -106,9 +133,12 @@ class User(Base):
 class ZRPeriod(Base):
     """Serialized slice of zodiacal releasing timing data."""
     __tablename__ = "zr_periods"
+    __table_args__ = (
+        Index("ix_zrperiod_chart_level_start", "chart_id", "level", "start_date"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    chart_id = Column(String, ForeignKey("charts.id"), index=True, nullable=False)
+    chart_id = Column(IdType, ForeignKey("charts.id"), nullable=False)
     level = Column(Integer, nullable=False)  # 1 or 2
     sign = Column(String, nullable=False)
     ruler = Column(String, nullable=False)
@@ -124,14 +154,17 @@ class ZRPeriod(Base):
 class ProfectionPeriod(Base):
     """Yearly profection summary tied to a stored chart."""
     __tablename__ = "profection_periods"
+    __table_args__ = (
+        Index("ix_profection_chart_age", "chart_id", "age"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    chart_id = Column(String, ForeignKey("charts.id"), index=True, nullable=False)
+    chart_id = Column(IdType, ForeignKey("charts.id"), nullable=False)
     age = Column(Integer, nullable=False)
     profected_house = Column(Integer, nullable=False)
     profected_sign = Column(String, nullable=False)
     year_lord = Column(String, nullable=True)
-    activated_topics = Column(JSON, nullable=True)
+    activated_topics = Column(JSONType, nullable=True)
 
     chart = relationship("Chart", back_populates="profection_periods")
 
@@ -139,9 +172,12 @@ class ProfectionPeriod(Base):
 class FirdariaPeriod(Base):
     """Major or minor firdaria interval derived from the chart."""
     __tablename__ = "firdaria_periods"
+    __table_args__ = (
+        Index("ix_firdaria_chart_type_start", "chart_id", "period_type", "start_date"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    chart_id = Column(String, ForeignKey("charts.id"), index=True, nullable=False)
+    chart_id = Column(IdType, ForeignKey("charts.id"), nullable=False)
     period_type = Column(String, nullable=False)  # major or minor
     lord = Column(String, nullable=False)
     start_date = Column(DateTime, nullable=True)
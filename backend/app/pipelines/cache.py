@@ -1,9 +1,15 @@
 """Semantic cache implementations for pipeline reuse."""
 from __future__ import annotations
 
-import asyncio
+import json
 import pickle
-from typing import Any, Dict, Optional
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence, Type
+
+import numpy as np
+from pydantic import BaseModel
 
 try:  # pragma: no cover - optional dependency
     from redis import Redis  # type: ignore
@@ -12,43 +18,259 @@ except Exception:  # pragma: no cover - redis optional
     Redis = None
     AsyncRedis = None
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover - fall back to zlib
+    zstandard = None  # type: ignore
+
+
+# Two-byte header on every Redis value: payload codec, then compression.
+CODEC_JSON = b"j"
+CODEC_MODEL = b"m"
+CODEC_PICKLE = b"p"
+COMPRESSION_NONE = b"-"
+COMPRESSION_ZLIB = b"z"
+COMPRESSION_ZSTD = b"s"
+COMPRESSION_MIN_BYTES = 512
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class CacheCodec:
+    """Encode cache values as tagged JSON with optional compression.
+
+    Pydantic models of ``model_type`` are stored as their JSON dump and
+    re-validated on read; other JSON-shaped values go through orjson when
+    available. Pickle is only used when explicitly allowed.
+    """
+
+    def __init__(
+        self,
+        model_type: Optional[Type[BaseModel]] = None,
+        allow_pickle: bool = False,
+        compression_min_bytes: int = COMPRESSION_MIN_BYTES,
+    ) -> None:
+        self.model_type = model_type
+        self.allow_pickle = allow_pickle
+        self.compression_min_bytes = compression_min_bytes
+        if zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(level=3)
+            self._decompressor = zstandard.ZstdDecompressor()
+        else:
+            self._compressor = None
+            self._decompressor = None
+
+    def encode(self, value: Any) -> Optional[bytes]:
+        """Serialize a value, returning None when it cannot be stored safely."""
+        try:
+            if self.model_type is not None and isinstance(value, self.model_type):
+                codec, body = CODEC_MODEL, value.model_dump_json().encode("utf-8")
+            else:
+                codec, body = CODEC_JSON, _json_dumps(value)
+        except (TypeError, ValueError):
+            if not self.allow_pickle:
+                return None
+            codec, body = CODEC_PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if len(body) < self.compression_min_bytes:
+            return codec + COMPRESSION_NONE + body
+        if self._compressor is not None:
+            return codec + COMPRESSION_ZSTD + self._compressor.compress(body)
+        return codec + COMPRESSION_ZLIB + zlib.compress(body, 3)
+
+    def decode(self, raw: bytes) -> Any:
+        """Inverse of :meth:`encode`; raises ``ValueError`` on unknown payloads."""
+        codec, compression, body = raw[:1], raw[1:2], raw[2:]
+        if compression == COMPRESSION_ZSTD:
+            if self._decompressor is None:
+                raise ValueError("zstandard not available to decode cache entry")
+            body = self._decompressor.decompress(body)
+        elif compression == COMPRESSION_ZLIB:
+            body = zlib.decompress(body)
+        elif compression != COMPRESSION_NONE:
+            raise ValueError("unknown cache compression tag")
+
+        if codec == CODEC_JSON:
+            return _json_loads(body)
+        if codec == CODEC_MODEL:
+            if self.model_type is None:
+                raise ValueError("cache entry requires a model type")
+            return self.model_type.model_validate_json(body)
+        if codec == CODEC_PICKLE and self.allow_pickle:
+            return pickle.loads(body)
+        raise ValueError("unsupported cache codec tag")
+
+
+class SimilarityIndex:
+    """Cosine nearest-neighbour lookup over cached query vectors.
+
+    Vectors are grouped into buckets (for example one per user, mode and
+    locale) so a lookup only ever compares against entries that are allowed
+    to answer each other. Buckets and their entries are both LRU bounded.
+    """
+
+    __slots__ = ("_buckets", "_max_buckets", "_max_per_bucket")
+
+    def __init__(self, max_buckets: int = 1024, max_per_bucket: int = 64) -> None:
+        self._buckets: "OrderedDict[str, OrderedDict[str, np.ndarray]]" = OrderedDict()
+        self._max_buckets = max_buckets
+        self._max_per_bucket = max_per_bucket
+
+    def add(self, bucket: str, key: str, vector: Sequence[float]) -> None:
+        """Remember the unit-normalised vector for a cache key."""
+        unit = _unit_vector(vector)
+        if unit is None:
+            return
+        entries = self._buckets.get(bucket)
+        if entries is None:
+            entries = self._buckets[bucket] = OrderedDict()
+        self._buckets.move_to_end(bucket)
+        entries[key] = unit
+        entries.move_to_end(key)
+        while len(entries) > self._max_per_bucket:
+            entries.popitem(last=False)
+        while len(self._buckets) > self._max_buckets:
+            self._buckets.popitem(last=False)
+
+    def nearest(self, bucket: str, vector: Sequence[float], min_score: float) -> Optional[str]:
+        """Return the most similar key in ``bucket`` scoring at least ``min_score``."""
+        entries = self._buckets.get(bucket)
+        if not entries:
+            return None
+        unit = _unit_vector(vector)
+        if unit is None:
+            return None
+        keys = list(entries)
+        scores = np.stack(list(entries.values())) @ unit
+        best = int(np.argmax(scores))
+        if scores[best] < min_score:
+            return None
+        return keys[best]
+
+    def discard(self, key: str) -> None:
+        """Forget a key in every bucket."""
+        for entries in self._buckets.values():
+            entries.pop(key, None)
+
+
+def _unit_vector(vector: Sequence[float]) -> Optional[np.ndarray]:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array))
+    if not norm:
+        return None
+    return array / norm
+
 
 class SemanticCache:
-    """In-memory async-friendly cache placeholder."""
+    """In-memory async-friendly LRU cache with a soft per-entry TTL.
 
-    def __init__(self) -> None:
-        """Create the async lock and underlying dict store."""
-        self._store: Dict[str, Any] = {}
-        self._lock = asyncio.Lock()
+    None of the methods await while touching the store, so each call runs to
+    completion on the event loop without a lock. Besides exact keys, entries
+    can be indexed by query vector and found again with :meth:`get_similar`.
+    """
+
+    __slots__ = ("_store", "_max_entries", "_entry_ttl", "_vectors")
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float | None = None) -> None:
+        """Create the recency-ordered entry store."""
+        self._store: "OrderedDict[str, tuple[Optional[float], Any]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._entry_ttl = ttl_seconds
+        self._vectors = SimilarityIndex()
 
     async def get(self, key: str) -> Optional[Any]:
-        """Fetch a cached entry, returning None on miss."""
-        async with self._lock:
-            return self._store.get(key)
+        """Fetch a cached entry, returning None on miss or expiry."""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._store.pop(key, None)
+            return None
+        self._store.move_to_end(key)
+        return value
 
     async def set(self, key: str, value: Any, ttl_factor: float | None = None) -> None:
-        """Store a value in memory; ttl_factor kept for API parity."""
-        async with self._lock:
-            self._store[key] = value
+        """Store a value in memory, evicting the least recently used entries."""
+        expires_at = None
+        if self._entry_ttl:
+            ttl = self._entry_ttl
+            if ttl_factor is not None:
+                ttl *= max(ttl_factor, 0.1)
+            expires_at = time.monotonic() + ttl
+        self._store[key] = (expires_at, value)
+        self._store.move_to_end(key)
+        while len(self._store) > self._max_entries:
+            self._store.popitem(last=False)
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Fetch several in-memory entries at once, preserving key order."""
+        # Bound explicitly so subclasses reuse this as their local-tier lookup.
+        return [await SemanticCache.get(self, key) for key in keys]
+
+    async def get_similar(
+        self, bucket: str, vector: Sequence[float], min_score: float
+    ) -> Optional[Any]:
+        """Fetch the entry whose indexed vector in ``bucket`` is closest to ``vector``."""
+        key = self._vectors.nearest(bucket, vector, min_score)
+        if key is None:
+            return None
+        return await self.get(key)
+
+    async def index_vector(self, bucket: str, key: str, vector: Sequence[float]) -> None:
+        """Make ``key`` discoverable through :meth:`get_similar` within ``bucket``."""
+        self._vectors.add(bucket, key, vector)
 
     async def invalidate(self, key: str) -> None:
         """Remove a key from the in-memory cache."""
-        async with self._lock:
-            self._store.pop(key, None)
+        self._store.pop(key, None)
+        self._vectors.discard(key)
 
 
 class RedisSemanticCache(SemanticCache):
-    """Redis backed semantic cache with pickle serialization."""
+    """Redis backed semantic cache fronted by the in-process LRU tier.
+
+    Hot keys are served from the inherited in-memory store; misses fall
+    through to Redis and are decoded once before populating the local tier.
+    """
 
-    def __init__(self, redis_url: str, ttl_seconds: int = 604800) -> None:
+    def __init__(
+        self,
+        redis_url: str,
+        ttl_seconds: int = 604800,
+        model_type: Optional[Type[BaseModel]] = None,
+        allow_pickle: bool = False,
+        local_max_entries: int = 256,
+        local_ttl_seconds: float = 60.0,
+    ) -> None:
         """Connect to Redis and remember the default TTL for cached entries."""
         if not AsyncRedis:
             raise RuntimeError("redis library not available")
+        super().__init__(max_entries=local_max_entries, ttl_seconds=local_ttl_seconds)
         self._redis: AsyncRedis = AsyncRedis.from_url(redis_url, encoding=None)
         self._ttl = ttl_seconds
+        self._codec = CacheCodec(model_type=model_type, allow_pickle=allow_pickle)
 
     async def get(self, key: str) -> Optional[Any]:
-        """Load a pickle-serialized value from Redis if available."""
+        """Serve from the local tier, else load and decode the value from Redis."""
+        cached = await super().get(key)
+        if cached is not None:
+            return cached
         try:
             raw = await self._redis.get(key)
         except Exception:
@@ -56,14 +278,48 @@ class RedisSemanticCache(SemanticCache):
         if raw is None:
             return None
         try:
-            return pickle.loads(raw)
+            value = self._codec.decode(raw)
         except Exception:
             await self.invalidate(key)
             return None
+        await super().set(key, value)
+        return value
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Fetch several entries with one Redis MGET for the local-tier misses."""
+        results = await super().mget(keys)
+        missing = [idx for idx, value in enumerate(results) if value is None]
+        if not missing:
+            return results
+        try:
+            raw_values = await self._redis.mget([keys[idx] for idx in missing])
+        except Exception:
+            return results
+
+        bad_keys: List[str] = []
+        for idx, raw in zip(missing, raw_values):
+            if raw is None:
+                continue
+            try:
+                value = self._codec.decode(raw)
+            except Exception:
+                bad_keys.append(keys[idx])
+                continue
+            results[idx] = value
+            await super().set(keys[idx], value)
+        if bad_keys:
+            try:
+                await self._redis.delete(*bad_keys)
+            except Exception:
+                pass
+        return results
 
     async def set(self, key: str, value: Any, ttl_factor: float | None = None) -> None:
-        """Store a serialized value and adjust TTL when instructed."""
-        data = pickle.dumps(value)
+        """Write through to both tiers and adjust TTL when instructed."""
+        await super().set(key, value, ttl_factor=ttl_factor)
+        data = self._codec.encode(value)
+        if data is None:
+            return
         try:
             ttl = self._ttl
             if ttl_factor is not None and ttl:
@@ -73,7 +329,8 @@ class RedisSemanticCache(SemanticCache):
             pass
 
     async def invalidate(self, key: str) -> None:
-        """Delete the Redis entry if the connection is healthy."""
+        """Drop the local entry and delete the Redis entry if the connection is healthy."""
+        await super().invalidate(key)
         try:
             await self._redis.delete(key)
         except Exception:
@@ -1,16 +1,19 @@
 """Chart bootstrapper that prepares natal/timing data for the RAG pipeline."""
 from __future__ import annotations
 
-import json
+import asyncio
 import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, date, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
 
 from zoneinfo import ZoneInfo
 
 from app.calculators import (
-    EphemerisService,
     Point,
     almuten_figuris,
     ZRCalculator,
@@ -23,11 +26,42 @@ from app.calculators import (
     MidpointsCalculator,
     FixedStarsCalculator,
 )
+from app.calculators.ephemeris import SWISSEPH_LOCK, ephemeris as shared_ephemeris
 from backend.app.config import settings
 from app.schemas import BirthData, ChartContext, NatalCore, TimingBundle
 
 
-@dataclass
+ChartCacheKey = Tuple[str, str, str, float, float]
+
+ZODIAC_SIGNS = (
+    "Aries",
+    "Taurus",
+    "Gemini",
+    "Cancer",
+    "Leo",
+    "Virgo",
+    "Libra",
+    "Scorpio",
+    "Sagittarius",
+    "Capricorn",
+    "Aquarius",
+    "Pisces",
+)
+
+# Calculators only hold configuration tables, so one instance of each serves
+# every chart build.
+_ZR_CALCULATOR = ZRCalculator()
+_PROFECTION_CALCULATOR = ProfectionCalculator()
+_FIRDARIA_CALCULATOR = FirdariaCalculator()
+_ANTISCIA_CALCULATOR = AntisciaCalculator()
+_PROGRESSIONS_CALCULATOR = ProgressionsCalculator()
+_SOLAR_ARC_CALCULATOR = SolarArcCalculator()
+_TRANSITS_CALCULATOR = TransitsCalculator()
+_MIDPOINTS_CALCULATOR = MidpointsCalculator()
+_FIXED_STARS_CALCULATOR = FixedStarsCalculator()
+
+
+@dataclass(slots=True)
 class ChartBuildResult:
     """Container with raw chart data used by the interpretation engine."""
 
@@ -38,10 +72,12 @@ class ChartBuildResult:
 class ChartBootstrapper:
     """High level orchestrator that caches and returns chart calculations."""
 
-    def __init__(self, cache_ttl: int | None = None) -> None:
-        """Initialize the bootstrapper with an in-memory TTL cache."""
+    def __init__(self, cache_ttl: int | None = None, max_entries: int | None = None) -> None:
+        """Initialize the bootstrapper with a bounded in-memory TTL cache."""
         self._ttl = cache_ttl or settings.CACHE_TTL_SECONDS
-        self._cache: Dict[str, tuple[float, ChartBuildResult]] = {}
+        self._max_entries = max_entries or settings.CHART_CACHE_MAX_ENTRIES
+        self._cache: "OrderedDict[ChartCacheKey, tuple[float, ChartBuildResult]]" = OrderedDict()
+        self._inflight: Dict[ChartCacheKey, "asyncio.Task[ChartBuildResult]"] = {}
 
     async def load(self, birth_data: Optional[BirthData]) -> ChartBuildResult:
         """Return chart data/context for given birth input (or empty)."""
@@ -50,181 +86,211 @@ class ChartBootstrapper:
             return empty
 
         key = self._fingerprint(birth_data)
-        now = time.time()
         cached = self._cache.get(key)
-        if cached and now - cached[0] < self._ttl:
-            return cached[1]
+        if cached is not None:
+            expires_at, result = cached
+            if expires_at > time.monotonic():
+                self._cache.move_to_end(key)
+                return result
+            del self._cache[key]
 
-        chart_result = self._compute_chart(birth_data)
-        self._cache[key] = (now, chart_result)
+        # Concurrent loads of the same chart share one build; shielding keeps
+        # a cancelled caller from aborting the build for the others.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._build(key, birth_data))
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _build(self, key: ChartCacheKey, birth_data: BirthData) -> ChartBuildResult:
+        """Compute a chart off the event loop and store it in the cache."""
+        try:
+            chart_result = await asyncio.to_thread(self._compute_chart_serialized, birth_data)
+        finally:
+            self._inflight.pop(key, None)
+        self._cache[key] = (time.monotonic() + self._ttl, chart_result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
         return chart_result
 
+    def _compute_chart_serialized(self, birth_data: BirthData) -> ChartBuildResult:
+        """Run ``_compute_chart`` while holding the process-wide swisseph lock.
+
+        Builds run on worker threads, so any other code touching swisseph
+        (``set_ephe_path``, calculations, ``close``) must also hold
+        ``SWISSEPH_LOCK`` and do so off the event loop, as the charts API does.
+        """
+        with SWISSEPH_LOCK:
+            return self._compute_chart(birth_data)
+
     def _compute_chart(self, birth_data: BirthData) -> ChartBuildResult:
         """Run all calculators to produce chart data and rendered context objects."""
         birth_dt = self._to_datetime(birth_data)
-        ephemeris = EphemerisService()
-
-        zr_calc = ZRCalculator()
-        profection_calc = ProfectionCalculator()
-        firdaria_calc = FirdariaCalculator()
-        antiscia_calc = AntisciaCalculator()
-        progressions_calc = ProgressionsCalculator()
-        solar_arc_calc = SolarArcCalculator()
-        transits_calc = TransitsCalculator()
-        midpoints_calc = MidpointsCalculator()
-        fixed_stars_calc = FixedStarsCalculator()
+        birth_date = birth_dt.date()
+        today = datetime.now(timezone.utc).date()
+        # Builds run one at a time under SWISSEPH_LOCK, so the long-lived
+        # service is reused instead of reopening swisseph files per chart.
+        ephemeris = shared_ephemeris
+        ephemeris.prepare()
 
-        try:
-            jd = ephemeris.julian_day(birth_dt)
-            planets = ephemeris.get_all_planets(jd)
-            houses = ephemeris.get_houses(jd, birth_data.lat, birth_data.lng)
-            is_day = ephemeris.is_day_birth(planets, houses)
-            lots = ephemeris.calculate_lots(planets, houses, is_day)
-
-            almuten_points = self._prepare_almuten_points(planets, houses, lots)
-            almuten_result = almuten_figuris(almuten_points, {"is_day": is_day})
-
-            zr_timeline = zr_calc.compute_zr_timeline(
-                planets["Sun"].longitude,
-                planets["Moon"].longitude,
-                houses.asc,
-                is_day,
-                date.fromisoformat(birth_data.date),
-            )
+        zr_calc = _ZR_CALCULATOR
+        profection_calc = _PROFECTION_CALCULATOR
+        firdaria_calc = _FIRDARIA_CALCULATOR
+        antiscia_calc = _ANTISCIA_CALCULATOR
+        progressions_calc = _PROGRESSIONS_CALCULATOR
+        solar_arc_calc = _SOLAR_ARC_CALCULATOR
+        transits_calc = _TRANSITS_CALCULATOR
+        midpoints_calc = _MIDPOINTS_CALCULATOR
+        fixed_stars_calc = _FIXED_STARS_CALCULATOR
 
-            profection_result = profection_calc.calculate_profection(
-                date.fromisoformat(birth_data.date),
-                houses.asc,
-            )
+        jd = ephemeris.julian_day(birth_dt)
+        planets = ephemeris.get_all_planets(jd)
+        houses = ephemeris.get_houses(jd, birth_data.lat, birth_data.lng)
+        is_day = ephemeris.is_day_birth(planets, houses)
+        lots = ephemeris.calculate_lots(planets, houses, is_day)
 
-            firdaria_result = firdaria_calc.get_current_firdaria(
-                date.fromisoformat(birth_data.date),
-                is_day,
-            )
+        almuten_points = self._prepare_almuten_points(planets, houses, lots)
+        almuten_result = almuten_figuris(almuten_points, {"is_day": is_day})
 
-            planet_longitudes = {name: pos.longitude for name, pos in planets.items()}
-            planet_longitudes["ASC"] = houses.asc
-            planet_longitudes["MC"] = houses.mc
+        zr_timeline = zr_calc.compute_zr_timeline(
+            planets["Sun"].longitude,
+            planets["Moon"].longitude,
+            houses.asc,
+            is_day,
+            birth_date,
+        )
 
-            antiscia_result = antiscia_calc.get_antiscia_summary(planet_longitudes)
-            progressions_result = progressions_calc.get_current_progressions(
-                planet_longitudes, date.fromisoformat(birth_data.date)
-            )
-            solar_arc_result = solar_arc_calc.get_current_solar_arc_directions(
-                planet_longitudes, date.fromisoformat(birth_data.date)
-            )
-            transits_result = transits_calc.get_major_transits(
-                planet_longitudes, planet_longitudes
-            )
-            midpoints_result = midpoints_calc.get_major_midpoints_summary(planet_longitudes)
-            fixed_stars_result = fixed_stars_calc.get_star_contacts_summary(planet_longitudes)
-
-            chart_data = {
-                "planets": {
-                    name: {
-                        "longitude": pos.longitude,
-                        "sign": pos.sign,
-                        "degree_in_sign": pos.degree_in_sign,
-                        "is_retrograde": pos.is_retrograde,
-                        "speed": pos.speed_longitude,
-                    }
-                    for name, pos in planets.items()
-                },
-                "houses": {
-                    "system": "placidus",
-                    "cusps": houses.cusps,
-                    "asc": houses.asc,
-                    "mc": houses.mc,
-                    "asc_sign": self._longitude_to_sign(houses.asc),
-                    "mc_sign": self._longitude_to_sign(houses.mc),
-                },
-                "almuten": {
-                    "winner": almuten_result.winner,
-                    "scores": almuten_result.scores,
-                    "tie_break_reason": almuten_result.tie_break_reason,
-                    "diagnostics": almuten_result.diagnostics,
-                },
-                "zodiacal_releasing": {
-                    "lot_used": zr_timeline.lot_used,
-                    "current_periods": self._current_zr_periods(
-                        zr_timeline, datetime.utcnow().date()
-                    ),
-                    "next_peaks": self._next_zr_peaks(zr_timeline, datetime.utcnow().date()),
-                    "diagnostics": zr_timeline.diagnostics,
-                },
-                "profection": {
-                    "age": profection_result.age,
-                    "profected_house": profection_result.profected_house,
-                    "profected_sign": profection_result.profected_sign,
-                    "year_lord": profection_result.year_lord,
-                    "activated_topics": profection_result.activated_topics,
-                },
-                "firdaria": firdaria_result,
-                "antiscia": {
-                    "summary": antiscia_result["summary"],
-                    "strongest_contacts": antiscia_calc.get_strongest_antiscia_contacts(
-                        planet_longitudes, limit=3
-                    ),
+        profection_result = profection_calc.calculate_profection(
+            birth_date,
+            houses.asc,
+        )
+
+        firdaria_result = firdaria_calc.get_current_firdaria(
+            birth_date,
+            is_day,
+        )
+
+        planet_longitudes = {name: pos.longitude for name, pos in planets.items()}
+        planet_longitudes["ASC"] = houses.asc
+        planet_longitudes["MC"] = houses.mc
+
+        # Only the summary counts and strongest contacts are kept, so both come
+        # from one antiscia pass instead of the full summary views.
+        antiscia_result = antiscia_calc.calculate_all_antiscia(planet_longitudes)
+        progressions_result = progressions_calc.get_current_progressions(
+            planet_longitudes, birth_date
+        )
+        solar_arc_result = solar_arc_calc.get_current_solar_arc_directions(
+            planet_longitudes, birth_date
+        )
+        transits_result = transits_calc.get_major_transits(
+            planet_longitudes, planet_longitudes
+        )
+        midpoints_result = midpoints_calc.get_major_midpoints_summary(planet_longitudes)
+        fixed_stars_result = fixed_stars_calc.get_star_contacts_summary(planet_longitudes)
+
+        chart_data = {
+            "planets": {
+                name: {
+                    "longitude": pos.longitude,
+                    "sign": pos.sign,
+                    "degree_in_sign": pos.degree_in_sign,
+                    "is_retrograde": pos.is_retrograde,
+                    "speed": pos.speed_longitude,
+                }
+                for name, pos in planets.items()
+            },
+            "houses": {
+                "system": "placidus",
+                "cusps": houses.cusps,
+                "asc": houses.asc,
+                "mc": houses.mc,
+                "asc_sign": self._longitude_to_sign(houses.asc),
+                "mc_sign": self._longitude_to_sign(houses.mc),
+            },
+            "almuten": {
+                "winner": almuten_result.winner,
+                "scores": almuten_result.scores,
+                "tie_break_reason": almuten_result.tie_break_reason,
+                "diagnostics": almuten_result.diagnostics,
+            },
+            "zodiacal_releasing": {
+                "lot_used": zr_timeline.lot_used,
+                "current_periods": self._current_zr_periods(zr_timeline, today),
+                "next_peaks": self._next_zr_peaks(zr_timeline, today),
+                "diagnostics": zr_timeline.diagnostics,
+            },
+            "profection": {
+                "age": profection_result.age,
+                "profected_house": profection_result.profected_house,
+                "profected_sign": profection_result.profected_sign,
+                "year_lord": profection_result.year_lord,
+                "activated_topics": profection_result.activated_topics,
+            },
+            "firdaria": firdaria_result,
+            "antiscia": {
+                "summary": antiscia_calc.summarize_contacts(antiscia_result),
+                "strongest_contacts": antiscia_calc.get_strongest_antiscia_contacts(
+                    planet_longitudes, limit=3, result=antiscia_result
+                ),
+            },
+            "progressions": progressions_result,
+            "solar_arc": solar_arc_result,
+            "transits": transits_result,
+            "midpoints": midpoints_result,
+            "fixed_stars": fixed_stars_result,
+            "lots": lots,
+            "is_day_birth": is_day,
+            "ephemeris_status": ephemeris.status,
+        }
+
+        context = ChartContext(
+            natal_core=NatalCore(
+                almuten_figuris=almuten_result.winner,
+                lights={
+                    "Sun": chart_data["planets"].get("Sun", {}),
+                    "Moon": chart_data["planets"].get("Moon", {}),
                 },
-                "progressions": progressions_result,
-                "solar_arc": solar_arc_result,
-                "transits": transits_result,
-                "midpoints": midpoints_result,
-                "fixed_stars": fixed_stars_result,
-                "lots": lots,
-                "is_day_birth": is_day,
-                "ephemeris_status": ephemeris.status,
-            }
-
-            context = ChartContext(
-                natal_core=NatalCore(
-                    almuten_figuris=almuten_result.winner,
-                    lights={
-                        "Sun": chart_data["planets"].get("Sun", {}),
-                        "Moon": chart_data["planets"].get("Moon", {}),
+                angles={
+                    "ASC": {
+                        "longitude": houses.asc,
+                        "sign": chart_data["houses"]["asc_sign"],
                     },
-                    angles={
-                        "ASC": {
-                            "longitude": houses.asc,
-                            "sign": chart_data["houses"]["asc_sign"],
-                        },
-                        "MC": {
-                            "longitude": houses.mc,
-                            "sign": chart_data["houses"]["mc_sign"],
-                        },
+                    "MC": {
+                        "longitude": houses.mc,
+                        "sign": chart_data["houses"]["mc_sign"],
                     },
-                    dignities=almuten_result.scores,
-                    antiscia=chart_data["antiscia"]["strongest_contacts"],
-                    midpoints=midpoints_result.get("major_midpoints", []),
-                    fixed_stars=fixed_stars_result.get("royal_star_contacts", []),
-                ),
-                timing_bundle=TimingBundle(
-                    zr=chart_data["zodiacal_releasing"],
-                    profection=chart_data["profection"],
-                    firdaria=chart_data["firdaria"],
-                    progressions=chart_data["progressions"],
-                    solar_arc=chart_data["solar_arc"],
-                    transits_applying=chart_data["transits"].get(
-                        "major_current_transits", []
-                    ),
-                    returns={},
+                },
+                dignities=almuten_result.scores,
+                antiscia=chart_data["antiscia"]["strongest_contacts"],
+                midpoints=midpoints_result.get("major_midpoints", []),
+                fixed_stars=fixed_stars_result.get("royal_star_contacts", []),
+            ),
+            timing_bundle=TimingBundle(
+                zr=chart_data["zodiacal_releasing"],
+                profection=chart_data["profection"],
+                firdaria=chart_data["firdaria"],
+                progressions=chart_data["progressions"],
+                solar_arc=chart_data["solar_arc"],
+                transits_applying=chart_data["transits"].get(
+                    "major_current_transits", []
                 ),
-            )
+                returns={},
+            ),
+        )
 
-            return ChartBuildResult(chart_data=chart_data, context=context)
-        finally:
-            ephemeris.close()
-
-    def _fingerprint(self, birth_data: BirthData) -> str:
-        """Build a deterministic cache key from birth data fields."""
-        payload = {
-            "date": birth_data.date,
-            "time": birth_data.time or "12:00",
-            "tz": birth_data.tz,
-            "lat": birth_data.lat,
-            "lng": birth_data.lng,
-        }
-        return json.dumps(payload, sort_keys=True)
+        return ChartBuildResult(chart_data=chart_data, context=context)
+
+    def _fingerprint(self, birth_data: BirthData) -> ChartCacheKey:
+        """Build a deterministic, natively hashable cache key from birth data fields."""
+        return (
+            birth_data.date,
+            birth_data.time or "12:00",
+            birth_data.tz,
+            birth_data.lat,
+            birth_data.lng,
+        )
 
     def _to_datetime(self, birth_data: BirthData) -> datetime:
         """Convert birth inputs into a timezone-aware datetime."""
@@ -248,100 +314,119 @@ class ChartBootstrapper:
 
     def _prepare_almuten_points(self, planets: Dict[str, Any], houses: Any, lots: Dict[str, float]) -> list[Point]:
         """Gather the key points needed to compute the almuten figuris."""
-        return [
-            Point(
-                "Sun",
-                planets["Sun"].longitude,
-                planets["Sun"].sign,
-                planets["Sun"].degree_in_sign,
-            ),
-            Point(
-                "Moon",
-                planets["Moon"].longitude,
-                planets["Moon"].sign,
-                planets["Moon"].degree_in_sign,
-            ),
-            Point("ASC", houses.asc, self._longitude_to_sign(houses.asc), houses.asc % 30),
-            Point("MC", houses.mc, self._longitude_to_sign(houses.mc), houses.mc % 30),
-            Point(
-                "Fortune",
-                lots["Fortune"],
-                self._longitude_to_sign(lots["Fortune"]),
-                lots["Fortune"] % 30,
-            ),
-            Point(
-                "Spirit",
-                lots["Spirit"],
-                self._longitude_to_sign(lots["Spirit"]),
-                lots["Spirit"] % 30,
-            ),
+        # Lights already carry sign and degree from the ephemeris; only the
+        # angles and lots need converting, once each.
+        sun = planets["Sun"]
+        moon = planets["Moon"]
+        points = [
+            Point("Sun", sun.longitude, sun.sign, sun.degree_in_sign),
+            Point("Moon", moon.longitude, moon.sign, moon.degree_in_sign),
         ]
+        for name, longitude in (
+            ("ASC", houses.asc),
+            ("MC", houses.mc),
+            ("Fortune", lots["Fortune"]),
+            ("Spirit", lots["Spirit"]),
+        ):
+            points.append(Point(name, longitude, ZODIAC_SIGNS[int(longitude % 360 // 30)], longitude % 30))
+        return points
 
     def _longitude_to_sign(self, longitude: float) -> str:
         """Translate an ecliptic longitude into its zodiac sign name."""
-        signs = [
-            "Aries",
-            "Taurus",
-            "Gemini",
-            "Cancer",
-            "Leo",
-            "Virgo",
-            "Libra",
-            "Scorpio",
-            "Sagittarius",
-            "Capricorn",
-            "Aquarius",
-            "Pisces",
-        ]
-        return signs[int(longitude % 360 // 30)]
+        return ZODIAC_SIGNS[int(longitude % 360 // 30)]
 
     def _current_zr_periods(self, timeline: Any, current_date: date) -> Dict[str, Any]:
         """Select the active L1 and L2 zodiacal releasing periods."""
-        current_l1 = None
-        current_l2 = None
-        for period in timeline.l1_periods:
-            if period.start_date <= current_date <= period.end_date:
-                current_l1 = {
-                    "level": period.level,
-                    "sign": period.sign,
-                    "ruler": period.ruler,
-                    "start_date": period.start_date.isoformat(),
-                    "end_date": period.end_date.isoformat(),
-                    "is_peak": period.is_peak,
-                    "is_lb": period.is_lb,
-                    "tone": period.tone,
-                }
-                break
-        for period in timeline.l2_periods:
-            if period.start_date <= current_date <= period.end_date:
-                current_l2 = {
+        index = _timeline_index(timeline)
+        current_l1 = index.l1.active(current_date.toordinal())
+        current_l2 = index.l2.active(current_date.toordinal())
+        return {
+            "l1": self._zr_period_payload(current_l1) if current_l1 is not None else None,
+            "l2": self._zr_period_payload(current_l2) if current_l2 is not None else None,
+        }
+
+    def _next_zr_peaks(self, timeline: Any, current_date: date) -> list[Dict[str, Any]]:
+        """Return the next few major ZR peaks after the current date."""
+        next_peaks: list[Dict[str, Any]] = []
+        for period in _timeline_index(timeline).l1.peaks_after(current_date.toordinal(), limit=3):
+            next_peaks.append(
+                {
                     "level": period.level,
                     "sign": period.sign,
                     "ruler": period.ruler,
                     "start_date": period.start_date.isoformat(),
                     "end_date": period.end_date.isoformat(),
-                    "is_peak": period.is_peak,
-                    "is_lb": period.is_lb,
-                    "tone": period.tone,
+                    "years_from_now": (period.start_date - current_date).days / 365.25,
                 }
-                break
-        return {"l1": current_l1, "l2": current_l2}
-
-    def _next_zr_peaks(self, timeline: Any, current_date: date) -> list[Dict[str, Any]]:
-        """Return the next few major ZR peaks after the current date."""
-        next_peaks: list[Dict[str, Any]] = []
-        for period in timeline.l1_periods:
-            if period.is_peak and period.start_date > current_date:
-                next_peaks.append(
-                    {
-                        "level": period.level,
-                        "sign": period.sign,
-                        "ruler": period.ruler,
-                        "start_date": period.start_date.isoformat(),
-                        "end_date": period.end_date.isoformat(),
-                        "years_from_now": (period.start_date - current_date).days / 365.25,
-                    }
-                )
-                if len(next_peaks) >= 3:
-                    break
+            )
         return next_peaks
+
+    def _zr_period_payload(self, period: Any) -> Dict[str, Any]:
+        """Render a single ZR period for the chart payload."""
+        return {
+            "level": period.level,
+            "sign": period.sign,
+            "ruler": period.ruler,
+            "start_date": period.start_date.isoformat(),
+            "end_date": period.end_date.isoformat(),
+            "is_peak": period.is_peak,
+            "is_lb": period.is_lb,
+            "tone": period.tone,
+        }
+
+
+class _ZRPeriodIndex:
+    """Column-wise view of one ZR level for O(log n) date lookups."""
+
+    __slots__ = ("periods", "starts", "ends", "peaks")
+
+    def __init__(self, periods: Sequence[Any]) -> None:
+        self.periods = tuple(periods)
+        count = len(self.periods)
+        self.starts = np.fromiter((p.start_date.toordinal() for p in self.periods), dtype=np.int64, count=count)
+        self.ends = np.fromiter((p.end_date.toordinal() for p in self.periods), dtype=np.int64, count=count)
+        self.peaks = np.fromiter((bool(p.is_peak) for p in self.periods), dtype=bool, count=count)
+
+    def active(self, day: int) -> Optional[Any]:
+        """Return the first period whose closed date range contains ``day``."""
+        # Periods are contiguous, so the first end on/after ``day`` matches the
+        # earlier period on shared boundary dates like the old linear scan did.
+        idx = int(np.searchsorted(self.ends, day, side="left"))
+        if idx < len(self.periods) and self.starts[idx] <= day:
+            return self.periods[idx]
+        return None
+
+    def peaks_after(self, day: int, limit: int) -> list[Any]:
+        """Return up to ``limit`` peak periods starting strictly after ``day``."""
+        first = int(np.searchsorted(self.starts, day, side="right"))
+        hits = np.flatnonzero(self.peaks[first:])[:limit] + first
+        return [self.periods[idx] for idx in hits.tolist()]
+
+
+class _ZRTimelineIndex:
+    """Sorted ordinal columns for the L1 and L2 periods of a timeline."""
+
+    __slots__ = ("l1", "l2")
+
+    def __init__(self, timeline: Any) -> None:
+        self.l1 = _ZRPeriodIndex(timeline.l1_periods)
+        self.l2 = _ZRPeriodIndex(timeline.l2_periods)
+
+
+_TIMELINE_INDEXES: Dict[int, _ZRTimelineIndex] = {}
+
+
+def _timeline_index(timeline: Any) -> _ZRTimelineIndex:
+    """Build the timeline index once and keep it for the timeline's lifetime."""
+    key = id(timeline)
+    index = _TIMELINE_INDEXES.get(key)
+    if index is not None:
+        return index
+    index = _ZRTimelineIndex(timeline)
+    try:
+        weakref.finalize(timeline, _TIMELINE_INDEXES.pop, key, None)
+    except TypeError:
+        # Objects without weakref support cannot be tracked; index them per call.
+        return index
+    _TIMELINE_INDEXES[key] = index
+    return index
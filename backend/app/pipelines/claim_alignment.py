@@ -2,58 +2,71 @@
 from __future__ import annotations
 
 import re
-from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import AbstractSet, Any, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
 
 from app.schemas.interpretation import AnswerPayload, CitationEntry
 
-_STOP_WORDS = {
-    "this",
-    "that",
-    "with",
-    "have",
-    "from",
-    "about",
-    "your",
-    "their",
-    "will",
-    "into",
-    "over",
-    "under",
-    "above",
-    "below",
-    "through",
-    "there",
-    "which",
-    "while",
-    "where",
-    "when",
-    "also",
-    "very",
-    "much",
-    "many",
-    "some",
-    "more",
-    "less",
-    "than",
-    "such",
-    "each",
-    "other",
-    "most",
-    "like",
-    "just",
-    "even",
-    "into",
-    "because",
-    "should",
-    "could",
-    "would",
-    "might",
-    "being",
-    "having",
-}
+try:  # pragma: no cover - optional dependency
+    from rapidfuzz import fuzz  # type: ignore
+except Exception:  # pragma: no cover - fall back to n-gram windows
+    fuzz = None  # type: ignore
+
+_STOP_WORDS = frozenset(
+    {
+        "this",
+        "that",
+        "with",
+        "have",
+        "from",
+        "about",
+        "your",
+        "their",
+        "will",
+        "into",
+        "over",
+        "under",
+        "above",
+        "below",
+        "through",
+        "there",
+        "which",
+        "while",
+        "where",
+        "when",
+        "also",
+        "very",
+        "much",
+        "many",
+        "some",
+        "more",
+        "less",
+        "than",
+        "such",
+        "each",
+        "other",
+        "most",
+        "like",
+        "just",
+        "even",
+        "into",
+        "because",
+        "should",
+        "could",
+        "would",
+        "might",
+        "being",
+        "having",
+    }
+)
 _MIN_TOKEN_LENGTH = 4
+_WORD_PATTERN = re.compile(r"\b[\w']+\b")
+_SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])\s+")
 _SUPPORTED_THRESHOLD = 0.6
+# Scores this close to 1.0 cannot be meaningfully improved by other evidence.
+_SATURATED_SCORE = 0.99
+_NGRAM_SIZE = 4
+_FALLBACK_WINDOW = 512
+_FALLBACK_STEP = 256
 
 
 def score_claim_alignment(
@@ -117,31 +130,52 @@ def score_claim_alignment(
         }
 
     doc_lookup = _build_doc_lookup(documents)
+    # Citation resolution and document normalisation do not depend on the
+    # claim, so both happen once instead of once per claim. Citations that
+    # resolve to an already-cited document would repeat its score, and ties
+    # keep the earlier citation, so only the first citation per document is
+    # compared.
+    cited_docs: List[Tuple[CitationEntry, Dict[str, Any], _PreparedDocument]] = []
+    seen_docs: set[int] = set()
+    for citation in citations:
+        doc = _resolve_doc_for_citation(citation, doc_lookup)
+        if not doc or id(doc) in seen_docs:
+            continue
+        seen_docs.add(id(doc))
+        cited_docs.append((citation, doc, _prepare_document(doc.get("content") or "")))
+
     results: List[Dict[str, Any]] = []
+    total_score = 0.0
+    supported_count = 0
 
     for claim in claims:
         best_score = 0.0
         best_span = ""
         best_doc_id: Optional[str] = None
         best_citation: Optional[CitationEntry] = None
+        claim_tokens = frozenset(_tokenize(claim["text"]))
+        claim_lower = claim["text"].lower()
 
-        for citation in citations:
-            doc = _resolve_doc_for_citation(citation, doc_lookup)
-            if not doc:
-                continue
-            doc_content = doc.get("content") or ""
-            score, span = _compare_claim_to_content(claim["text"], doc_content)
+        for citation, doc, prepared in cited_docs:
+            score, span = _compare_claim_to_content(claim_tokens, claim_lower, prepared, supported_threshold)
             if score > best_score:
                 best_score = score
                 best_span = span
                 best_doc_id = doc.get("source_id") or doc.get("doc_id")
                 best_citation = citation
-
+                if best_score >= _SATURATED_SCORE:
+                    break
+
+        # Aggregates use the rounded per-claim score reported below.
+        claim_score = round(best_score, 3)
+        total_score += claim_score
+        if claim_score >= supported_threshold:
+            supported_count += 1
         results.append(
             {
                 "text": claim["text"],
                 "origin": claim["origin"],
-                "score": round(best_score, 3),
+                "score": claim_score,
                 "citation_doc_id": getattr(best_citation, "doc_id", None),
                 "citation_section": getattr(best_citation, "section", None),
                 "citation_lines": (
@@ -153,9 +187,8 @@ def score_claim_alignment(
             }
         )
 
-    supported_count = sum(1 for item in results if item["score"] >= supported_threshold)
     total_claims = len(results) or 1
-    overall_score = round(sum(item["score"] for item in results) / total_claims, 3)
+    overall_score = round(total_score / total_claims, 3)
     supported_ratio = round(supported_count / total_claims, 3)
 
     return {
@@ -230,11 +263,11 @@ def _split_sentences(text: str) -> List[str]:
     """Split freeform text into sentences using simple punctuation heuristics."""
     if not text:
         return []
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = _SENTENCE_BOUNDARY_PATTERN.split(text)
     return [sentence.strip() for sentence in sentences if sentence and sentence.strip()]
 
 
-def _build_doc_lookup(documents: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+def _build_doc_lookup(documents: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
     """Create multiple identifier mappings so citations can resolve documents."""
     exact: Dict[str, Dict[str, Any]] = {}
     source_map: Dict[str, Dict[str, Any]] = {}
@@ -255,10 +288,18 @@ def _build_doc_lookup(documents: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str
             if isinstance(alt, str):
                 alt_keys.append((alt, doc))
 
+    # Every known identifier resolves in one hash lookup; earlier maps keep
+    # precedence. The ordered partial ids serve citations that only embed one.
+    by_any_id: Dict[str, Dict[str, Any]] = dict(exact)
+    partial_ids: List[Tuple[str, Dict[str, Any]]] = []
+    for candidate_id, doc in [*source_map.items(), *alt_keys]:
+        if candidate_id:
+            by_any_id.setdefault(candidate_id, doc)
+            partial_ids.append((candidate_id, doc))
+
     return {
-        "exact": exact,
-        "source": source_map,
-        "alt": alt_keys,
+        "by_any_id": by_any_id,
+        "partial": partial_ids,
     }
 
 
@@ -268,64 +309,120 @@ def _resolve_doc_for_citation(
 ) -> Optional[Dict[str, Any]]:
     """Match a citation against any known document identifier variant."""
     doc_id = getattr(citation, "doc_id", "") or ""
-    if doc_id in lookup["exact"]:
-        return lookup["exact"][doc_id]
-
-    for source_id, doc in lookup["source"].items():
-        if source_id and source_id in doc_id:
-            return doc
-        if source_id and doc_id.endswith(source_id):
-            return doc
+    doc = lookup["by_any_id"].get(doc_id)
+    if doc is not None:
+        return doc
 
-    for alt_id, doc in lookup["alt"]:
-        if alt_id and alt_id in doc_id:
+    for candidate_id, doc in lookup["partial"]:
+        if candidate_id in doc_id:
             return doc
 
     return None
 
 
-def _compare_claim_to_content(claim: str, content: str) -> Tuple[float, str]:
-    """Return similarity score and supporting span between a claim and document."""
-    tokens = _tokenize(claim)
-    normalized_tokens = set(tokens)
-    lowered_content = content.lower()
-    claim_lower = claim.lower()
-
-    matches: List[Tuple[int, int]] = []
-    found_tokens = set()
-
-    for token in normalized_tokens:
-        position = lowered_content.find(token)
-        if position != -1:
-            found_tokens.add(token)
-            matches.append((position, position + len(token)))
+class _PreparedDocument(NamedTuple):
+    """Document text normalised once for comparison against every claim."""
+
+    content: str
+    lowered: str
+    token_offsets: Dict[str, int]
+
+
+def _prepare_document(content: str) -> _PreparedDocument:
+    """Lowercase and tokenize a document, keeping each token's first offset."""
+    lowered = content.lower()
+    # The tokenizing pass already visits every word, so recording offsets here
+    # spares a str.find scan over the document per matched claim token.
+    token_offsets: Dict[str, int] = {}
+    for match in _WORD_PATTERN.finditer(lowered):
+        word = match.group()
+        if len(word) >= _MIN_TOKEN_LENGTH and word not in _STOP_WORDS:
+            token_offsets.setdefault(word, match.start())
+    return _PreparedDocument(content, lowered, token_offsets)
+
+
+def _compare_claim_to_content(
+    claim_tokens: FrozenSet[str],
+    claim_lower: str,
+    prepared: _PreparedDocument,
+    supported_threshold: float = _SATURATED_SCORE,
+) -> Tuple[float, str]:
+    """Return similarity score and supporting span between a claim and document.
+
+    Token overlap is the cheap prefilter: once it reaches
+    ``supported_threshold`` the claim counts as supported and the fuzzy
+    window alignment is skipped.
+    """
+    found_tokens = claim_tokens & prepared.token_offsets.keys()
+    token_score = len(found_tokens) / len(claim_tokens) if claim_tokens else 0.0
+    if token_score >= min(supported_threshold, _SATURATED_SCORE):
+        return min(token_score, 1.0), _token_span(prepared, found_tokens)
+
+    best_ratio, best_span = _best_fuzzy_window(claim_lower, prepared.lowered, prepared.content, token_score)
+    combined = max(token_score, best_ratio)
+    span_text = best_span or _token_span(prepared, found_tokens)
+    return min(combined, 1.0), span_text
 
-    token_score = len(found_tokens) / len(normalized_tokens) if normalized_tokens else 0.0
 
-    window = 420
-    step = 160
+def _best_fuzzy_window(
+    claim_lower: str,
+    lowered_content: str,
+    content: str,
+    cutoff: float,
+) -> Tuple[float, str]:
+    """Return the best sliding-window ratio above ``cutoff`` and its span."""
+    if not lowered_content:
+        return 0.0, ""
+
+    if fuzz is not None:
+        alignment = fuzz.partial_ratio_alignment(claim_lower, lowered_content, score_cutoff=cutoff * 100)
+        if alignment is None:
+            return 0.0, ""
+        return alignment.score / 100.0, content[alignment.dest_start : alignment.dest_end].strip()
+
+    # Fallback: share of the claim's character n-grams present in each
+    # overlapping window. Windows overlap by half, so claims up to
+    # _FALLBACK_STEP characters fit wholly inside one of them.
+    claim_grams = _char_ngrams(claim_lower)
+    if not claim_grams:
+        return 0.0, ""
     best_ratio = 0.0
     best_span = ""
-    if lowered_content:
-        for start in range(0, len(lowered_content), step):
-            snippet = lowered_content[start : start + window]
-            if not snippet:
-                continue
-            ratio = SequenceMatcher(None, claim_lower, snippet).ratio()
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_span = content[start : start + window].strip()
+    for start in range(0, max(1, len(lowered_content) - _FALLBACK_STEP), _FALLBACK_STEP):
+        window_grams = _char_ngrams(lowered_content[start : start + _FALLBACK_WINDOW])
+        if not window_grams:
+            continue
+        ratio = len(claim_grams & window_grams) / len(claim_grams)
+        if ratio > best_ratio:
+            best_ratio = ratio
+            best_span = content[start : start + _FALLBACK_WINDOW].strip()
+            if best_ratio >= 1.0:
+                break
+    if best_ratio < cutoff:
+        return 0.0, ""
+    return best_ratio, best_span
 
-    combined = max(token_score, best_ratio)
-    span_text = best_span if combined >= token_score else _build_span(content, matches)
-    return min(combined, 1.0), span_text
+
+def _char_ngrams(text: str) -> FrozenSet[str]:
+    """Return the set of overlapping character n-grams in ``text``."""
+    size = _NGRAM_SIZE
+    return frozenset(text[i : i + size] for i in range(len(text) - size + 1))
 
 
 def _tokenize(text: str) -> List[str]:
     """Lowercase and filter a text into informative tokens."""
-    words = re.findall(r"\b[\w']+\b", text.lower())
-    tokens = [word for word in words if len(word) >= _MIN_TOKEN_LENGTH and word not in _STOP_WORDS]
-    return tokens
+    return [
+        word
+        for word in _WORD_PATTERN.findall(text.lower())
+        if len(word) >= _MIN_TOKEN_LENGTH and word not in _STOP_WORDS
+    ]
+
+
+def _token_span(prepared: _PreparedDocument, tokens: AbstractSet[str]) -> str:
+    """Build the excerpt around the first occurrence of each matched token."""
+    offsets = prepared.token_offsets
+    matches = [(offsets[token], offsets[token] + len(token)) for token in tokens]
+    return _build_span(prepared.content, matches)
 
 
 def _build_span(content: str, matches: List[Tuple[int, int]]) -> str:
@@ -2,12 +2,18 @@
 from __future__ import annotations
 
 import math
+import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
+
 from backend.app.config import settings
 from app.evaluation.observability import observability
 
+# Below this many samples a plain sort beats numpy's conversion overhead.
+_PARTITION_MIN_VALUES = 16
+
 
 @dataclass
 class DegradeDecision:
@@ -22,6 +28,15 @@ class DegradeDecision:
     cost_actions: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class _MetricSnapshot:
+    """Metric readings a degrade evaluation depends on."""
+
+    latency_samples: int
+    latency_p95_ms: Optional[float]
+    latest_cost_usd: Optional[float]
+
+
 class DegradePolicyManager:
     """Computes degrade actions using live observability metrics."""
 
@@ -33,6 +48,9 @@ class DegradePolicyManager:
         latency_threshold_ms: Optional[int] = None,
         min_latency_samples: Optional[int] = None,
         rag_low_top_k: Optional[int] = None,
+        snapshot_ttl_seconds: Optional[float] = None,
+        budget_multi_hop_ms: Optional[int] = None,
+        budget_revision_ms: Optional[int] = None,
     ) -> None:
         """Parameterize the degrade guardrails and wire in the metrics backend."""
         self._metrics = metrics or observability.metrics
@@ -54,9 +72,25 @@ class DegradePolicyManager:
         self._cost_ce_reduce_to = getattr(settings, "COST_GUARDRAIL_CE_REDUCE_TO", None)
         self._cost_small_ratio_delta = getattr(settings, "COST_GUARDRAIL_SMALL_RATIO_DELTA", 0.0)
         self._cost_ttl_factor = getattr(settings, "COST_GUARDRAIL_TTL_FACTOR", 1.0)
+        self._snapshot_ttl = (
+            settings.RAG_DEGRADE_SNAPSHOT_TTL_SECONDS
+            if snapshot_ttl_seconds is None
+            else snapshot_ttl_seconds
+        )
+        self._budget_multi_hop_ms = (
+            settings.RAG_DEGRADE_BUDGET_MULTI_HOP_MS
+            if budget_multi_hop_ms is None
+            else budget_multi_hop_ms
+        )
+        self._budget_revision_ms = (
+            settings.RAG_DEGRADE_BUDGET_REVISION_MS
+            if budget_revision_ms is None
+            else budget_revision_ms
+        )
+        self._snapshot: Optional[tuple[float, _MetricSnapshot]] = None
 
-    def evaluate(self) -> DegradeDecision:
-        """Derive degrade decision from metric snapshots."""
+    def evaluate(self, latency_budget_ms: Optional[int] = None) -> DegradeDecision:
+        """Derive degrade decision from metric snapshots and the request's latency budget."""
         if not self._enabled:
             return DegradeDecision(active=False)
 
@@ -67,9 +101,9 @@ class DegradePolicyManager:
         cost_actions: Dict[str, Any] = {}
         timeout_factor = 1.0
 
-        latency_values = self._metrics.get_metric_values("rag_latency", 5)
-        if len(latency_values) >= self._min_latency_samples:
-            p95_latency = _percentile(latency_values, 95)
+        snapshot = self._metric_snapshot()
+        if snapshot.latency_p95_ms is not None:
+            p95_latency = snapshot.latency_p95_ms
             flags["latency_p95_ms"] = round(p95_latency, 2)
             if p95_latency >= self._latency_threshold_ms:
                 reasons.append(
@@ -88,24 +122,33 @@ class DegradePolicyManager:
                 flags["skip_multi_hop"] = True
                 timeout_factor = 1.1
         else:
-            flags["latency_samples"] = len(latency_values)
+            flags["latency_samples"] = snapshot.latency_samples
 
-        if self._cost_threshold is not None:
-            cost_values = self._metrics.get_metric_values("llm_cost_per_answer_usd", 15)
-            if cost_values:
-                latest_cost = cost_values[-1]
-                flags["cost_latest_usd"] = round(latest_cost, 4)
-                if latest_cost > self._cost_threshold:
-                    reasons.append(f"cost_per_answer>{self._cost_threshold}")
-                    if self._cost_ce_reduce_to:
-                        rag_overrides["rerank_top_k"] = self._cost_ce_reduce_to
-                        cost_actions["rerank_top_k"] = self._cost_ce_reduce_to
-                    if self._cost_small_ratio_delta:
-                        flags["prefer_small_delta"] = self._cost_small_ratio_delta
-                        cost_actions["prefer_small_delta"] = self._cost_small_ratio_delta
-                    if self._cost_ttl_factor and self._cost_ttl_factor > 1.0:
-                        flags["cache_ttl_factor"] = self._cost_ttl_factor
-                        cost_actions["cache_ttl_factor"] = self._cost_ttl_factor
+        # A tight per-request budget cannot absorb planner hops or an LLM
+        # revision, so drop them up front instead of running into the deadline.
+        # This is the client's choice, not system degradation, so it adds no
+        # reason and leaves the decision inactive.
+        if latency_budget_ms is not None:
+            flags["latency_budget_ms"] = latency_budget_ms
+            if latency_budget_ms < self._budget_multi_hop_ms:
+                flags["skip_multi_hop"] = True
+            if latency_budget_ms < self._budget_revision_ms:
+                llm_overrides["skip_revision"] = True
+
+        if snapshot.latest_cost_usd is not None:
+            latest_cost = snapshot.latest_cost_usd
+            flags["cost_latest_usd"] = round(latest_cost, 4)
+            if latest_cost > self._cost_threshold:
+                reasons.append(f"cost_per_answer>{self._cost_threshold}")
+                if self._cost_ce_reduce_to:
+                    rag_overrides["rerank_top_k"] = self._cost_ce_reduce_to
+                    cost_actions["rerank_top_k"] = self._cost_ce_reduce_to
+                if self._cost_small_ratio_delta:
+                    flags["prefer_small_delta"] = self._cost_small_ratio_delta
+                    cost_actions["prefer_small_delta"] = self._cost_small_ratio_delta
+                if self._cost_ttl_factor and self._cost_ttl_factor > 1.0:
+                    flags["cache_ttl_factor"] = self._cost_ttl_factor
+                    cost_actions["cache_ttl_factor"] = self._cost_ttl_factor
 
         active = bool(reasons)
         return DegradeDecision(
@@ -118,6 +161,36 @@ class DegradePolicyManager:
             cost_actions=cost_actions,
         )
 
+    def _metric_snapshot(self) -> _MetricSnapshot:
+        """Read the latency and cost windows, reusing a recent reading.
+
+        Each read filters whole timestamped metric windows, so requests within
+        the snapshot TTL share one reading. Decisions themselves are rebuilt
+        per call because the pipeline mutates their flags and overrides.
+        """
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._snapshot[0] < self._snapshot_ttl:
+            return self._snapshot[1]
+
+        latency_values = self._metrics.get_metric_values("rag_latency", 5)
+        latency_p95 = None
+        if len(latency_values) >= self._min_latency_samples:
+            latency_p95 = _percentile(latency_values, 95)
+
+        latest_cost = None
+        if self._cost_threshold is not None:
+            cost_values = self._metrics.get_metric_values("llm_cost_per_answer_usd", 15)
+            if cost_values:
+                latest_cost = cost_values[-1]
+
+        snapshot = _MetricSnapshot(
+            latency_samples=len(latency_values),
+            latency_p95_ms=latency_p95,
+            latest_cost_usd=latest_cost,
+        )
+        self._snapshot = (now, snapshot)
+        return snapshot
+
 
 def _percentile(values: Sequence[float], percentile: int) -> float:
     """Compute percentile using nearest-rank method."""
@@ -127,7 +200,10 @@ def _percentile(values: Sequence[float], percentile: int) -> float:
         return float(min(values))
     if percentile >= 100:
         return float(max(values))
-    ordered = sorted(values)
-    rank = max(1, math.ceil(percentile / 100 * len(ordered)))
-    index = min(rank - 1, len(ordered) - 1)
-    return float(ordered[index])
+    count = len(values)
+    rank = max(1, math.ceil(percentile / 100 * count))
+    index = min(rank - 1, count - 1)
+    if count < _PARTITION_MIN_VALUES:
+        return float(sorted(values)[index])
+    # Only one rank is needed, so an O(n) selection replaces the full sort.
+    return float(np.partition(np.asarray(values, dtype=np.float64), index)[index])
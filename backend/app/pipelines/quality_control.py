@@ -3,35 +3,66 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Sequence
+from itertools import islice
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 from loguru import logger
 
 from app.schemas import AnswerBody, AnswerPayload, CitationEntry, RAGAnswerRequest, TimingWindow
-from app.pipelines.sanitization import sanitize_text
-
-ASTRO_KEYWORDS = {
-    "sun",
-    "moon",
-    "mercury",
-    "venus",
-    "mars",
-    "jupiter",
-    "saturn",
-    "uranus",
-    "neptune",
-    "pluto",
-    "asc",
-    "ascendant",
-    "house",
-    "sign",
-    "transit",
-    "aspect",
-    "retrograde",
-}
-
-
-@dataclass
+from app.pipelines.sanitization import sanitize_sequence, sanitize_text
+
+ASTRO_KEYWORDS = frozenset(
+    {
+        "sun",
+        "moon",
+        "mercury",
+        "venus",
+        "mars",
+        "jupiter",
+        "saturn",
+        "uranus",
+        "neptune",
+        "pluto",
+        "asc",
+        "ascendant",
+        "house",
+        "sign",
+        "transit",
+        "aspect",
+        "retrograde",
+    }
+)
+
+# Longest alternatives first so "ascendant" wins over its "asc" prefix.
+_ASTRO_KEYWORD_PATTERN = re.compile(
+    r"\b(?:" + "|".join(sorted(ASTRO_KEYWORDS, key=lambda word: (-len(word), word))) + r")\b",
+    re.IGNORECASE,
+)
+
+
+_NO_ISSUES: Tuple[str, ...] = ()
+_SNIPPET_MAX_CHARS = 200
+
+
+def _append_issue(issues: Optional[List[str]], issue: str) -> List[str]:
+    if issues is None:
+        return [issue]
+    issues.append(issue)
+    return issues
+
+
+def _optional_str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _doc_field(doc: Any, key: str, default: Any = None) -> Any:
+    """Read a field from a retrieved document given as a dict or an object."""
+    if isinstance(doc, dict):
+        return doc.get(key, default)
+    return getattr(doc, key, default)
+
+
+@dataclass(frozen=True, slots=True)
 class QualityThresholds:
     """Thresholds applied by the quality filter."""
 
@@ -43,12 +74,11 @@ class QualityThresholds:
     min_signal_terms: int = 1
 
 
-@dataclass
-class AnswerQualityReport:
+class AnswerQualityReport(NamedTuple):
     """Outcome of running the quality filter."""
 
     passed: bool
-    issues: List[str]
+    issues: Tuple[str, ...]
 
     @property
     def primary_issue(self) -> str:
@@ -58,51 +88,109 @@ class AnswerQualityReport:
 class AnswerQualityFilter:
     """Evaluate generated payloads against basic quality heuristics."""
 
-    SENTENCE_SPLIT = re.compile(r"[.!?]+")
-
     def __init__(self, thresholds: QualityThresholds | None = None) -> None:
         self._thresholds = thresholds or QualityThresholds()
 
     def evaluate(self, payload: AnswerPayload) -> AnswerQualityReport:
-        issues: List[str] = []
+        # Issues are only collected once a check fails; passing payloads
+        # share the empty _NO_ISSUES tuple.
+        issues: Optional[List[str]] = None
+        thresholds = self._thresholds
         body = payload.answer
         general = (body.general_profile or "").strip()
 
-        if len(general) < self._thresholds.min_general_chars:
-            issues.append("general_profile_too_short")
-
-        if self._count_sentences(general) < self._thresholds.min_general_sentences:
-            issues.append("insufficient_sentences")
-
-        signal_terms = self._signal_terms(general)
-        if signal_terms < self._thresholds.min_signal_terms:
-            issues.append("missing_astrology_signal")
-
-        if len(body.strengths or []) < self._thresholds.min_strengths:
-            issues.append("missing_strengths")
-
-        if len(body.watchouts or []) < self._thresholds.min_watchouts:
-            issues.append("missing_watchouts")
-
-        if len(payload.citations or []) < self._thresholds.min_citations:
-            issues.append("missing_citations")
-
-        passed = not issues
-        return AnswerQualityReport(passed=passed, issues=issues)
-
-    def _count_sentences(self, text: str) -> int:
-        tokens = [segment.strip() for segment in self.SENTENCE_SPLIT.split(text) if segment.strip()]
-        return len(tokens)
-
-    def _signal_terms(self, text: str) -> int:
-        terms = {token.strip(" ,;:").lower() for token in text.split()}
-        count = sum(1 for token in terms if token in ASTRO_KEYWORDS)
+        if len(general) < thresholds.min_general_chars:
+            # Already a hard fail; skip the sentence scan for text this short.
+            issues = _append_issue(issues, "general_profile_too_short")
+        else:
+            min_sentences = thresholds.min_general_sentences
+            if self._count_sentences(general, limit=min_sentences) < min_sentences:
+                issues = _append_issue(issues, "insufficient_sentences")
+
+        # An empty profile cannot contain keywords, so it skips the scan.
+        min_signal_terms = thresholds.min_signal_terms
+        if min_signal_terms > 0 and (
+            not general or not self._has_min_signal_terms(general, min_signal_terms)
+        ):
+            issues = _append_issue(issues, "missing_astrology_signal")
+
+        if (len(body.strengths) if body.strengths else 0) < thresholds.min_strengths:
+            issues = _append_issue(issues, "missing_strengths")
+
+        if (len(body.watchouts) if body.watchouts else 0) < thresholds.min_watchouts:
+            issues = _append_issue(issues, "missing_watchouts")
+
+        if (len(payload.citations) if payload.citations else 0) < thresholds.min_citations:
+            issues = _append_issue(issues, "missing_citations")
+
+        if issues is None:
+            return AnswerQualityReport(passed=True, issues=_NO_ISSUES)
+        return AnswerQualityReport(passed=False, issues=tuple(issues))
+
+    def _count_sentences(self, text: str, limit: int | None = None) -> int:
+        """Count non-blank segments separated by runs of ``.``, ``!`` or ``?``.
+
+        Callers only compare against a threshold, so scanning stops once
+        ``limit`` segments have been seen.
+        """
+        count = 0
+        in_segment = False
+        for char in text:
+            if char in ".!?":
+                in_segment = False
+            elif not in_segment and not char.isspace():
+                count += 1
+                if limit is not None and count >= limit:
+                    return count
+                in_segment = True
         return count
 
+    def _has_min_signal_terms(self, text: str, k: int) -> bool:
+        """Return True once ``k`` distinct astrology keywords appear in ``text``."""
+        if k <= 0:
+            return True
+        seen: set[str] = set()
+        for match in _ASTRO_KEYWORD_PATTERN.finditer(text):
+            seen.add(match.group(0).lower())
+            if len(seen) >= k:
+                return True
+        return False
+
 
 class TemplateFallbackBuilder:
     """Render a deterministic fallback payload when the quality filter fails."""
 
+    _TEMPLATES: Dict[str, Dict[str, str]] = {
+        "tr": {
+            "header": "Otomatik kalite denetimi devrede.",
+            "body": (
+                "Sistem, güvenilirlik sinyali zayıf olduğu için şablon yanıtına döndü. "
+                "Güncel odak başlıkları: {topics}. "
+                "Kaynaklara dayanarak ilerlemek için yeni veri veya ek soru sağlayabilirsiniz."
+            ),
+            "strength": "{topic} konusunda öğrenmeye açık ve dayanıklı bir tutum sergilemek avantaj sağlar.",
+            "watchout": "{topic} alanında aşırıya kaçmamaya, dinlenme ve sınır belirlemeye dikkat edin.",
+            "collective_note": (
+                "Bu yanıt otomatik güvenlik katmanı tarafından oluşturuldu. Yeni belgeler veya doğrudan sorular"
+                " ile daha derin bir yorum talep edebilirsiniz."
+            ),
+        },
+        "en": {
+            "header": "Safety fallback engaged.",
+            "body": (
+                "The pipeline detected low-confidence signals and served a templated outline instead. "
+                "Primary themes to monitor: {topics}. "
+                "Provide extra context or ask for a refinement to unlock a richer analysis."
+            ),
+            "strength": "Curiosity around {topic} helps build resilience and momentum.",
+            "watchout": "Watch for overextending yourself when navigating {topic}; pacing protects clarity.",
+            "collective_note": (
+                "This answer comes from the safety fallback template. Supply additional documents or a focused prompt "
+                "to unlock a richer interpretation."
+            ),
+        },
+    }
+
     def build(
         self,
         request: RAGAnswerRequest,
@@ -112,23 +200,31 @@ class TemplateFallbackBuilder:
         issues: Sequence[str],
         coverage: Dict[str, Any] | None = None,
     ) -> AnswerPayload:
-        language = (request.locale_settings.language or "en").lower()
+        # LocaleSettings.language is already normalised to "tr" or "en".
+        templates = self._TEMPLATES.get(request.locale_settings.language) or self._TEMPLATES["en"]
         topics = interpretation_summary.get("main_themes") or []
-        topics = [sanitize_text(str(topic)) for topic in topics if topic]
+        topics = sanitize_sequence(str(topic) for topic in topics if topic)
         if not topics:
             topics = [sanitize_text(request.query.strip()) or "Genel eğilim"]
 
-        general_profile = self._general_profile(language, topics, issues)
-        strengths = self._strengths(language, topics, base_payload.answer.strengths)
-        watchouts = self._watchouts(language, topics, base_payload.answer.watchouts)
+        lead_topics = topics[:2]
+        topic_text = ", ".join(topics[:3])
+
+        general_profile = self._general_profile(templates, topic_text, issues)
+        strengths = self._strengths(templates, lead_topics, base_payload.answer.strengths)
+        watchouts = self._watchouts(templates, lead_topics, base_payload.answer.watchouts)
         timing = base_payload.answer.timing or []
         citations = self._citations(base_payload.citations, rag_response)
 
-        metadata = base_payload.limits.model_copy(deep=True)
-        metadata.coverage_ok = bool(coverage.get("pass")) if coverage else False
-        metadata.hallucination_risk = "medium"
+        # AnswerMetadata only holds scalars, so a shallow copy is enough.
+        metadata = base_payload.limits.model_copy(
+            update={
+                "coverage_ok": bool(coverage.get("pass")) if coverage else False,
+                "hallucination_risk": "medium",
+            }
+        )
 
-        note = base_payload.answer.collective_note or self._collective_note(language)
+        note = base_payload.answer.collective_note or templates["collective_note"]
         mythic_refs = base_payload.answer.mythic_refs or []
 
         fallback_body = AnswerBody(
@@ -153,87 +249,73 @@ class TemplateFallbackBuilder:
             raise
         return fallback_payload
 
-    def _general_profile(self, language: str, topics: Sequence[str], issues: Sequence[str]) -> str:
-        topic_text = ", ".join(topics[:3])
-        if language.startswith("tr"):
-            header = "Otomatik kalite denetimi devrede."
-            body = (
-                f"Sistem, güvenilirlik sinyali zayıf olduğu için şablon yanıtına döndü. "
-                f"Güncel odak başlıkları: {topic_text}. "
-                "Kaynaklara dayanarak ilerlemek için yeni veri veya ek soru sağlayabilirsiniz."
-            )
-        else:
-            header = "Safety fallback engaged."
-            body = (
-                f"The pipeline detected low-confidence signals and served a templated outline instead. "
-                f"Primary themes to monitor: {topic_text}. "
-                "Provide extra context or ask for a refinement to unlock a richer analysis."
-            )
+    def _general_profile(
+        self,
+        templates: Dict[str, str],
+        topic_text: str,
+        issues: Sequence[str],
+    ) -> str:
+        body = templates["body"].format(topics=topic_text)
         issue_hint = f" (issues: {', '.join(issues)})" if issues else ""
-        return f"{header} {body}{issue_hint}"
+        return f"{templates['header']} {body}{issue_hint}"
 
     def _strengths(
         self,
-        language: str,
-        topics: Sequence[str],
+        templates: Dict[str, str],
+        lead_topics: Sequence[str],
         original: Iterable[str],
     ) -> List[str]:
-        strengths = [sanitize_text(item) for item in original if item]
+        strengths = sanitize_sequence(item for item in original if item)
         if strengths:
             return strengths
-        templates = []
-        for topic in topics[:2]:
-            if language.startswith("tr"):
-                templates.append(f"{topic} konusunda öğrenmeye açık ve dayanıklı bir tutum sergilemek avantaj sağlar.")
-            else:
-                templates.append(f"Curiosity around {topic} helps build resilience and momentum.")
-        if not templates:
-            templates.append("Adaptability and reflective practice remain reliable assets.")
-        return templates
+        strength = templates["strength"]
+        rendered = [strength.format(topic=topic) for topic in lead_topics]
+        return rendered or ["Adaptability and reflective practice remain reliable assets."]
 
     def _watchouts(
         self,
-        language: str,
-        topics: Sequence[str],
+        templates: Dict[str, str],
+        lead_topics: Sequence[str],
         original: Iterable[str],
     ) -> List[str]:
-        watchouts = [sanitize_text(item) for item in original if item]
+        watchouts = sanitize_sequence(item for item in original if item)
         if watchouts:
             return watchouts
-        templates = []
-        for topic in topics[:2]:
-            if language.startswith("tr"):
-                templates.append(f"{topic} alanında aşırıya kaçmamaya, dinlenme ve sınır belirlemeye dikkat edin.")
-            else:
-                templates.append(f"Watch for overextending yourself when navigating {topic}; pacing protects clarity.")
-        if not templates:
-            templates.append("Monitor energy levels and revisit plans if external feedback signals drift.")
-        return templates
+        watchout = templates["watchout"]
+        rendered = [watchout.format(topic=topic) for topic in lead_topics]
+        return rendered or ["Monitor energy levels and revisit plans if external feedback signals drift."]
 
     def _citations(self, existing: Sequence[CitationEntry], rag_response: Any) -> List[CitationEntry]:
         if existing:
             return list(existing)
         documents = getattr(rag_response, "documents", None) or []
         citations: List[CitationEntry] = []
-        for index, doc in enumerate(documents[:2]):
-            metadata = doc.get("metadata") if isinstance(doc, dict) else getattr(doc, "metadata", {}) or {}
-            snippet = doc.get("content", "") if isinstance(doc, dict) else getattr(doc, "content", "")
-            chunk_id = metadata.get("chunk_id") or metadata.get("doc_id") or doc.get("doc_id") if isinstance(doc, dict) else getattr(doc, "source_id", f"doc-{index+1}")
+        for index, doc in enumerate(islice(documents, 2)):
+            metadata = _doc_field(doc, "metadata") or {}
+            snippet = _doc_field(doc, "content", "")
+            chunk_id = (
+                metadata.get("chunk_id")
+                or metadata.get("doc_id")
+                or _doc_field(doc, "doc_id")
+                or _doc_field(doc, "source_id")
+            )
+            # Every field is coerced here, so skip re-validating internally
+            # synthesized citations.
             citations.append(
-                CitationEntry(
+                CitationEntry.model_construct(
                     doc_id=str(chunk_id or f"doc-{index+1}"),
-                    section=int(metadata.get("section") or metadata.get("chunk_index") or index),
-                    line_start=int(metadata.get("line_start") or 0),
-                    line_end=int(metadata.get("line_end") or 0),
-                    tradition=metadata.get("tradition"),
-                    language=metadata.get("language"),
-                    source_url=metadata.get("source_url"),
-                    snippet=snippet[:200] if snippet else None,
+                    section=max(0, int(metadata.get("section") or metadata.get("chunk_index") or index)),
+                    line_start=max(0, int(metadata.get("line_start") or 0)),
+                    line_end=max(0, int(metadata.get("line_end") or 0)),
+                    tradition=_optional_str(metadata.get("tradition")),
+                    language=_optional_str(metadata.get("language")),
+                    source_url=_optional_str(metadata.get("source_url")),
+                    snippet=snippet[:_SNIPPET_MAX_CHARS] if snippet else None,
                 )
             )
         if not citations:
             citations.append(
-                CitationEntry(
+                CitationEntry.model_construct(
                     doc_id="fallback-doc",
                     section=0,
                     line_start=0,
@@ -242,14 +324,3 @@ class TemplateFallbackBuilder:
                 )
             )
         return citations
-
-    def _collective_note(self, language: str) -> str:
-        if language.startswith("tr"):
-            return (
-                "Bu yanıt otomatik güvenlik katmanı tarafından oluşturuldu. Yeni belgeler veya doğrudan sorular"
-                " ile daha derin bir yorum talep edebilirsiniz."
-            )
-        return (
-            "This answer comes from the safety fallback template. Supply additional documents or a focused prompt "
-            "to unlock a richer interpretation."
-        )
@@ -1,10 +1,14 @@
 """Orchestrates the Sprint 1 RAG + interpretation pipeline."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
-import json
+import re
+import struct
 import time
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
 import logging
 
 from fastapi import HTTPException, status
@@ -12,6 +16,7 @@ from fastapi import HTTPException, status
 from app.interpreters.core import InterpretationEngine
 from app.interpreters.output_composer import OutputMode, OutputStyle
 from app.rag.core import RAGSystem
+from app.rag.embeddings import generate_embedding
 from app.rag.planner import QueryPlanner, PlanStep
 from app.rag.retriever import build_retriever_profile, search_hybrid
 from app.rag.re_ranker import rerank as bge_rerank
@@ -31,8 +36,7 @@ from app.schemas import (
 from app.pipelines.cache import RedisSemanticCache, SemanticCache
 from app.pipelines.claim_alignment import score_claim_alignment
 from app.pipelines.sanitization import (
-    sanitize_text,
-    sanitize_sequence,
+    sanitize_sequence_async,
     apply_answer_safeguards,
 )
 from app.pipelines.degrade import DegradePolicyManager, DegradeDecision
@@ -53,6 +57,84 @@ from app.evaluation.metrics import RAGMetrics
 from app.evaluation.observability import observability
 
 
+_POSITIVE_TONE_MARKERS = frozenset(
+    {"support", "benefit", "favorable", "harmon", "opportunity", "peak"}
+)
+_NEGATIVE_TONE_MARKERS = frozenset(
+    {"challenge", "difficult", "caution", "warning", "malefic", "tension"}
+)
+_SUPPORTIVE_CUES = frozenset({"support", "benefit", "harmon", "positive", "favorable"})
+_CHALLENGING_CUES = _NEGATIVE_TONE_MARKERS
+# A zero-width lookahead reports every marker occurrence, including ones that
+# overlap, so a single pass over the text matches the old per-marker ``in`` checks.
+_TONE_MARKER_PATTERN = re.compile(
+    "(?=({}))".format(
+        "|".join(
+            re.escape(marker)
+            for marker in sorted(
+                _POSITIVE_TONE_MARKERS | _NEGATIVE_TONE_MARKERS | _SUPPORTIVE_CUES,
+                key=lambda marker: (-len(marker), marker),
+            )
+        )
+    )
+)
+
+
+def _tone_markers(text: str) -> frozenset:
+    """Return the distinct tone markers found in already lower-cased text."""
+    return frozenset(match.group(1) for match in _TONE_MARKER_PATTERN.finditer(text))
+
+
+# Timing techniques that, when named in the chart elements, must be covered by
+# a document with the matching topic. One lookahead scan reports every term
+# (overlaps included); the priority order decides when several appear.
+_TIMING_TOPIC_TERMS = {
+    "zodiacal": "zodiacal_releasing",
+    "releasing": "zodiacal_releasing",
+    "zr": "zodiacal_releasing",
+    "profection": "profection",
+    "firdaria": "firdaria",
+    "almuten": "almuten",
+}
+_TIMING_TOPIC_PATTERN = re.compile("(?=({}))".format("|".join(_TIMING_TOPIC_TERMS)))
+_TIMING_TOPIC_PRIORITY = ("zodiacal_releasing", "profection", "firdaria", "almuten")
+
+# Scores assigned to the top chart themes, in rank order.
+_THEME_SCORES = (8.0, 7.5, 7.0)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_engine(language: str, style: OutputStyle) -> InterpretationEngine:
+    """Return a shared interpretation engine for a language/style pair."""
+    return InterpretationEngine(language=language, style=style)
+
+
+# Cache fingerprints: a fixed-layout birth-coordinate header followed by
+# length-prefixed UTF-8 text fields, hashed in one blake2b call.
+_BIRTH_COORDS = struct.Struct("<?dd")
+_FIELD_LENGTH = struct.Struct("<I")
+_NO_BIRTH_COORDS = _BIRTH_COORDS.pack(False, 0.0, 0.0)
+_FINGERPRINT_PERSON = b"rag-cache"
+
+
+def _fingerprint(coords: bytes, *texts: Optional[str]) -> str:
+    """Hash packed coordinates and text fields into a 32-character hex key."""
+    chunks = [coords]
+    for text in texts:
+        encoded = (text or "").encode("utf-8")
+        chunks.append(_FIELD_LENGTH.pack(len(encoded)))
+        chunks.append(encoded)
+    return hashlib.blake2b(
+        b"".join(chunks), digest_size=16, person=_FINGERPRINT_PERSON
+    ).hexdigest()
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """Cancel an abandoned task and retrieve its outcome so errors are not logged as unhandled."""
+    task.cancel()
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+
 class RAGAnswerPipeline:
     """Runs the high level steps outlined in the README pipeline."""
 
@@ -82,6 +164,7 @@ class RAGAnswerPipeline:
         self._sparse_store = self._retriever_profile.get("sparse")
         self._quality_filter = AnswerQualityFilter()
         self._fallback_builder = TemplateFallbackBuilder()
+        self._rag_metrics = RAGMetrics()
         self._last_quality_report: Optional[AnswerQualityReport] = None
         self._quality_fallback_issues: Optional[List[str]] = None
 
@@ -90,14 +173,30 @@ class RAGAnswerPipeline:
         start_time = time.perf_counter()
         self._last_routing_outcome = None
         cache_key = self._cache_key(request)
+        cache_bucket = self._cache_bucket(request)
+        similarity = float(getattr(settings, "SEMANTIC_CACHE_SIMILARITY", 0.0) or 0.0)
+        query_vector: Optional[List[float]] = None
 
-        cached = await self._cache.get(cache_key)
+        # The cache lookup and chart preparation are independent, so run them
+        # together; a cache hit simply abandons the chart load.
+        chart_task = asyncio.create_task(self._chart_bootstrapper.load(request.birth_data))
+        try:
+            cached = await self._cache.get(cache_key)
+            if not cached and similarity > 0:
+                # Paraphrases of an earlier question for the same chart, mode and
+                # locale can reuse its answer.
+                query_vector = await asyncio.to_thread(generate_embedding, request.query)
+                similar = await self._cache.get_similar(cache_bucket, query_vector, similarity)
+                if isinstance(similar, RAGAnswerResponse):
+                    cached = similar.model_copy(update={"request": request})
+        except BaseException:
+            _discard_task(chart_task)
+            raise
         if cached:
+            _discard_task(chart_task)
             return cached
 
-        masked_request = self._mask_request_for_audit(request)
-
-        chart_result = await self._chart_bootstrapper.load(request.birth_data)
+        chart_result = await chart_task
         chart_data = chart_result.chart_data
 
         if not chart_data:
@@ -106,186 +205,216 @@ class RAGAnswerPipeline:
                 detail="Chart data could not be prepared for interpretation.",
             )
 
-        engine = InterpretationEngine(
-            language=request.locale_settings.language,
-            style=self._map_style(request.locale_settings.user_level),
+        engine = _get_engine(
+            request.locale_settings.language,
+            self._map_style(request.locale_settings.user_level),
         )
 
-        interpretation = engine.interpret_chart(
-            chart_data=chart_data,
-            mode=self._map_mode(request.mode_settings.mode),
-        )
-
-        interpretation_summary = engine.get_interpretation_summary(chart_data)
+        # Scoring and composition are CPU-bound; worker threads keep the event
+        # loop free for other requests' I/O.
+        interpretation_summary = await asyncio.to_thread(engine.get_interpretation_summary, chart_data)
         main_elements = interpretation_summary.get("main_themes", [])
+        normalized_elements = [element.lower() for element in main_elements if element]
+
+        # Full composition is only needed once retrieval is done, so it runs
+        # while the RAG queries are in flight.
+        interpretation_task = asyncio.create_task(
+            asyncio.to_thread(
+                engine.interpret_chart,
+                chart_data=chart_data,
+                mode=self._map_mode(request.mode_settings.mode),
+            )
+        )
 
         rag_context = {
             "user_level": request.locale_settings.user_level,
             "focus_areas": main_elements,
             "chart_elements": main_elements,
         }
-        degrade_state = self._degrade.evaluate()
+        degrade_state = self._degrade.evaluate(request.constraints.max_latency_ms)
         observability.metrics.set_gauge(
             "rag_degrade_active", 1.0 if degrade_state.active else 0.0
         )
         prometheus_bridge.set_degrade_active(degrade_state.active)
 
         rag_policy = degrade_state.rag_overrides if degrade_state.active else None
-        rag_response = await self._rag.query_for_interpretation(
-            main_elements, rag_context, policy=rag_policy
-        )
-
         base_query = getattr(request, "query", "") or ""
         hybrid_query = (" ".join(main_elements[:3]) or base_query or "astroloji yorum")
         policy_top_k = rag_policy.get("top_k") if rag_policy else None
         top_k_policy = max(1, int(policy_top_k or 5))
-        await self._hydrate_documents_with_hybrid(
-            hybrid_query,
-            top_k_policy,
-            rag_response,
-        )
+        try:
+            rag_response = await self._rag.query_for_interpretation(
+                main_elements, rag_context, policy=rag_policy
+            )
+            await self._hydrate_documents_with_hybrid(
+                hybrid_query,
+                top_k_policy,
+                rag_response,
+            )
+            # Snippets and document bodies are sanitized as one batch.
+            retrieved_content = list(rag_response.retrieved_content or [])
+            content_docs = [
+                doc for doc in rag_response.documents or [] if isinstance(doc, dict) and "content" in doc
+            ]
+            sanitized = await sanitize_sequence_async(
+                [*retrieved_content, *(doc["content"] for doc in content_docs)]
+            )
+        except BaseException:
+            _discard_task(interpretation_task)
+            raise
+        interpretation = await interpretation_task
 
-        rag_response.retrieved_content = sanitize_sequence(rag_response.retrieved_content or [])
-        for doc in rag_response.documents or []:
-            if isinstance(doc, dict) and "content" in doc:
-                doc["content"] = sanitize_text(doc.get("content", ""))
+        rag_response.retrieved_content = sanitized[: len(retrieved_content)]
+        for doc, content in zip(content_docs, sanitized[len(retrieved_content) :]):
+            doc["content"] = content
 
         coverage = self._evaluate_coverage(
             main_elements=main_elements,
             documents=rag_response.documents,
             mode=request.mode_settings.mode,
+            normalized_elements=normalized_elements,
         )
-        observability.metrics.record_histogram("coverage_score", coverage.get("score", 0.0))
-
-        plan_steps: List[PlanStep] = []
-        supplemental_docs: List[Dict[str, Any]] = []
-        skip_multi_hop = bool(degrade_state.flags.get("skip_multi_hop"))
-        if not coverage.get("pass", True) and not skip_multi_hop:
-            plan_steps = await self._run_multi_hop(
-                main_elements,
-                coverage,
-                chart_result.chart_data,
-                request,
-            )
-            for step in plan_steps:
-                supplemental_docs.extend(step.metadata.get("docs", []))
-            if supplemental_docs:
-                rag_response.documents.extend(supplemental_docs)
-                coverage = self._evaluate_coverage(
-                    main_elements=main_elements,
-                    documents=rag_response.documents,
-                    mode=request.mode_settings.mode,
+        histograms: Dict[str, float] = {"coverage_score": coverage.get("score", 0.0)}
+        # Flush whatever was collected even when a later stage raises; failed
+        # low-coverage/low-alignment runs are the ones these metrics exist for.
+        try:
+            plan_steps: List[PlanStep] = []
+            supplemental_docs: List[Dict[str, Any]] = []
+            skip_multi_hop = bool(degrade_state.flags.get("skip_multi_hop"))
+            if not coverage.get("pass", True) and not skip_multi_hop:
+                plan_steps = await self._run_multi_hop(
+                    main_elements,
+                    coverage,
+                    chart_result.chart_data,
+                    request,
                 )
+                for step in plan_steps:
+                    supplemental_docs.extend(step.metadata.get("docs", []))
+                if supplemental_docs:
+                    rag_response.documents.extend(supplemental_docs)
+                    coverage = self._evaluate_coverage(
+                        main_elements=main_elements,
+                        documents=rag_response.documents,
+                        mode=request.mode_settings.mode,
+                        normalized_elements=normalized_elements,
+                    )
 
-        evidence_pack = self._build_evidence_pack(
-            documents=rag_response.documents,
-            main_elements=main_elements,
-        )
+            evidence_pack = self._build_evidence_pack(
+                documents=rag_response.documents,
+                main_elements=main_elements,
+                normalized_elements=normalized_elements,
+            )
 
-        chart_context = self._build_chart_context(chart_result.context, interpretation_summary)
-        payload = await self._build_answer_payload(
-            request=request,
-            interpretation_summary=interpretation_summary,
-            interpretation=interpretation,
-            rag_response=rag_response,
-            coverage=coverage,
-            evidence_pack=evidence_pack,
-            degrade_state=degrade_state,
-        )
+            chart_context = self._build_chart_context(chart_result.context, interpretation_summary)
+            payload = await self._build_answer_payload(
+                request=request,
+                interpretation_summary=interpretation_summary,
+                interpretation=interpretation,
+                rag_response=rag_response,
+                coverage=coverage,
+                evidence_pack=evidence_pack,
+                degrade_state=degrade_state,
+            )
 
-        alignment_result = score_claim_alignment(payload, rag_response.documents)
-        alignment_score = alignment_result.get("score", 0.0)
-        payload.limits.citation_alignment = alignment_score
-        payload.limits.claims_supported_ratio = alignment_result.get("supported_ratio")
-        observability.metrics.record_histogram("citation_alignment_score", alignment_score)
-
-        citation_upgrade = False
-        if alignment_score < 0.75 or (alignment_result.get("supported_ratio") or 0.0) < 0.75:
-            citation_upgrade = True
-            degrade_state.llm_overrides["force_upgrade"] = True
-            degrade_state.flags["citation_alignment_score"] = alignment_score
-            degrade_state.flags["citation_supported_ratio"] = alignment_result.get("supported_ratio")
-
-        if payload.citations:
-            citation_map = {citation.doc_id: citation for citation in payload.citations}
-            for claim in alignment_result.get("claims", []):
-                citation_id = claim.get("citation_id")
-                span_text = claim.get("span")
-                if not citation_id or not span_text:
-                    continue
-                citation = citation_map.get(citation_id)
-                if citation:
-                    citation.span = span_text
-
-        evaluation_metrics = {}
-        if request.evaluation:
-            evaluation_metrics = self._record_benchmark_metrics(
-                request.evaluation,
-                rag_response,
-                payload,
+            alignment_result = await asyncio.to_thread(
+                score_claim_alignment, payload, rag_response.documents
             )
+            alignment_score = alignment_result.get("score", 0.0)
+            payload.limits.citation_alignment = alignment_score
+            payload.limits.claims_supported_ratio = alignment_result.get("supported_ratio")
+            histograms["citation_alignment_score"] = alignment_score
+
+            citation_upgrade = False
+            if alignment_score < 0.75 or (alignment_result.get("supported_ratio") or 0.0) < 0.75:
+                citation_upgrade = True
+                degrade_state.llm_overrides["force_upgrade"] = True
+                degrade_state.flags["citation_alignment_score"] = alignment_score
+                degrade_state.flags["citation_supported_ratio"] = alignment_result.get("supported_ratio")
+
+            if payload.citations:
+                citation_map = {citation.doc_id: citation for citation in payload.citations}
+                for claim in alignment_result.get("claims", []):
+                    citation_id = claim.get("citation_id")
+                    span_text = claim.get("span")
+                    if not citation_id or not span_text:
+                        continue
+                    citation = citation_map.get(citation_id)
+                    if citation:
+                        citation.span = span_text
+
+            evaluation_metrics = {}
+            if request.evaluation:
+                evaluation_metrics = self._record_benchmark_metrics(
+                    request.evaluation,
+                    rag_response,
+                    payload,
+                )
 
-        debug = PipelineDebugInfo(
-            intent=request.mode_settings.mode,
-            complexity=float(len(main_elements)) / 5.0 if main_elements else 0.1,
-            retrieval_stats=rag_response.retrieval_stats or {},
-            rerank_stats=rag_response.reranking_stats or {},
-            guardrail_notes=self._guardrail_notes(
-                payload,
-                coverage,
-                evidence_pack,
-                alignment_result,
-                degrade_state,
-                quality=self._last_quality_report,
-                fallback_issues=self._quality_fallback_issues,
-            ),
-            coverage=coverage,
-            evidence={"diversity": evidence_pack.get("diversity", {}), "conflict_count": len(evidence_pack.get("conflicts", []))},
-            plan=[
-                {
-                    "type": step.step_type,
-                    "topic": step.topic,
-                    "reason": step.reason,
-                    "skipped": step.metadata.get("skipped", False),
-                    "docs": [doc.get("source_id") for doc in step.metadata.get("docs", [])],
-                }
-                for step in plan_steps
-            ],
-            claim_alignment=alignment_result,
-            degrade={
-                "active": degrade_state.active,
-                "reasons": degrade_state.reasons,
-                "flags": degrade_state.flags,
-                "rag_overrides": degrade_state.rag_overrides,
-                "llm_overrides": degrade_state.llm_overrides,
-                "timeout_factor": degrade_state.timeout_factor,
-                "cost_actions": degrade_state.cost_actions,
-            },
-            evaluation_metrics=evaluation_metrics,
-        )
+            debug = PipelineDebugInfo(
+                intent=request.mode_settings.mode,
+                complexity=float(len(main_elements)) / 5.0 if main_elements else 0.1,
+                retrieval_stats=rag_response.retrieval_stats or {},
+                rerank_stats=rag_response.reranking_stats or {},
+                guardrail_notes=self._guardrail_notes(
+                    payload,
+                    coverage,
+                    evidence_pack,
+                    alignment_result,
+                    degrade_state,
+                    quality=self._last_quality_report,
+                    fallback_issues=self._quality_fallback_issues,
+                ),
+                coverage=coverage,
+                evidence={"diversity": evidence_pack.get("diversity", {}), "conflict_count": len(evidence_pack.get("conflicts", []))},
+                plan=[
+                    {
+                        "type": step.step_type,
+                        "topic": step.topic,
+                        "reason": step.reason,
+                        "skipped": step.metadata.get("skipped", False),
+                        "docs": [doc.get("source_id") for doc in step.metadata.get("docs", [])],
+                    }
+                    for step in plan_steps
+                ],
+                claim_alignment=alignment_result,
+                degrade={
+                    "active": degrade_state.active,
+                    "reasons": degrade_state.reasons,
+                    "flags": degrade_state.flags,
+                    "rag_overrides": degrade_state.rag_overrides,
+                    "llm_overrides": degrade_state.llm_overrides,
+                    "timeout_factor": degrade_state.timeout_factor,
+                    "cost_actions": degrade_state.cost_actions,
+                },
+                evaluation_metrics=evaluation_metrics,
+            )
 
-        if self._llm_orchestrator:
-            self._llm_orchestrator.enrich_debug(debug, self._last_routing_outcome)
+            if self._llm_orchestrator:
+                self._llm_orchestrator.enrich_debug(debug, self._last_routing_outcome)
 
-        response = RAGAnswerResponse(
-            request=request,
-            chart_context=chart_context,
-            payload=payload,
-            debug=debug,
-            documents=rag_response.documents,
-            evidence_pack=evidence_pack,
-        )
+            response = RAGAnswerResponse(
+                request=request,
+                chart_context=chart_context,
+                payload=payload,
+                debug=debug,
+                documents=rag_response.documents,
+                evidence_pack=evidence_pack,
+            )
 
-        cache_ttl_factor = degrade_state.flags.get("cache_ttl_factor") if degrade_state.flags else None
-        await self._cache.set(cache_key, response, ttl_factor=cache_ttl_factor)
+            cache_ttl_factor = degrade_state.flags.get("cache_ttl_factor") if degrade_state.flags else None
+            await self._cache.set(cache_key, response, ttl_factor=cache_ttl_factor)
+            if query_vector is not None:
+                await self._cache.index_vector(cache_bucket, cache_key, query_vector)
 
-        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-        prometheus_bridge.record_rag_latency(request.mode_settings.mode, elapsed_ms / 1000.0)
-        response.payload.limits.processing_time_ms = elapsed_ms
-        response.payload.limits.latency_budget_ms = request.constraints.max_latency_ms
-        observability.metrics.record_histogram("rag_latency", elapsed_ms)
+            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+            prometheus_bridge.record_rag_latency(request.mode_settings.mode, elapsed_ms / 1000.0)
+            response.payload.limits.processing_time_ms = elapsed_ms
+            response.payload.limits.latency_budget_ms = request.constraints.max_latency_ms
+            histograms["rag_latency"] = elapsed_ms
+        finally:
+            observability.metrics.record_many(histograms)
 
-        self._audit_interpretation(masked_request, response, coverage)
+        self._audit_interpretation(request, response, coverage)
 
         return response
 
@@ -296,7 +425,7 @@ class RAGAnswerPipeline:
         payload: AnswerPayload,
     ) -> dict[str, float]:
         """Record retrieval and groundedness metrics when benchmark metadata is present."""
-        rag_metrics = RAGMetrics()
+        rag_metrics = self._rag_metrics
         retrieved_ids: list[str] = []
         for doc in rag_response.documents or []:
             if isinstance(doc, dict):
@@ -306,7 +435,8 @@ class RAGAnswerPipeline:
             if doc_id:
                 retrieved_ids.append(str(doc_id))
 
-        relevant_docs = [str(doc_id) for doc_id in (evaluation.relevant_documents or [])]
+        # The metric helpers only test membership, so one set serves them all.
+        relevant_docs = frozenset(map(str, evaluation.relevant_documents or ()))
         at_k = max(1, evaluation.at_k)
         precision_at_k = rag_metrics.calculate_precision_at_k(retrieved_ids, relevant_docs, k=at_k)
         recall_at_k = rag_metrics.calculate_recall_at_k(retrieved_ids, relevant_docs, k=at_k)
@@ -319,14 +449,13 @@ class RAGAnswerPipeline:
                 k=at_k,
             )
 
-        citations_payload = []
-        for citation in payload.citations:
-            citations_payload.append(
-                {
-                    "doc_id": citation.doc_id,
-                    "credibility": 0.85 if citation.doc_id in relevant_docs else 0.65,
-                }
-            )
+        citations_payload = [
+            {
+                "doc_id": citation.doc_id,
+                "credibility": 0.85 if citation.doc_id in relevant_docs else 0.65,
+            }
+            for citation in payload.citations
+        ]
         groundedness = rag_metrics.calculate_groundedness(
             payload.answer.general_profile,
             citations_payload,
@@ -334,42 +463,26 @@ class RAGAnswerPipeline:
 
         citation_coverage = None
         if evaluation.expected_citations:
-            expected_set = {str(doc_id) for doc_id in evaluation.expected_citations}
-            actual_citations = {citation.doc_id for citation in payload.citations}
+            expected_set = frozenset(map(str, evaluation.expected_citations))
             if expected_set:
-                citation_coverage = len(expected_set & actual_citations) / len(expected_set)
+                citation_coverage = len(
+                    expected_set.intersection(citation.doc_id for citation in payload.citations)
+                ) / len(expected_set)
 
         tags = {
             "benchmark": evaluation.benchmark_id,
             "case": evaluation.case_id,
         }
-        observability.metrics.record_histogram(
-            "benchmark_recall_at_k",
-            recall_at_k,
-            tags=tags,
-        )
-        observability.metrics.record_histogram(
-            "benchmark_precision_at_k",
-            precision_at_k,
-            tags=tags,
-        )
-        observability.metrics.record_histogram(
-            "benchmark_groundedness",
-            groundedness,
-            tags=tags,
-        )
+        histograms = {
+            "benchmark_recall_at_k": recall_at_k,
+            "benchmark_precision_at_k": precision_at_k,
+            "benchmark_groundedness": groundedness,
+        }
         if ndcg:
-            observability.metrics.record_histogram(
-                "benchmark_ndcg",
-                ndcg,
-                tags=tags,
-            )
+            histograms["benchmark_ndcg"] = ndcg
         if citation_coverage is not None:
-            observability.metrics.record_histogram(
-                "benchmark_citation_coverage",
-                citation_coverage,
-                tags=tags,
-            )
+            histograms["benchmark_citation_coverage"] = citation_coverage
+        observability.metrics.record_many(histograms, tags=tags)
 
         return {
             "at_k": at_k,
@@ -384,17 +497,14 @@ class RAGAnswerPipeline:
         self, base_context: ChartContext, summary: dict[str, Any]
     ) -> ChartContext:
         """Augment the base chart context with scored themes from interpretation summary."""
-        context = base_context.model_copy(deep=True)
+        scoring_summary = summary.get("scoring_summary") or {}
         themes = [
-            ScoredTheme(
-                theme=theme,
-                score=round(8.0 - idx * 0.5, 2),
-                evidence=summary.get("scoring_summary", {}).get(theme, []),
-            )
-            for idx, theme in enumerate(summary.get("main_themes", [])[:3])
+            ScoredTheme(theme=theme, score=score, evidence=scoring_summary.get(theme, []))
+            for score, theme in zip(_THEME_SCORES, summary.get("main_themes") or ())
         ]
-        context.scored_themes = themes
-        return context
+        # Shallow copy: the remaining fields are shared with the bootstrapper's
+        # context and are never mutated downstream.
+        return base_context.model_copy(update={"scored_themes": themes})
 
     async def _build_answer_payload(
         self,
@@ -425,18 +535,18 @@ class RAGAnswerPipeline:
             except (TypeError, ValueError):
                 return default
 
-        doc_meta_map: Dict[str, Dict[str, Any]] = {}
-        doc_content_map: Dict[str, str] = {}
+        # Each document is indexed by its primary id and its source id; the
+        # snippet is cut once here rather than on every citation lookup.
+        doc_index: Dict[str, Tuple[Dict[str, Any], str]] = {}
         for doc in rag_response.documents or []:
             metadata = doc.get("metadata") or {}
+            entry = (metadata, (doc.get("content") or "")[:200])
             primary_id = metadata.get("chunk_id") or metadata.get("doc_id") or doc.get("source_id")
             if primary_id:
-                doc_meta_map[primary_id] = metadata
-                doc_content_map[primary_id] = doc.get("content", "")
+                doc_index[primary_id] = entry
             source_id = doc.get("source_id")
-            if source_id and source_id not in doc_meta_map:
-                doc_meta_map[source_id] = metadata
-                doc_content_map[source_id] = doc.get("content", "")
+            if source_id and source_id not in doc_index:
+                doc_index[source_id] = entry
 
         raw_citations = list(rag_response.citations or [])
         citations: List[CitationEntry] = []
@@ -444,8 +554,8 @@ class RAGAnswerPipeline:
         if raw_citations:
             for index, cite in enumerate(raw_citations):
                 source_id = getattr(cite, "source_id", None) or getattr(cite, "id", None)
-                metadata = doc_meta_map.get(source_id, {})
-                snippet = getattr(cite, "content_snippet", None) or doc_content_map.get(source_id, "")[:200]
+                metadata, doc_snippet = doc_index.get(source_id, ({}, ""))
+                snippet = getattr(cite, "content_snippet", None) or doc_snippet
                 citations.append(
                     CitationEntry(
                         doc_id=source_id or f"doc-{index+1}",
@@ -458,24 +568,21 @@ class RAGAnswerPipeline:
                         snippet=snippet,
                     )
                 )
-        elif doc_meta_map:
-            # Fallback: synthesize citations from available documents
-            for index, (doc_id, metadata) in enumerate(doc_meta_map.items()):
-                content = doc_content_map.get(doc_id, "")
-                citations.append(
-                    CitationEntry(
-                        doc_id=doc_id or f"doc-{index+1}",
-                        section=_safe_int(metadata.get("section"), index),
-                        line_start=_safe_int(metadata.get("line_start"), 0),
-                        line_end=_safe_int(metadata.get("line_end"), 0),
-                        tradition=metadata.get("tradition"),
-                        language=metadata.get("language"),
-                        source_url=metadata.get("source_url"),
-                        snippet=(content or "")[:200],
-                    )
+        elif doc_index:
+            # Fallback: cite the first available document
+            doc_id, (metadata, doc_snippet) = next(iter(doc_index.items()))
+            citations.append(
+                CitationEntry(
+                    doc_id=doc_id,
+                    section=_safe_int(metadata.get("section"), 0),
+                    line_start=_safe_int(metadata.get("line_start"), 0),
+                    line_end=_safe_int(metadata.get("line_end"), 0),
+                    tradition=metadata.get("tradition"),
+                    language=metadata.get("language"),
+                    source_url=metadata.get("source_url"),
+                    snippet=doc_snippet,
                 )
-                if len(citations) >= 1:
-                    break
+            )
 
         if not citations:
             raise HTTPException(
@@ -518,9 +625,7 @@ class RAGAnswerPipeline:
                 detail=str(exc),
             ) from exc
 
-        allow_llm_revision = True
-        if degrade_state.active and degrade_state.llm_overrides.get("skip_revision"):
-            allow_llm_revision = False
+        allow_llm_revision = not degrade_state.llm_overrides.get("skip_revision")
 
         if self._llm_orchestrator and allow_llm_revision:
             llm_revision = await self._maybe_generate_llm_revision(
@@ -575,25 +680,39 @@ class RAGAnswerPipeline:
 
     def _cache_key(self, request: RAGAnswerRequest) -> str:
         """Generate a deterministic cache key from query text and birth fingerprint."""
-        birth_fingerprint = {
-            "date": request.birth_data.date if request.birth_data else "no-date",
-            "time": request.birth_data.time if request.birth_data else "no-time",
-            "lat": request.birth_data.lat if request.birth_data else "no-lat",
-            "lng": request.birth_data.lng if request.birth_data else "no-lng",
-        }
-        fingerprint = json.dumps(
-            {
-                "query": request.query,
-                "mode": request.mode_settings.mode,
-                "locale": request.locale_settings.locale,
-                "birth": birth_fingerprint,
-            },
-            sort_keys=True,
-        ).encode("utf-8")
-        return hashlib.sha256(fingerprint).hexdigest()
+        coords, date, birth_time = self._birth_fingerprint(request)
+        return _fingerprint(
+            coords,
+            request.query,
+            request.mode_settings.mode,
+            request.locale_settings.locale,
+            date,
+            birth_time,
+        )
+
+    def _cache_bucket(self, request: RAGAnswerRequest) -> str:
+        """Scope similarity lookups to one chart, mode and locale so answers never cross users."""
+        coords, date, birth_time = self._birth_fingerprint(request)
+        return _fingerprint(
+            coords,
+            request.mode_settings.mode,
+            request.locale_settings.locale,
+            date,
+            birth_time,
+        )
+
+    @staticmethod
+    def _birth_fingerprint(request: RAGAnswerRequest) -> Tuple[bytes, Optional[str], Optional[str]]:
+        birth = request.birth_data
+        if birth is None:
+            return _NO_BIRTH_COORDS, None, None
+        return _BIRTH_COORDS.pack(True, birth.lat, birth.lng), birth.date, birth.time
 
     def _build_evidence_pack(
-        self, documents: List[dict], main_elements: List[str]
+        self,
+        documents: List[dict],
+        main_elements: List[str],
+        normalized_elements: Optional[List[str]] = None,
     ) -> dict:
         """Summarize retrieved documents into diversity and conflict diagnostics."""
         if not documents:
@@ -608,8 +727,15 @@ class RAGAnswerPipeline:
                 "conflicts": [],
             }
 
+        if normalized_elements is None:
+            normalized_elements = [elt.lower() for elt in main_elements if elt]
+
         processed_docs: List[dict] = []
-        topics_map: Dict[str, List[dict]] = {}
+        # Per-topic documents, non-neutral tones and keyword cues are gathered
+        # while documents are processed so conflict checks need no rescans.
+        topics_map: DefaultDict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"docs": [], "tones": set(), "supportive": False, "challenging": False}
+        )
         schools = set()
         languages = set()
 
@@ -621,6 +747,7 @@ class RAGAnswerPipeline:
             content = doc.get("content", "")
             snippet = content[:200].strip()
             tone = self._classify_tone(content, metadata)
+            cues = _tone_markers(snippet.lower())
 
             schools.add(school)
             languages.add(language)
@@ -635,50 +762,39 @@ class RAGAnswerPipeline:
                 "snippet": snippet,
             }
             processed_docs.append(info)
-            topics_map.setdefault(topic, []).append(info)
+            entry = topics_map[topic]
+            entry["docs"].append(info)
+            if tone != "neutral":
+                entry["tones"].add(tone)
+            entry["supportive"] = entry["supportive"] or not cues.isdisjoint(_SUPPORTIVE_CUES)
+            entry["challenging"] = entry["challenging"] or not cues.isdisjoint(_CHALLENGING_CUES)
 
         conflicts: List[dict] = []
-        supportive_keywords = {"support", "benefit", "harmon", "positive", "favorable"}
-        challenging_keywords = {"challenge", "difficult", "malefic", "caution", "warning", "tension"}
-
-        for topic, docs in topics_map.items():
+        for topic, entry in topics_map.items():
             if topic == "unknown":
                 continue
-            tone_set = {doc["tone"] for doc in docs if doc["tone"] != "neutral"}
+            tone_set = entry["tones"]
             if len(tone_set) > 1:
-                conflicts.append(
-                    {
-                        "topic": topic,
-                        "summary": f"mixed tones detected ({', '.join(sorted(tone_set))})",
-                        "documents": [doc["source_id"] for doc in docs],
-                    }
-                )
-            else:
+                summary = f"mixed tones detected ({', '.join(sorted(tone_set))})"
+            elif not tone_set and entry["supportive"] and entry["challenging"]:
                 # fallback keyword check if tone neutral
-                if "neutral" in tone_set or not tone_set:
-                    has_supportive = any(
-                        any(word in doc["snippet"].lower() for word in supportive_keywords)
-                        for doc in docs
-                    )
-                    has_challenging = any(
-                        any(word in doc["snippet"].lower() for word in challenging_keywords)
-                        for doc in docs
-                    )
-                    if has_supportive and has_challenging:
-                        conflicts.append(
-                            {
-                                "topic": topic,
-                                "summary": "supportive and challenging cues appear together",
-                                "documents": [doc["source_id"] for doc in docs],
-                            }
-                        )
+                summary = "supportive and challenging cues appear together"
+            else:
+                continue
+            conflicts.append(
+                {
+                    "topic": topic,
+                    "summary": summary,
+                    "documents": [doc["source_id"] for doc in entry["docs"]],
+                }
+            )
 
         diversity = {
             "total": len(processed_docs),
             "unique_topics": len(topics_map),
             "unique_schools": len(schools),
             "unique_languages": len(languages),
-            "elements_covered": len({elt.lower() for elt in main_elements if elt}),
+            "elements_covered": len(set(normalized_elements)),
         }
 
         return {
@@ -711,16 +827,9 @@ class RAGAnswerPipeline:
         """Heuristically label a document snippet as supportive, challenging, or neutral."""
         if not content:
             return "neutral"
-        text = content.lower()
-        positive_markers = [
-            "support", "benefit", "favorable", "harmon", "opportunity", "peak"
-        ]
-        negative_markers = [
-            "challenge", "difficult", "caution", "warning", "malefic", "tension"
-        ]
-
-        positive_hits = sum(marker in text for marker in positive_markers)
-        negative_hits = sum(marker in text for marker in negative_markers)
+        markers = _tone_markers(content.lower())
+        positive_hits = len(markers & _POSITIVE_TONE_MARKERS)
+        negative_hits = len(markers & _NEGATIVE_TONE_MARKERS)
 
         if positive_hits > negative_hits and positive_hits > 0:
             return "supportive"
@@ -729,7 +838,11 @@ class RAGAnswerPipeline:
         return metadata.get("tone") or "neutral"
 
     def _evaluate_coverage(
-        self, main_elements: List[str], documents: List[dict], mode: str
+        self,
+        main_elements: List[str],
+        documents: List[dict],
+        mode: str,
+        normalized_elements: Optional[List[str]] = None,
     ) -> dict:
         """Score how well retrieved documents cover the requested chart elements."""
         if not documents:
@@ -741,50 +854,48 @@ class RAGAnswerPipeline:
                 "topics": [],
             }
 
-        normalized_elements = [element.lower() for element in main_elements if element]
+        if normalized_elements is None:
+            normalized_elements = [element.lower() for element in main_elements if element]
         if not normalized_elements:
             coverage_score = 1.0
-            normalized_elements = []
         else:
-            match_count = 0
-            for element in normalized_elements:
-                if any(element in (doc.get("content", "").lower()) for doc in documents):
-                    match_count += 1
+            # Lower-case each document once rather than once per element.
+            contents = [doc.get("content", "").lower() for doc in documents]
+            match_count = sum(
+                1
+                for element in normalized_elements
+                if any(element in content for content in contents)
+            )
             base = max(len(normalized_elements), 1)
             coverage_score = min(1.0, match_count / base)
 
 
-        schools = {
-            (doc.get("metadata", {}) or {}).get("school")
-            for doc in documents
-            if doc.get("metadata")
-        }
-        topics = {
-            (doc.get("metadata", {}) or {}).get("topic")
-            for doc in documents
-            if doc.get("metadata")
-        }
-        schools.discard(None)
-        topics.discard(None)
-
+        schools = set()
+        topics = set()
+        for doc in documents:
+            metadata = doc.get("metadata")
+            if not metadata:
+                continue
+            school = metadata.get("school")
+            if school is not None:
+                schools.add(school)
+            topic = metadata.get("topic")
+            if topic is not None:
+                topics.add(topic)
+
+        lowered_schools = [school.lower() for school in schools if school]
         has_traditional = any(
-            school and ("traditional" in school.lower() or "classical" in school.lower())
-            for school in schools
-        )
-        has_modern = any(
-            school and "modern" in school.lower() for school in schools
+            "traditional" in school or "classical" in school for school in lowered_schools
         )
+        has_modern = any("modern" in school for school in lowered_schools)
 
-        required_topic = None
-        element_text = " ".join(normalized_elements)
-        if "zodiacal" in element_text or "releasing" in element_text or "zr" in element_text:
-            required_topic = "zodiacal_releasing"
-        elif "profection" in element_text:
-            required_topic = "profection"
-        elif "firdaria" in element_text:
-            required_topic = "firdaria"
-        elif "almuten" in element_text:
-            required_topic = "almuten"
+        found_topics = {
+            _TIMING_TOPIC_TERMS[term]
+            for term in _TIMING_TOPIC_PATTERN.findall(" ".join(normalized_elements))
+        }
+        required_topic = next(
+            (topic for topic in _TIMING_TOPIC_PRIORITY if topic in found_topics), None
+        )
 
         issues: List[str] = []
         if coverage_score < 0.7:
@@ -810,13 +921,16 @@ class RAGAnswerPipeline:
 
     def _audit_interpretation(
         self,
-        masked_request: Dict[str, Any],
+        request: RAGAnswerRequest,
         response: RAGAnswerResponse,
         coverage: Dict[str, Any],
     ) -> None:
         """Emit a structured audit log for monitoring interpretation quality."""
+        # Masking only happens when the audit record will actually be emitted.
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         record = {
-            "request": masked_request,
+            "request": self._mask_request_for_audit(request),
             "coverage": coverage,
             "confidence": response.payload.confidence,
             "coverage_score": response.payload.limits.coverage_score,
@@ -875,14 +989,19 @@ class RAGAnswerPipeline:
 
         limited = reranked[: max(1, top_k)]
         documents: List[Dict[str, Any]] = []
+        retrieved_content: List[str] = []
+        score_total = 0.0
         for res in limited:
             metadata = dict(res.metadata or {})
             metadata.setdefault("doc_id", metadata.get("doc_id") or res.source_id)
             metadata.setdefault("chunk_id", metadata.get("chunk_id") or res.source_id)
+            score = float(res.score)
+            score_total += score
+            retrieved_content.append(res.content)
             documents.append(
                 {
                     "content": res.content,
-                    "score": float(res.score),
+                    "score": score,
                     "source_id": res.source_id,
                     "doc_id": metadata.get("doc_id"),
                     "metadata": metadata,
@@ -891,7 +1010,7 @@ class RAGAnswerPipeline:
             )
 
         rag_response.documents = documents
-        rag_response.retrieved_content = [doc["content"] for doc in documents]
+        rag_response.retrieved_content = retrieved_content
 
         try:
             rag_response.citations = self._rag.citation_manager.create_citations(limited)
@@ -903,9 +1022,7 @@ class RAGAnswerPipeline:
             "total_retrieved": len(results),
             "final_count": len(documents),
             "retrieval_method": "hybrid",
-            "average_score": sum(doc["score"] for doc in documents) / len(documents)
-            if documents
-            else 0.0,
+            "average_score": score_total / len(documents) if documents else 0.0,
         }
 
     async def _run_multi_hop(
@@ -1192,6 +1309,7 @@ class RAGAnswerPipeline:
             return RedisSemanticCache(
                 redis_url=settings.redis_url,
                 ttl_seconds=getattr(settings, "SEMANTIC_CACHE_TTL", 604800),
+                model_type=RAGAnswerResponse,
             )
         except Exception:
             return SemanticCache()
@@ -1,27 +1,55 @@
 """Utilities for sanitizing retrieval content before LLM consumption."""
 from __future__ import annotations
 
+import asyncio
 import re
 from typing import Iterable
 
 from app.schemas.interpretation import AnswerBody
 
-_SCRIPT_RE = re.compile(r"<script.*?>.*?</script>", re.IGNORECASE | re.DOTALL)
-_STYLE_RE = re.compile(r"<style.*?>.*?</style>", re.IGNORECASE | re.DOTALL)
+# Script and style blocks are located with literal searches rather than a
+# lazy ``<script.*?>.*?</script>`` pattern, whose backtracking turns cubic on
+# unterminated tags. Matching is unchanged: script blocks are stripped before
+# style blocks, and an opening runs to its first ``>`` and then to the first
+# matching closing tag.
+_BLOCK_TAGS = (
+    (re.compile(r"<script", re.IGNORECASE), re.compile(r"</script>", re.IGNORECASE)),
+    (re.compile(r"<style", re.IGNORECASE), re.compile(r"</style>", re.IGNORECASE)),
+)
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
 _EXTERNAL_LINK_RE = re.compile(r"https?://\S+", re.IGNORECASE)
 
+# Batches smaller than this are sanitized inline; a worker-thread hop costs
+# more than scanning a few short snippets.
+_ASYNC_MIN_CHARS = 4096
+
+_ID_LABEL_PATTERN = re.compile(r"(?i)T\.?C\.?\s*Kimlik\s*No?")
 _PII_PATTERNS = [
     re.compile(r"\b\d{11}\b"),  # Turkish national ID length
-    re.compile(r"(?i)T\.?C\.?\s*Kimlik\s*No?"),
+    _ID_LABEL_PATTERN,
     re.compile(r"\b\d{4}-\d{2}-\d{2}\b"),
     re.compile(r"\b\d{2}:\d{2}(?::\d{2})?\b"),
     re.compile(r"(?i)lat(itude)?[:\s]*[-+]?\d+\.\d+"),
     re.compile(r"(?i)lon(gitude)?[:\s]*[-+]?\d+\.\d+"),
 ]
 
-_SENSITIVE_PATTERN = re.compile(
-    r"(?i)(sağlık|hastalık|tedavi|ilaç|finans|para kazan|borsa|yatırım|diagnos|medical)"
+# Every PII pattern except the ID label needs a digit to match.
+_DIGIT_RE = re.compile(r"\d")
+
+# Sensitive topics are plain substring checks on case-folded text, which is
+# far cheaper than a case-insensitive regex alternation. ``_fold_case`` maps
+# exactly the characters ``re.IGNORECASE`` treats as equal to these letters.
+_SENSITIVE_TERMS = (
+    "sağlik",
+    "hastalik",
+    "tedavi",
+    "ilaç",
+    "finans",
+    "para kazan",
+    "borsa",
+    "yatirim",
+    "diagnos",
+    "medical",
 )
 _ETHICS_NOTICE = (
     "**Uyarı:** Bu yorumlar eğlence ve kişisel farkındalık amaçlıdır; "
@@ -33,12 +61,50 @@ def sanitize_text(text: str) -> str:
     """Remove executable HTML/JS and neutralize external links."""
     if not text:
         return text
-    cleaned = _SCRIPT_RE.sub("", text)
-    cleaned = _STYLE_RE.sub("", cleaned)
-    cleaned = _HTML_TAG_RE.sub(" ", cleaned)
-    cleaned = _EXTERNAL_LINK_RE.sub("[external-link]", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return cleaned
+    cleaned = text
+    if "<" in cleaned:
+        cleaned = _strip_script_style(cleaned)
+        # Tags end at a ``>``; leaving the tail after the last one out of the
+        # substitution stops stray ``<`` characters from rescanning it.
+        tags_end = cleaned.rfind(">") + 1
+        if tags_end:
+            cleaned = _HTML_TAG_RE.sub(" ", cleaned[:tags_end]) + cleaned[tags_end:]
+    if "://" in cleaned:
+        cleaned = _EXTERNAL_LINK_RE.sub("[external-link]", cleaned)
+    # str.split() treats the same characters as whitespace as ``\s`` does.
+    return " ".join(cleaned.split())
+
+
+def _strip_script_style(text: str) -> str:
+    """Drop script elements, then style elements, from the text."""
+    for open_re, close_re in _BLOCK_TAGS:
+        text = _strip_block(text, open_re, close_re)
+    return text
+
+
+def _strip_block(text: str, open_re: re.Pattern[str], close_re: re.Pattern[str]) -> str:
+    """Drop one kind of element in a single left-to-right scan."""
+    pieces: list[str] = []
+    kept_from = 0
+    search_from = 0
+    while True:
+        opening = open_re.search(text, search_from)
+        if opening is None:
+            break
+        tag_end = text.find(">", opening.end())
+        if tag_end == -1:
+            break
+        closing = close_re.search(text, tag_end + 1)
+        # Without a closing tag after this opening, no later opening can
+        # close either.
+        if closing is None:
+            break
+        pieces.append(text[kept_from : opening.start()])
+        kept_from = search_from = closing.end()
+    if not pieces:
+        return text
+    pieces.append(text[kept_from:])
+    return "".join(pieces)
 
 
 def sanitize_sequence(texts: Iterable[str]) -> list[str]:
@@ -46,10 +112,32 @@ def sanitize_sequence(texts: Iterable[str]) -> list[str]:
     return [sanitize_text(item) for item in texts]
 
 
+async def sanitize_sequence_async(texts: Iterable[str]) -> list[str]:
+    """Sanitize a batch off the event loop when it is large enough to matter."""
+    items = list(texts)
+    if sum(len(item) for item in items if item) < _ASYNC_MIN_CHARS:
+        return sanitize_sequence(items)
+    return await asyncio.to_thread(sanitize_sequence, items)
+
+
+def _fold_case(text: str) -> str:
+    """Lowercase text, folding dotted/dotless i and long s like ``re.IGNORECASE``."""
+    return text.replace("İ", "i").lower().replace("ı", "i").replace("ſ", "s")
+
+
+def _contains_sensitive_topic(text: str) -> bool:
+    folded = _fold_case(text)
+    return any(term in folded for term in _SENSITIVE_TERMS)
+
+
 def mask_pii(text: str) -> str:
     """Redact high-sensitivity tokens from output text."""
     if not text:
         return text
+    if _DIGIT_RE.search(text) is None:
+        if "kimlik" not in _fold_case(text):
+            return text
+        return _ID_LABEL_PATTERN.sub("***", text)
     masked = text
     for pattern in _PII_PATTERNS:
         masked = pattern.sub("***", masked)
@@ -61,7 +149,7 @@ def apply_ethics_notice(text: str) -> str:
     if not text:
         return text
     masked = mask_pii(text)
-    if _SENSITIVE_PATTERN.search(masked) and _ETHICS_NOTICE not in masked:
+    if _contains_sensitive_topic(masked) and _ETHICS_NOTICE not in masked:
         masked = masked.rstrip() + "\n\n" + _ETHICS_NOTICE
     return masked
 
@@ -4,11 +4,13 @@ Re-ranking system for retrieved documents
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, replace
 from enum import Enum
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 import logging
 import math
 import os
 import re
+import threading
 
 from .retriever import RetrievalResult
 
@@ -24,7 +26,10 @@ else:
     _BGE_INIT_ERROR = None
     _BGE_MODEL_NAME = os.getenv("RERANKER_MODEL", "BAAI/bge-reranker-large")
     try:
-        _BGE_RERANKER = FlagReranker(_BGE_MODEL_NAME, use_fp16=True)
+        _BGE_RERANKER = FlagReranker(
+            _BGE_MODEL_NAME,
+            use_fp16=os.getenv("RERANKER_USE_FP16", "true").lower() not in {"0", "false", "no"},
+        )
     except Exception as exc:  # pragma: no cover - init failure
         logger.warning("FlagReranker initialisation failed: %s", exc)
         _BGE_RERANKER = None
@@ -33,10 +38,24 @@ try:
     _RERANK_TIMEOUT_SEC = float(os.getenv("RERANKER_TIMEOUT_MS", "500")) / 1000.0
 except ValueError:
     _RERANK_TIMEOUT_SEC = 0.5
+try:
+    _RERANK_MAX_LENGTH = int(os.getenv("RERANKER_MAX_LENGTH", "512"))
+except ValueError:
+    _RERANK_MAX_LENGTH = 512
 _RERANK_EXECUTOR: Optional[ThreadPoolExecutor] = None
 if _BGE_RERANKER is not None:
     _RERANK_EXECUTOR = ThreadPoolExecutor(max_workers=1)
 
+try:
+    _RERANK_CACHE_SIZE = int(os.getenv("RERANKER_CACHE_SIZE", "2048"))
+except ValueError:
+    _RERANK_CACHE_SIZE = 2048
+# Cross-encoder scores depend only on the (query, passage) pair, so repeated
+# or overlapping candidate sets reuse earlier scores instead of re-running
+# the model. Guarded by a lock because rerank may run on worker threads.
+_RERANK_SCORE_CACHE: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+_RERANK_CACHE_LOCK = threading.Lock()
+
 class RerankingMethod(Enum):
     """Re-ranking methods"""
     CROSS_ENCODER = "cross_encoder"
@@ -457,15 +476,45 @@ def rerank(query: str, documents: List[RetrievalResult]) -> List[RetrievalResult
         return documents
 
     pairs = [(query, doc.content) for doc in documents]
+    cached = _cached_scores(pairs)
+    missing = [pair for pair, score in zip(pairs, cached) if score is None]
+    if missing:
+        fresh = _compute_scores(missing)
+        if fresh is None:
+            return documents
+        _store_scores(missing, fresh)
+        fresh_iter = iter(fresh)
+        scores = [next(fresh_iter) if score is None else score for score in cached]
+    else:
+        scores = cached
+
+    updated: List[RetrievalResult] = []
+    for doc, score in zip(documents, scores):
+        updated_doc = replace(doc, score=float(score))
+        updated.append(updated_doc)
+
+    updated.sort(key=lambda x: x.score, reverse=True)
+    return updated
+
+
+def _compute_scores(pairs: List[Tuple[str, str]]) -> Optional[List[float]]:
+    """Score pairs with the BGE model, or return None on failure or timeout."""
     executor = _RERANK_EXECUTOR
     if executor is None:
         try:
-            scores = _BGE_RERANKER.compute_score(pairs)
+            scores = _BGE_RERANKER.compute_score(
+                pairs, batch_size=len(pairs), max_length=_RERANK_MAX_LENGTH
+            )
         except Exception as exc:  # pragma: no cover - external failure
             logger.warning("BGE reranker scoring failed: %s", exc)
-            return documents
+            return None
     else:
-        future = executor.submit(_BGE_RERANKER.compute_score, pairs)
+        future = executor.submit(
+            _BGE_RERANKER.compute_score,
+            pairs,
+            batch_size=len(pairs),
+            max_length=_RERANK_MAX_LENGTH,
+        )
         try:
             scores = future.result(timeout=_RERANK_TIMEOUT_SEC)
         except FuturesTimeoutError:
@@ -473,15 +522,35 @@ def rerank(query: str, documents: List[RetrievalResult]) -> List[RetrievalResult
                 "BGE reranker timed out after %.0f ms; returning dense/sparse order",
                 _RERANK_TIMEOUT_SEC * 1000.0,
             )
-            return documents
+            return None
         except Exception as exc:  # pragma: no cover - external failure
             logger.warning("BGE reranker scoring failed: %s", exc)
-            return documents
+            return None
+    # FlagReranker returns a bare float for a single pair.
+    if not isinstance(scores, (list, tuple)):
+        scores = [scores]
+    return [float(score) for score in scores]
 
-    updated: List[RetrievalResult] = []
-    for doc, score in zip(documents, scores):
-        updated_doc = replace(doc, score=float(score))
-        updated.append(updated_doc)
 
-    updated.sort(key=lambda x: x.score, reverse=True)
-    return updated
+def _cached_scores(pairs: List[Tuple[str, str]]) -> List[Optional[float]]:
+    if _RERANK_CACHE_SIZE <= 0:
+        return [None] * len(pairs)
+    with _RERANK_CACHE_LOCK:
+        scores = []
+        for pair in pairs:
+            score = _RERANK_SCORE_CACHE.get(pair)
+            if score is not None:
+                _RERANK_SCORE_CACHE.move_to_end(pair)
+            scores.append(score)
+        return scores
+
+
+def _store_scores(pairs: List[Tuple[str, str]], scores: List[float]) -> None:
+    if _RERANK_CACHE_SIZE <= 0:
+        return
+    with _RERANK_CACHE_LOCK:
+        for pair, score in zip(pairs, scores):
+            _RERANK_SCORE_CACHE[pair] = score
+            _RERANK_SCORE_CACHE.move_to_end(pair)
+        while len(_RERANK_SCORE_CACHE) > _RERANK_CACHE_SIZE:
+            _RERANK_SCORE_CACHE.popitem(last=False)
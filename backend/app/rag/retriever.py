@@ -4,7 +4,9 @@ Hybrid retrieval system (Dense + BM25) for astrological knowledge
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, replace
 from enum import Enum
+from operator import itemgetter
 import asyncio
+import heapq
 import math
 from abc import ABC, abstractmethod
 import os
@@ -949,6 +951,67 @@ def build_retriever_profile() -> Dict[str, Optional[Any]]:
     return {"dense": dense_store, "sparse": sparse_store}
 
 
+async def _search_dense_leg(
+    dense_store: Optional[VectorStore],
+    query: str,
+    top_k: int,
+    filters: Dict[str, Any],
+) -> List[RetrievalResult]:
+    if not dense_store:
+        return []
+    # Stay on the async path: the sync search_dense helpers re-embed and
+    # refuse to run inside an event loop.
+    try:
+        query_vector = await asyncio.to_thread(generate_embedding, query)
+        return await dense_store.search(query_vector, top_k=top_k, filters=filters)
+    except Exception as exc:  # pragma: no cover - external dependency failure
+        logger.warning("Dense retrieval failed", extra={"error": str(exc)})
+        return []
+
+
+async def _search_sparse_leg(
+    sparse_store: Optional[SparseStore],
+    query: str,
+    top_k: int,
+    filters: Dict[str, Any],
+) -> List[RetrievalResult]:
+    if not sparse_store:
+        return []
+    try:
+        return await sparse_store.search(query, top_k=top_k, filters=filters)
+    except Exception as exc:  # pragma: no cover - external dependency failure
+        logger.warning("Sparse retrieval failed", extra={"error": str(exc)})
+        return []
+
+
+def _rrf_fuse(
+    dense_results: List[RetrievalResult],
+    sparse_results: List[RetrievalResult],
+    top_k: int,
+) -> List[RetrievalResult]:
+    """Fuse two ranked lists with reciprocal rank fusion: sum of 1 / (k + rank)."""
+    rrf_k = max(1, int(getattr(settings, "HYBRID_RRF_K", 60)))
+    scores: Dict[str, float] = {}
+    base_results: Dict[str, RetrievalResult] = {}
+    for results in (dense_results, sparse_results):
+        ranked = sorted(results, key=lambda x: x.score, reverse=True)
+        for rank, res in enumerate(ranked, start=1):
+            scores[res.source_id] = scores.get(res.source_id, 0.0) + 1.0 / (rrf_k + rank)
+            base_results.setdefault(res.source_id, res)
+
+    # Only the winners are materialised; nlargest keeps the stable tie order
+    # of a full sort at O(N log k).
+    combined: List[RetrievalResult] = []
+    for doc_id, score in heapq.nlargest(top_k, scores.items(), key=itemgetter(1)):
+        updated = replace(base_results[doc_id], score=score, method=RetrievalMethod.HYBRID)
+        metadata = dict(updated.metadata or {})
+        metadata.setdefault("doc_id", metadata.get("doc_id") or updated.source_id)
+        metadata.setdefault("hybrid_fusion", "rrf")
+        updated.metadata = metadata
+        combined.append(updated)
+    return combined
+
+
 async def search_hybrid(
     query: str,
     top_k: int,
@@ -957,8 +1020,14 @@ async def search_hybrid(
     *,
     alpha: Optional[float] = None,
     filters: Optional[Dict[str, Any]] = None,
+    fusion: Optional[str] = None,
 ) -> List[RetrievalResult]:
-    """Retrieve documents using dense/sparse stores and blend their scores."""
+    """Retrieve documents using dense/sparse stores and blend their scores.
+
+    ``fusion`` selects between the alpha-weighted blend of min-max normalised
+    scores ("weighted") and reciprocal rank fusion ("rrf"); it defaults to
+    ``settings.HYBRID_FUSION``.
+    """
 
     filters = filters or {}
     default_alpha = getattr(settings, "HYBRID_ALPHA", 0.6)
@@ -975,26 +1044,11 @@ async def search_hybrid(
             mixed_alpha = pick_alpha(query)
     mixed_alpha = max(0.0, min(1.0, mixed_alpha))
 
-    dense_results: List[RetrievalResult] = []
-    if dense_store:
-        try:
-            dense_results = dense_store.search_dense(query, top_k=top_k, filters=filters)
-        except RuntimeError:
-            query_vector = generate_embedding(query)
-            dense_results = await dense_store.search(query_vector, top_k=top_k, filters=filters)
-        except Exception as exc:  # pragma: no cover - external dependency failure
-            logger.warning("Dense retrieval failed", extra={"error": str(exc)})
-            dense_results = []
-
-    sparse_results: List[RetrievalResult] = []
-    if sparse_store:
-        try:
-            sparse_results = sparse_store.search_sparse(query, top_k=top_k, filters=filters)
-        except RuntimeError:
-            sparse_results = await sparse_store.search(query, top_k=top_k, filters=filters)
-        except Exception as exc:  # pragma: no cover - external dependency failure
-            logger.warning("Sparse retrieval failed", extra={"error": str(exc)})
-            sparse_results = []
+    # The two legs hit independent backends, so their round-trips overlap.
+    dense_results, sparse_results = await asyncio.gather(
+        _search_dense_leg(dense_store, query, top_k, filters),
+        _search_sparse_leg(sparse_store, query, top_k, filters),
+    )
 
     if not dense_results and not sparse_results:
         return []
@@ -1004,6 +1058,9 @@ async def search_hybrid(
     if not dense_results:
         return sorted(sparse_results, key=lambda x: x.score, reverse=True)[:top_k]
 
+    if (fusion or getattr(settings, "HYBRID_FUSION", "weighted")) == "rrf":
+        return _rrf_fuse(dense_results, sparse_results, top_k)
+
     entries: Dict[str, Dict[str, Any]] = {}
     for res in dense_results:
         entries[res.source_id] = {
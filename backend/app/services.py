@@ -15,6 +15,16 @@ from .models import (
     ZRPeriod,
 )
 
+
+def _json_value(raw: Any, default: Any) -> Any:
+    """Return a JSON column value, decoding rows written as serialized strings."""
+    if not raw:
+        return default
+    if isinstance(raw, str):
+        return json.loads(raw)
+    return raw
+
+
 class ChartService:
     """Service for chart database operations"""
 
@@ -54,16 +64,16 @@ class ChartService:
                 longitude=longitude,
                 timezone=timezone,
                 place_name=place_name,
-                planets=json.dumps(planets),
-                houses=json.dumps(houses),
-                almuten=json.dumps(almuten),
-                zodiacal_releasing=json.dumps(zodiacal_releasing),
-                lots=json.dumps(lots),
-                lots_data=json.dumps(lots),  # Duplicate for now
+                planets=planets,
+                houses=houses,
+                almuten=almuten,
+                zodiacal_releasing=zodiacal_releasing,
+                lots=lots,
+                lots_data=lots,  # Duplicate for now
                 is_day_birth=is_day_birth,
-                profection=json.dumps(profection) if profection else None,
-                firdaria=json.dumps(firdaria) if firdaria else None,
-                antiscia=json.dumps(antiscia) if antiscia else None
+                profection=profection or None,
+                firdaria=firdaria or None,
+                antiscia=antiscia or None
             )
 
             session.add(chart)
@@ -209,15 +219,15 @@ class ChartService:
                     "place_name": chart.place_name
                 },
                 "calculations": {
-                    "planets": json.loads(chart.planets) if chart.planets else {},
-                    "houses": json.loads(chart.houses) if chart.houses else {},
-                    "almuten": json.loads(chart.almuten) if chart.almuten else {},
-                    "zodiacal_releasing": json.loads(chart.zodiacal_releasing) if chart.zodiacal_releasing else {},
-                    "lots": json.loads(chart.lots) if chart.lots else {},
+                    "planets": _json_value(chart.planets, {}),
+                    "houses": _json_value(chart.houses, {}),
+                    "almuten": _json_value(chart.almuten, {}),
+                    "zodiacal_releasing": _json_value(chart.zodiacal_releasing, {}),
+                    "lots": _json_value(chart.lots, {}),
                     "is_day_birth": bool(chart.is_day_birth),
-                    "profection": json.loads(chart.profection) if chart.profection else None,
-                    "firdaria": json.loads(chart.firdaria) if chart.firdaria else None,
-                    "antiscia": json.loads(chart.antiscia) if chart.antiscia else None
+                    "profection": _json_value(chart.profection, None),
+                    "firdaria": _json_value(chart.firdaria, None),
+                    "antiscia": _json_value(chart.antiscia, None)
                 },
                 "created_at": chart.created_at.isoformat() if chart.created_at else None,
                 "status": "stored",
@@ -251,7 +261,7 @@ class InterpretationService:
                 mode=mode,
                 interpretation=interpretation,
                 confidence_score=confidence_score,
-                sources=json.dumps(sources) if sources else None
+                sources=sources or None
             )
 
             session.add(interp)
@@ -281,7 +291,7 @@ class InterpretationService:
                 "mode": interp.mode,
                 "interpretation": interp.interpretation,
                 "confidence_score": interp.confidence_score,
-                "sources": json.loads(interp.sources) if interp.sources else None,
+                "sources": _json_value(interp.sources, None),
                 "created_at": interp.created_at.isoformat() if interp.created_at else None
             }
 
@@ -331,7 +341,7 @@ class AlertService:
                 severity=severity,
                 title=title,
                 message=message,
-                metadata_info=json.dumps(metadata) if metadata else None
+                metadata_info=metadata or None
             )
 
             session.add(alert)
@@ -356,7 +366,7 @@ class AlertService:
             if user_id:
                 query = query.filter(Alert.user_id == user_id)
             if not include_resolved:
-                query = query.filter(Alert.is_resolved == 0)
+                query = query.filter(~Alert.is_resolved)
 
             alerts = query.order_by(Alert.created_at.desc()).all()
 
@@ -366,7 +376,7 @@ class AlertService:
                 "severity": alert.severity,
                 "title": alert.title,
                 "message": alert.message,
-                "metadata": json.loads(alert.metadata_info) if alert.metadata_info else None,
+                "metadata": _json_value(alert.metadata_info, None),
                 "is_read": bool(alert.is_read),
                 "is_resolved": bool(alert.is_resolved),
                 "created_at": alert.created_at.isoformat() if alert.created_at else None,
@@ -388,7 +398,7 @@ class AlertService:
         try:
             alert = session.query(Alert).filter(Alert.id == alert_id).first()
             if alert:
-                alert.is_read = 1
+                alert.is_read = True
                 session.commit()
                 return True
             return False
@@ -410,7 +420,7 @@ class AlertService:
         try:
             alert = session.query(Alert).filter(Alert.id == alert_id).first()
             if alert:
-                alert.is_resolved = 1
+                alert.is_resolved = True
                 alert.resolved_at = datetime.utcnow()
                 session.commit()
                 return True
@@ -5,13 +5,20 @@ import asyncio
 import json
 from typing import Any, Dict, List
 
+from pydantic import BaseModel
+
 from app.pipelines.cache import RedisSemanticCache
+from app.schemas import RAGAnswerResponse
 from backend.app.config import settings
 
 
 class SemanticCacheAligner:
     def __init__(self, cache: RedisSemanticCache | None = None) -> None:
-        self._cache = cache or RedisSemanticCache(settings.redis_url, ttl_seconds=settings.SEMANTIC_CACHE_TTL)
+        self._cache = cache or RedisSemanticCache(
+            settings.redis_url,
+            ttl_seconds=settings.SEMANTIC_CACHE_TTL,
+            model_type=RAGAnswerResponse,
+        )
 
     async def list_keys(self) -> List[str]:
         redis = self._cache._redis  # type: ignore[attr-defined]
@@ -22,6 +29,8 @@ class SemanticCacheAligner:
         data = await self._cache.get(key)
         if not data:
             return {}
+        if isinstance(data, BaseModel):
+            return data.model_dump(mode="json")
         return json.loads(json.dumps(data, default=str))
 
     async def compare(self, key_a: str, key_b: str) -> Dict[str, Any]:
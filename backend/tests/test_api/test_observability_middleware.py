@@ -0,0 +1,47 @@
+"""Tests for the request-metrics queue in ObservabilityMiddleware."""
+import asyncio
+
+import pytest
+
+from app.middleware import observability as middleware_module
+from app.middleware.observability import ObservabilityMiddleware
+
+
+async def _lifespan_app(scope, receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_drain_task_and_flushes_queue(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(
+        middleware_module,
+        "record_api_request",
+        lambda **kwargs: recorded.append(kwargs["endpoint"]),
+    )
+    middleware = ObservabilityMiddleware(_lifespan_app, flush_interval=3600)
+    middleware._ensure_drain_task()
+    drain_task = middleware._drain_task
+    middleware._pending.append(("/v1/rag/answer", "POST", 200, 0.01, None))
+
+    messages = asyncio.Queue()
+    for message_type in ("lifespan.startup", "lifespan.shutdown"):
+        messages.put_nowait({"type": message_type})
+    sent = []
+
+    async def send(message):
+        sent.append(message["type"])
+
+    await middleware({"type": "lifespan"}, messages.get, send)
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert drain_task.cancelled()
+    assert middleware._drain_task is None
+    assert recorded == ["/v1/rag/answer"]
+    assert not middleware._pending
@@ -169,6 +169,18 @@ def test_strongest_contacts():
     for contact in tight_contacts:
         assert contact["strength"] == "Very Strong"
 
+def test_precomputed_result_matches_summary_and_strongest_contacts():
+    """Test summary counts and strongest contacts reuse one antiscia pass"""
+    calc = AntisciaCalculator(orb=2.0)
+    planet_positions = {"Sun": 0.0, "Moon": 90.2, "Mercury": 89.5, "Venus": 180.1}
+
+    result = calc.calculate_all_antiscia(planet_positions)
+
+    assert calc.summarize_contacts(result) == calc.get_antiscia_summary(planet_positions)["summary"]
+    assert calc.get_strongest_antiscia_contacts(planet_positions, limit=3, result=result) == (
+        calc.get_strongest_antiscia_contacts(planet_positions, limit=3)
+    )
+
 def test_orb_calculation():
     """Test orb calculation between positions"""
     calc = AntisciaCalculator()
@@ -113,4 +113,27 @@ def test_day_night_determination():
     
     # Sun at 120° (0° Leo) with ASC at 90° (0° Cancer) = day birth
     is_day = ephemeris.is_day_birth(planets, houses)
-    assert is_day
\ No newline at end of file
+    assert is_day
+
+
+def test_prepare_reapplies_path_after_another_service_closes(monkeypatch):
+    """A long-lived service reconfigures swisseph after a foreign close()"""
+    from app.calculators import ephemeris as ephemeris_module
+
+    if not ephemeris_module.SWISSEPH_AVAILABLE:
+        pytest.skip("swisseph not installed")
+
+    paths = []
+    monkeypatch.setattr(ephemeris_module.swe, "set_ephe_path", paths.append)
+    monkeypatch.setattr(ephemeris_module.swe, "close", lambda: None)
+    shared = EphemerisService(ephemeris_path="/tmp/ephe")
+    assert paths == ["/tmp/ephe"]
+
+    shared._mock_used = True
+    shared.prepare()
+    assert paths == ["/tmp/ephe"]
+    assert shared.status == "swisseph"
+
+    EphemerisService(ephemeris_path="/tmp/other").close()
+    shared.prepare()
+    assert paths == ["/tmp/ephe", "/tmp/other", "/tmp/ephe"]
@@ -171,4 +171,17 @@ def test_metric_summary():
     assert "mean" in summary
     assert "median" in summary
     assert "min" in summary
-    assert "max" in summary
\ No newline at end of file
+    assert "max" in summary
+
+
+def test_record_many_histograms():
+    """Test batched histogram recording"""
+    obs = AstroObservability()
+
+    obs.metrics.record_many({"coverage_score": 0.8, "rag_latency": 120}, tags={"mode": "natal"})
+
+    assert obs.metrics.get_metric_values("coverage_score", 60) == [0.8]
+    assert obs.metrics.get_metric_values("rag_latency", 60) == [120]
+    points = [obs.metrics.metrics["coverage_score"][-1], obs.metrics.metrics["rag_latency"][-1]]
+    assert points[0].timestamp == points[1].timestamp
+    assert points[0].tags == {"mode": "natal"}
@@ -108,6 +108,19 @@ def test_model_selector_degrade_prefers_medium_on_low_confidence():
     assert model.key == "medium"
 
 
+def test_model_selector_ignores_budget_only_overrides():
+    profiles = orchestrator_profiles_stub()
+    selector = ModelSelector(profiles)
+    degrade = DegradeDecision(
+        active=False,
+        flags={"skip_multi_hop": True, "latency_budget_ms": 500},
+        llm_overrides={"skip_revision": True},
+    )
+    health = {provider: 1.0 for profile in profiles.values() for provider in profile.providers}
+    model, _ = selector.select("policy_risk", "high", degrade, health)
+    assert model.key == "large"
+
+
 def orchestrator_profiles_stub():
     from app.core.llm.orchestrator import ModelProfile
 
@@ -116,3 +129,116 @@ def orchestrator_profiles_stub():
         "medium": ModelProfile("medium", "m", ["primary_openai", "alt_openai"], max_context=16000),
         "large": ModelProfile("large", "l", ["fallback_openai"], max_context=64000),
     }
+
+
+class SlowProvider(FakeProvider):
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    async def generate(self, prompt: str = "", **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return await super().generate(prompt, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_llm_orchestrator_hedges_slow_primary(monkeypatch):
+    monkeypatch.setattr("app.core.llm.orchestrator.settings.LLM_ROUTER_HEDGE_AFTER_MS", 10)
+    slow, fast = SlowProvider(1.0), SlowProvider(0.0)
+    pool = LLMProviderPool()
+    pool.register(ProviderEntry(name="primary_openai", provider=slow, cooldown_seconds=1))
+    pool.register(ProviderEntry(name="fallback_openai", provider=fast, cooldown_seconds=1))
+    orchestrator = LLMOrchestrator(pool, AutoRepair())
+    orchestrator._selector.select = lambda **kwargs: (
+        orchestrator._profiles["small"],
+        [orchestrator._profiles["large"]],
+    )
+
+    outcome = await asyncio.wait_for(
+        orchestrator.generate_revision(
+            request=RAGAnswerRequest(query="Explain Mercury", birth_data=None),
+            messages=[{"role": "user", "content": "Explain"}],
+            coverage={"score": 0.8, "pass": True},
+            rag_response=SimpleNamespace(documents=[], citations=[]),
+            evidence_pack={},
+            degrade_state=DegradeDecision(active=False),
+            max_tokens=512,
+        ),
+        timeout=0.5,
+    )
+
+    assert outcome.decision.provider == "fallback_openai"
+    assert outcome.attempts == 2
+    assert (slow.calls, fast.calls) == (1, 1)
+
+
+class RecordingProvider(SlowProvider):
+    def __init__(self, delay: float):
+        super().__init__(delay)
+        self.responses = []
+
+    async def generate(self, prompt: str = "", **kwargs):
+        response = await super().generate(prompt, **kwargs)
+        self.responses.append(response)
+        return response
+
+
+def _hedged_orchestrator(monkeypatch, providers, fallbacks):
+    monkeypatch.setattr("app.core.llm.orchestrator.settings.LLM_ROUTER_HEDGE_AFTER_MS", 10)
+    pool = LLMProviderPool()
+    for name, provider in providers.items():
+        pool.register(ProviderEntry(name=name, provider=provider, cooldown_seconds=1))
+    orchestrator = LLMOrchestrator(pool, AutoRepair())
+    orchestrator._selector.select = lambda **kwargs: (
+        orchestrator._profiles["small"],
+        [orchestrator._profiles[key] for key in fallbacks],
+    )
+    return orchestrator
+
+
+async def _revise(orchestrator):
+    return await orchestrator.generate_revision(
+        request=RAGAnswerRequest(query="Explain Mercury", birth_data=None),
+        messages=[{"role": "user", "content": "Explain"}],
+        coverage={"score": 0.8, "pass": True},
+        rag_response=SimpleNamespace(documents=[], citations=[]),
+        evidence_pack={},
+        degrade_state=DegradeDecision(active=False),
+        max_tokens=512,
+    )
+
+
+@pytest.mark.asyncio
+async def test_llm_orchestrator_stops_hedging_without_profiles(monkeypatch):
+    slow = SlowProvider(0.2)
+    orchestrator = _hedged_orchestrator(monkeypatch, {"primary_openai": slow}, [])
+    waits = []
+    real_wait = asyncio.wait
+
+    async def counting_wait(*args, **kwargs):
+        waits.append(kwargs.get("timeout"))
+        return await real_wait(*args, **kwargs)
+
+    monkeypatch.setattr("app.core.llm.orchestrator.asyncio.wait", counting_wait)
+
+    outcome = await _revise(orchestrator)
+
+    assert outcome.attempts == 1
+    # One hedge window finds no fallback; after that the loop just waits.
+    assert waits == [0.01, None]
+
+
+@pytest.mark.asyncio
+async def test_llm_orchestrator_records_provider_of_kept_response(monkeypatch):
+    primary, fallback = RecordingProvider(0.03), RecordingProvider(0.02)
+    orchestrator = _hedged_orchestrator(
+        monkeypatch,
+        {"primary_openai": primary, "fallback_openai": fallback},
+        ["large"],
+    )
+
+    outcome = await _revise(orchestrator)
+
+    by_provider = {"primary_openai": primary, "fallback_openai": fallback}
+    assert outcome.response in by_provider[outcome.decision.provider].responses
@@ -0,0 +1,229 @@
+"""Tests for the horoscope classifier wrapper."""
+import asyncio
+import json
+import os
+from datetime import datetime
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.multioutput import MultiOutputClassifier
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from app.ml import horoscope_model
+from app.ml.horoscope_model import (
+    DEFAULT_HOROSCOPE_TEMPLATES,
+    HOROSCOPE_TEMPLATES,
+    AdvancedAstrolojiModel,
+    ModelDeployment,
+    PredictionWorker,
+)
+
+
+CATEGORIES = ["ask", "finans", "kariyer", "saglik"]
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    rng = np.random.default_rng(7)
+    label_values = {
+        "burc": ["aslan", "koç", "yay"],
+        "gun_tipi": ["hafta_ici", "hafta_sonu"],
+        "mevsim": ["ilkbahar", "kis", "sonbahar", "yaz"],
+        "ay_evresi": ["dolunay", "ilk_dordun", "son_dordun", "yeni_ay"],
+    }
+    label_encoders = {key: LabelEncoder().fit(values) for key, values in label_values.items()}
+
+    vectorizer = TfidfVectorizer().fit(["aşk kapıda", "kariyer fırsatı", "sağlık dinlenme"])
+    numerical = rng.normal(size=(40, 10))
+    scaler = StandardScaler().fit(numerical)
+    text = vectorizer.transform(["aşk kapıda"] * 40).toarray()
+    features = np.hstack([scaler.transform(numerical), text])
+    targets = rng.integers(0, 2, size=(40, len(CATEGORIES)))
+    targets[:, 3] = 0  # single-class output exercises the one-column probability shape
+    model = MultiOutputClassifier(RandomForestClassifier(n_estimators=5, random_state=0))
+    model.fit(features, targets)
+
+    joblib.dump(model, tmp_path / "model.joblib")
+    joblib.dump(vectorizer, tmp_path / "vectorizer.joblib")
+    joblib.dump(label_encoders, tmp_path / "label_encoders.joblib")
+    joblib.dump(scaler, tmp_path / "scaler.joblib")
+    metadata = {
+        "version": "test",
+        "categories": CATEGORIES,
+        "feature_columns": ["ay", "haftanin_gunu", "yilin_gunu", "burc_encoded", "mevsim_encoded"],
+        "metrics": {"accuracy": 0.9},
+    }
+    (tmp_path / "metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+    return tmp_path
+
+
+def test_artifacts_are_shared_until_files_change(model_dir):
+    first = AdvancedAstrolojiModel(model_dir)
+    second = AdvancedAstrolojiModel(model_dir)
+
+    assert second.model is first.model
+    assert second.metadata == first.metadata
+    assert second.metadata is not first.metadata
+
+    metadata = json.loads((model_dir / "metadata.json").read_text(encoding="utf-8"))
+    metadata["version"] = "retrained"
+    (model_dir / "metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+    os.utime(model_dir / "metadata.json", ns=(1, 1))
+
+    reloaded = AdvancedAstrolojiModel(model_dir)
+    assert reloaded.metadata["version"] == "retrained"
+    assert reloaded.model is not first.model
+
+
+def test_missing_artifacts_fall_back(tmp_path):
+    model = AdvancedAstrolojiModel(tmp_path)
+
+    assert model.model_loaded is False
+    result = model.predict_categories("aslan", "bugün", "2024-03-10")
+    assert result["is_fallback"] is True
+    assert model.predict_batch([("aslan", "bugün", None)] * 2) == [result, result]
+
+
+def test_transform_label_matches_encoders(model_dir):
+    model = AdvancedAstrolojiModel(model_dir)
+
+    for key, encoder in model.label_encoders.items():
+        for label in encoder.classes_:
+            assert model._transform_label(key, label) == int(encoder.transform([label])[0])
+    assert model._transform_label("burc", "bilinmeyen") == 0
+    assert model._transform_label("olmayan", "aslan") == 0
+
+
+def test_preprocess_batch_matches_single_rows(model_dir):
+    model = AdvancedAstrolojiModel(model_dir)
+    items = [("aslan", "bugün", "2024-03-10"), ("koç", "yarın", "2024-12-28")]
+
+    batch = model.preprocess_batch(items)
+
+    assert batch.shape[0] == 2
+    assert batch.dtype == np.float32
+    assert batch.flags["C_CONTIGUOUS"]
+    for row, item in enumerate(items):
+        np.testing.assert_allclose(batch[row], model.preprocess_input(*item)[0])
+
+
+def test_preprocess_batch_date_features_match_calendar(model_dir):
+    model = AdvancedAstrolojiModel(model_dir)
+    dates = ["2024-02-29", "2024-03-22", "2023-12-31", "2024-06-08"]
+
+    batch = model.preprocess_batch([("aslan", "bugün", tarih) for tarih in dates])
+    numerical = model.scaler.inverse_transform(batch[:, :10])
+
+    for row, tarih in enumerate(dates):
+        date_obj = datetime.strptime(tarih, "%Y-%m-%d")
+        expected = [
+            date_obj.month,
+            date_obj.weekday(),
+            date_obj.timetuple().tm_yday,
+            model._transform_label("burc", "aslan"),
+            model._transform_label("gun_tipi", model.get_day_type(date_obj)),
+            model._transform_label("mevsim", model.get_season(date_obj)),
+            model._transform_label("ay_evresi", model.get_moon_phase(date_obj)),
+        ]
+        np.testing.assert_allclose(numerical[row, 3:], expected, atol=1e-3)
+
+
+def test_predict_batch_matches_single_predictions(model_dir):
+    model = AdvancedAstrolojiModel(model_dir)
+    items = [
+        ("aslan", "bugün", "2024-03-10"),
+        ("koç", "yarın", "2024-12-28"),
+        ("yay", "bu hafta", "2024-07-21"),
+    ]
+
+    batch = model.predict_batch(items)
+
+    assert len(batch) == len(items)
+    for result, item in zip(batch, items):
+        single = model.predict_categories(*item)
+        assert result["model_version"] == "test"
+        assert [c["kategori"] for c in result["kategoriler"]] == [c["kategori"] for c in single["kategoriler"]]
+        assert result["toplam_guven"] == pytest.approx(single["toplam_guven"])
+
+
+def test_predict_uses_positive_class_columns(model_dir):
+    model = AdvancedAstrolojiModel(model_dir)
+    item = ("koç", "yarın", "2024-12-28")
+
+    raw_outputs = model.model.predict_proba(model.preprocess_input(*item))
+    expected = {}
+    for label, probabilities in zip(CATEGORIES, raw_outputs):
+        pos_prob = probabilities[0][0] if probabilities.shape[1] == 1 else probabilities[0][1]
+        if pos_prob > 0.3:
+            expected[label] = pos_prob
+
+    result = model.predict_categories(*item)
+
+    assert model._positive_columns == [1, 1, 1, 0]
+    assert {c["kategori"]: c["olasilik"] for c in result["kategoriler"]} == pytest.approx(expected)
+    assert [c["olasilik"] for c in result["kategoriler"]] == sorted(expected.values(), reverse=True)
+
+
+def test_generate_horoscope_is_deterministic(tmp_path):
+    model = AdvancedAstrolojiModel(tmp_path)
+    categories = [{"kategori": "kariyer", "olasilik": 0.8}]
+
+    first = model.generate_horoscope("aslan", "bugün", categories)
+
+    assert first == model.generate_horoscope("aslan", "bugün", categories)
+    assert first.startswith("Aslan burcu için bugün: ")
+    assert first.split(": ", 1)[1] in HOROSCOPE_TEMPLATES["kariyer"]
+    assert model.generate_horoscope("aslan", "bugün", []).split(": ", 1)[1] in DEFAULT_HOROSCOPE_TEMPLATES
+
+
+def test_canary_routing_and_promotion(model_dir, monkeypatch):
+    deployment = ModelDeployment()
+    stable = AdvancedAstrolojiModel(model_dir)
+    deployment.current_model = stable
+
+    assert deployment.canary_deployment(model_dir, "2.0", traffic_percentage=0.25) is True
+    canary = deployment._canary[0]
+
+    monkeypatch.setattr(horoscope_model.random, "random", lambda: 0.1)
+    assert deployment.route_model() is canary
+    monkeypatch.setattr(horoscope_model.random, "random", lambda: 0.5)
+    assert deployment.route_model() is stable
+
+    assert deployment.promote_canary() is True
+    assert deployment.current_model is canary
+    assert deployment.model_versions["2.0"] is canary
+    assert deployment.route_model() is canary
+    assert deployment.promote_canary() is False
+
+
+def test_canary_rejects_unloadable_model(tmp_path):
+    deployment = ModelDeployment()
+
+    assert deployment.canary_deployment(tmp_path, "bad") is False
+    assert deployment.route_model() is None
+
+
+@pytest.mark.asyncio
+async def test_prediction_worker_coalesces_concurrent_requests(model_dir, monkeypatch):
+    model = AdvancedAstrolojiModel(model_dir)
+    batch_sizes = []
+    predict_batch = model.predict_batch
+
+    def recording_predict_batch(items):
+        batch_sizes.append(len(items))
+        return predict_batch(items)
+
+    monkeypatch.setattr(model, "predict_batch", recording_predict_batch)
+    worker = PredictionWorker(model, max_batch_size=8, max_wait_ms=50)
+    items = [("aslan", "bugün", "2024-03-10"), ("koç", "yarın", "2024-12-28"), ("yay", "bu ay", None)]
+
+    try:
+        results = await asyncio.gather(*(worker.submit(*item) for item in items))
+    finally:
+        await worker.stop()
+
+    assert batch_sizes == [3]
+    assert results == predict_batch(items)
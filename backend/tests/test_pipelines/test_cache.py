@@ -0,0 +1,183 @@
+"""Tests for semantic cache serialization and in-memory backends."""
+import numpy as np
+import pytest
+from pydantic import BaseModel
+
+from app.pipelines import cache as cache_module
+from app.pipelines.cache import (
+    CODEC_JSON,
+    CODEC_MODEL,
+    COMPRESSION_NONE,
+    CacheCodec,
+    RedisSemanticCache,
+    SemanticCache,
+)
+
+
+class _Payload(BaseModel):
+    text: str
+    scores: list[float]
+
+
+def test_codec_round_trips_json_payloads():
+    codec = CacheCodec()
+    value = {"kategoriler": [{"kategori": "genel", "olasilik": 0.5}], "toplam_guven": 0.5}
+
+    raw = codec.encode(value)
+
+    assert raw[:2] == CODEC_JSON + COMPRESSION_NONE
+    assert codec.decode(raw) == value
+
+
+def test_codec_compresses_large_payloads():
+    codec = CacheCodec()
+    value = {"text": "kozmik enerji " * 200}
+
+    raw = codec.encode(value)
+
+    assert raw[1:2] != COMPRESSION_NONE
+    assert len(raw) < len(value["text"])
+    assert codec.decode(raw) == value
+
+
+def test_codec_rehydrates_models():
+    codec = CacheCodec(model_type=_Payload)
+    value = _Payload(text="merhaba", scores=[0.1, 0.9])
+
+    raw = codec.encode(value)
+
+    assert raw[:1] == CODEC_MODEL
+    assert codec.decode(raw) == value
+
+
+def test_codec_refuses_pickle_by_default():
+    codec = CacheCodec()
+    value = {"when": object()}
+
+    assert codec.encode(value) is None
+
+    pickling = CacheCodec(allow_pickle=True)
+    raw = pickling.encode({"when": 3j})
+    assert pickling.decode(raw) == {"when": 3j}
+    with pytest.raises(ValueError):
+        codec.decode(raw)
+
+
+def test_codec_serializes_numpy_values():
+    codec = CacheCodec()
+
+    decoded = codec.decode(codec.encode({"vector": np.arange(3, dtype=np.float32)}))
+
+    assert decoded == {"vector": [0.0, 1.0, 2.0]}
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.get_calls = 0
+
+    async def get(self, key):
+        self.get_calls += 1
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        self.get_calls += 1
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_evicts_least_recently_used():
+    cache = SemanticCache(max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1
+
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_expires_entries(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: clock[0])
+    cache = SemanticCache(ttl_seconds=10)
+    await cache.set("a", 1)
+    await cache.set("b", 2, ttl_factor=0.5)
+
+    clock[0] += 6
+
+    assert await cache.get("a") == 1
+    assert await cache.get("b") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_serves_hot_keys_locally():
+    cache = RedisSemanticCache("redis://localhost:6379/0")
+    fake = _FakeRedis()
+    cache._redis = fake
+    await cache.set("k", {"value": 1})
+
+    assert await cache.get("k") == {"value": 1}
+    assert fake.get_calls == 0
+
+    await SemanticCache.invalidate(cache, "k")
+    assert await cache.get("k") == {"value": 1}
+    assert await cache.get("k") == {"value": 1}
+    assert fake.get_calls == 1
+
+    await cache.invalidate("k")
+    assert await cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_mget_batches_misses_and_drops_corrupt_entries():
+    cache = RedisSemanticCache("redis://localhost:6379/0")
+    fake = _FakeRedis()
+    cache._redis = fake
+    await cache.set("local", 1)
+    fake.data["remote"] = CacheCodec().encode({"value": 2})
+    fake.data["corrupt"] = b"??not-a-cache-entry"
+
+    values = await cache.mget(["local", "remote", "corrupt", "absent"])
+
+    assert values == [1, {"value": 2}, None, None]
+    assert fake.get_calls == 1
+    assert "corrupt" not in fake.data
+    assert await cache.get("remote") == {"value": 2}
+    assert fake.get_calls == 1
+
+
+def test_similarity_index_is_scoped_by_bucket():
+    index = cache_module.SimilarityIndex(max_per_bucket=2)
+    index.add("user-a", "k1", [1.0, 0.0, 0.0])
+    index.add("user-a", "k2", [0.0, 1.0, 0.0])
+
+    assert index.nearest("user-a", [0.9, 0.1, 0.0], min_score=0.95) == "k1"
+    assert index.nearest("user-a", [0.7, 0.7, 0.0], min_score=0.95) is None
+    assert index.nearest("user-b", [1.0, 0.0, 0.0], min_score=0.5) is None
+
+    index.add("user-a", "k3", [0.0, 0.0, 1.0])
+    assert index.nearest("user-a", [1.0, 0.0, 0.0], min_score=0.5) is None
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_serves_similar_queries():
+    cache = SemanticCache()
+    await cache.set("exact", {"answer": 1})
+    await cache.index_vector("bucket", "exact", [0.6, 0.8])
+
+    assert await cache.get_similar("bucket", [0.61, 0.79], min_score=0.99) == {"answer": 1}
+    assert await cache.get_similar("bucket", [0.8, -0.6], min_score=0.99) is None
+
+    await cache.invalidate("exact")
+    assert await cache.get_similar("bucket", [0.6, 0.8], min_score=0.5) is None
@@ -0,0 +1,168 @@
+"""Tests for the chart bootstrapper helpers and cache."""
+import asyncio
+import gc
+import threading
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.calculators.zodiac_releasing import ZRCalculator
+from app.pipelines import chart_builder
+from app.pipelines.chart_builder import ChartBootstrapper, ChartBuildResult
+from app.schemas import BirthData, ChartContext
+
+
+@pytest.fixture
+def timeline():
+    return ZRCalculator().compute_zr_timeline(0.0, 0.0, 0.0, True, date(1990, 5, 17))
+
+
+def _linear_active(periods, current):
+    for period in periods:
+        if period.start_date <= current <= period.end_date:
+            return period
+    return None
+
+
+def test_current_periods_match_linear_scan(timeline):
+    bootstrapper = ChartBootstrapper(cache_ttl=60)
+    boundary = timeline.l2_periods[3].end_date
+    probes = [
+        date(1990, 5, 17),
+        boundary,
+        boundary + timedelta(days=1),
+        date(2024, 1, 1),
+        date(2150, 1, 1),
+        date(1980, 1, 1),
+    ]
+
+    for current in probes:
+        result = bootstrapper._current_zr_periods(timeline, current)
+        for level, periods in (("l1", timeline.l1_periods), ("l2", timeline.l2_periods)):
+            expected = _linear_active(periods, current)
+            if expected is None:
+                assert result[level] is None
+            else:
+                assert result[level]["start_date"] == expected.start_date.isoformat()
+                assert result[level]["sign"] == expected.sign
+
+
+def test_next_peaks_are_upcoming_l1_peaks(timeline):
+    bootstrapper = ChartBootstrapper(cache_ttl=60)
+    current = date(1990, 5, 17)
+
+    peaks = bootstrapper._next_zr_peaks(timeline, current)
+
+    expected = [p for p in timeline.l1_periods if p.is_peak and p.start_date > current][:3]
+    assert expected
+    assert [p["start_date"] for p in peaks] == [p.start_date.isoformat() for p in expected]
+    assert all(p["years_from_now"] > 0 for p in peaks)
+    assert bootstrapper._next_zr_peaks(timeline, date(2200, 1, 1)) == []
+
+
+def test_timeline_index_is_cached_until_timeline_is_released():
+    timeline = ZRCalculator().compute_zr_timeline(0.0, 0.0, 0.0, True, date(1990, 5, 17))
+    first = chart_builder._timeline_index(timeline)
+    key = id(timeline)
+
+    assert chart_builder._timeline_index(timeline) is first
+    assert key in chart_builder._TIMELINE_INDEXES
+
+    del timeline
+    gc.collect()
+    assert key not in chart_builder._TIMELINE_INDEXES
+
+
+def _birth(day: int) -> BirthData:
+    return BirthData(date=f"1990-05-{day:02d}", time="12:00", tz="UTC", lat=41.0, lng=29.0)
+
+
+@pytest.mark.asyncio
+async def test_chart_cache_is_bounded_lru(monkeypatch):
+    bootstrapper = ChartBootstrapper(cache_ttl=60, max_entries=2)
+    computed = []
+
+    def fake_compute(birth_data):
+        computed.append(birth_data.date)
+        return ChartBuildResult(chart_data={"date": birth_data.date}, context=ChartContext())
+
+    monkeypatch.setattr(bootstrapper, "_compute_chart", fake_compute)
+
+    first = await bootstrapper.load(_birth(1))
+    await bootstrapper.load(_birth(2))
+    assert await bootstrapper.load(_birth(1)) is first
+    await bootstrapper.load(_birth(3))
+
+    assert len(bootstrapper._cache) == 2
+    await bootstrapper.load(_birth(1))
+    await bootstrapper.load(_birth(2))
+    assert computed == ["1990-05-01", "1990-05-02", "1990-05-03", "1990-05-02"]
+
+
+@pytest.mark.asyncio
+async def test_chart_cache_expires_entries(monkeypatch):
+    bootstrapper = ChartBootstrapper(cache_ttl=60)
+    clock = [100.0]
+    monkeypatch.setattr(chart_builder.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(
+        bootstrapper,
+        "_compute_chart",
+        lambda birth_data: ChartBuildResult(chart_data={}, context=ChartContext()),
+    )
+
+    first = await bootstrapper.load(_birth(1))
+    clock[0] += 59
+    assert await bootstrapper.load(_birth(1)) is first
+    clock[0] += 2
+    assert await bootstrapper.load(_birth(1)) is not first
+
+
+def test_almuten_points_use_shared_sign_table():
+    bootstrapper = ChartBootstrapper(cache_ttl=60)
+    sun = SimpleNamespace(longitude=75.0, sign="Gemini", degree_in_sign=15.0)
+    moon = SimpleNamespace(longitude=200.0, sign="Libra", degree_in_sign=20.0)
+    houses = SimpleNamespace(asc=359.5, mc=270.0)
+
+    points = bootstrapper._prepare_almuten_points(
+        {"Sun": sun, "Moon": moon}, houses, {"Fortune": 30.0, "Spirit": -15.0}
+    )
+
+    assert [(p.name, p.sign) for p in points] == [
+        ("Sun", "Gemini"),
+        ("Moon", "Libra"),
+        ("ASC", "Pisces"),
+        ("MC", "Capricorn"),
+        ("Fortune", "Taurus"),
+        ("Spirit", "Pisces"),
+    ]
+    assert points[2].degree == pytest.approx(29.5)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_build_off_the_event_loop(monkeypatch):
+    bootstrapper = ChartBootstrapper(cache_ttl=60)
+    started = threading.Event()
+    release = threading.Event()
+    computed = []
+
+    def slow_compute(birth_data):
+        computed.append(birth_data.date)
+        started.set()
+        release.wait(timeout=5)
+        return ChartBuildResult(chart_data={"date": birth_data.date}, context=ChartContext())
+
+    monkeypatch.setattr(bootstrapper, "_compute_chart", slow_compute)
+
+    loads = [asyncio.ensure_future(bootstrapper.load(_birth(1))) for _ in range(3)]
+    await asyncio.to_thread(started.wait, 5)
+    # The loop keeps serving other coroutines while the chart is computed.
+    await asyncio.sleep(0)
+    assert not any(load.done() for load in loads)
+    release.set()
+    results = await asyncio.gather(*loads)
+
+    assert computed == ["1990-05-01"]
+    assert results[0] is results[1] is results[2]
+    assert bootstrapper._inflight == {}
+    assert await bootstrapper.load(_birth(1)) is results[0]
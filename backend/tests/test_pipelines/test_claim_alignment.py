@@ -1,4 +1,5 @@
 """Tests for claim-to-evidence alignment scoring."""
+from app.pipelines import claim_alignment
 from app.pipelines.claim_alignment import score_claim_alignment
 from app.schemas.interpretation import (
     AnswerBody,
@@ -97,3 +98,133 @@ def test_score_claim_alignment_without_citations():
     assert result["score"] == 0.0
     assert result["reason"] == "no_citations"
     assert all(claim["score"] == 0.0 for claim in result["claims"])
+
+
+def test_compare_claim_fuzzy_window_without_rapidfuzz(monkeypatch):
+    content = _documents()[1]["content"]
+    claim = "Impulsive decisions surface under heavy pressure."
+    args = (
+        frozenset(claim_alignment._tokenize(claim)),
+        claim.lower(),
+        claim_alignment._prepare_document(content),
+    )
+
+    fast_score, fast_span = claim_alignment._compare_claim_to_content(*args)
+    monkeypatch.setattr(claim_alignment, "fuzz", None)
+    slow_score, slow_span = claim_alignment._compare_claim_to_content(*args)
+
+    assert fast_score >= 0.6
+    assert slow_score >= 0.6
+    assert fast_span and fast_span in content
+    assert slow_span and slow_span in content
+
+
+def test_compare_claim_full_token_match_skips_fuzzy_window(monkeypatch):
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("fuzzy window should be skipped")
+
+    monkeypatch.setattr(claim_alignment, "_best_fuzzy_window", _fail)
+    claim = "Leadership prominence remains"
+    score, span = claim_alignment._compare_claim_to_content(
+        frozenset(claim_alignment._tokenize(claim)),
+        claim.lower(),
+        claim_alignment._prepare_document(_documents()[0]["content"]),
+    )
+
+    assert score == 1.0
+    assert "Leadership prominence remains" in span
+
+
+def test_score_claim_alignment_prepares_each_document_once(monkeypatch):
+    prepared = []
+    prepare_document = claim_alignment._prepare_document
+
+    def recording_prepare(content):
+        prepared.append(content)
+        return prepare_document(content)
+
+    monkeypatch.setattr(claim_alignment, "_prepare_document", recording_prepare)
+    result = score_claim_alignment(_build_payload(), _documents())
+
+    assert len(result["claims"]) >= 4
+    assert sorted(prepared) == sorted(doc["content"] for doc in _documents())
+
+
+def test_prepare_document_records_first_whole_word_offsets():
+    prepared = claim_alignment._prepare_document("Leaders lead. Leadership, leaders and this lead")
+
+    assert prepared.lowered == "leaders lead. leadership, leaders and this lead"
+    assert prepared.token_offsets == {"leaders": 0, "lead": 8, "leadership": 14}
+
+
+def test_resolve_doc_prefers_exact_ids_over_partial_matches():
+    documents = [
+        {"source_id": "doc1", "content": "first", "metadata": {"chunk_id": "chunk-a"}},
+        {"source_id": "doc12", "content": "second", "metadata": {}},
+        {"doc_id": "exact-id", "content": "third"},
+    ]
+    lookup = claim_alignment._build_doc_lookup(documents)
+
+    def resolve(doc_id):
+        citation = CitationEntry(doc_id=doc_id, section=0, line_start=0, line_end=0)
+        return claim_alignment._resolve_doc_for_citation(citation, lookup)
+
+    assert resolve("doc12") is documents[1]
+    assert resolve("exact-id") is documents[2]
+    assert resolve("chunk-a") is documents[0]
+    assert resolve("kb/chunk-a#2") is documents[0]
+    assert resolve("unknown") is None
+
+
+def test_score_claim_alignment_compares_each_cited_document_once(monkeypatch):
+    payload = _build_payload()
+    duplicate = payload.citations[0].model_copy(update={"section": 3})
+    payload = payload.model_copy(update={"citations": [payload.citations[0], duplicate, payload.citations[1]]})
+    compared = []
+    compare = claim_alignment._compare_claim_to_content
+
+    def recording_compare(claim_tokens, claim_lower, prepared, *args):
+        compared.append((claim_lower, prepared.content))
+        return compare(claim_tokens, claim_lower, prepared, *args)
+
+    monkeypatch.setattr(claim_alignment, "_compare_claim_to_content", recording_compare)
+    result = score_claim_alignment(payload, _documents())
+
+    assert len(compared) == len(set(compared))
+    assert all(claim["citation_section"] == 0 for claim in result["claims"])
+
+
+def test_ngram_fallback_scores_contained_claims(monkeypatch):
+    monkeypatch.setattr(claim_alignment, "fuzz", None)
+    content = ("Unrelated filler about houses and aspects. " * 20) + _documents()[1]["content"]
+    lowered = content.lower()
+
+    ratio, span = claim_alignment._best_fuzzy_window("slow down to avoid rash choices", lowered, content, 0.0)
+    assert ratio == 1.0
+    assert "slow down to avoid rash choices" in span
+
+    ratio, _span = claim_alignment._best_fuzzy_window("slow down, avoid hasty choices", lowered, content, 0.0)
+    assert 0.3 < ratio < 1.0
+
+    assert claim_alignment._best_fuzzy_window("qqqq zzzz", lowered, content, 0.2) == (0.0, "")
+    assert claim_alignment._best_fuzzy_window("abc", lowered, content, 0.0) == (0.0, "")
+
+
+def test_supported_token_overlap_skips_fuzzy_window(monkeypatch):
+    claim = "Leadership prominence remains strong despite setbacks"
+    args = (
+        frozenset(claim_alignment._tokenize(claim)),
+        claim.lower(),
+        claim_alignment._prepare_document(_documents()[0]["content"]),
+    )
+
+    score_with_fuzzy, _span = claim_alignment._compare_claim_to_content(*args)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("fuzzy window should be skipped")
+
+    monkeypatch.setattr(claim_alignment, "_best_fuzzy_window", _fail)
+    score, span = claim_alignment._compare_claim_to_content(*args, supported_threshold=0.6)
+
+    assert 0.6 <= score <= score_with_fuzzy
+    assert "Leadership prominence remains" in span
@@ -1,6 +1,7 @@
 """Tests for adaptive degrade policy manager."""
 from app.evaluation.observability import MetricCollector
-from app.pipelines.degrade import DegradePolicyManager
+from app.pipelines import degrade
+from app.pipelines.degrade import DegradePolicyManager, _percentile
 from backend.app.config import settings
 
 
@@ -59,3 +60,82 @@ def test_cost_guardrail_actions():
     assert decision.active is True
     assert any("cost_per_answer" in reason for reason in decision.reasons)
     assert decision.cost_actions.get("rerank_top_k") == settings.COST_GUARDRAIL_CE_REDUCE_TO
+
+
+def test_tight_latency_budget_skips_expensive_stages():
+    manager = DegradePolicyManager(
+        metrics=MetricCollector(max_points_per_metric=50),
+        min_latency_samples=5,
+        latency_threshold_ms=9999,
+        budget_multi_hop_ms=1500,
+        budget_revision_ms=800,
+    )
+
+    relaxed = manager.evaluate(latency_budget_ms=1600)
+    assert "skip_multi_hop" not in relaxed.flags
+    assert "skip_revision" not in relaxed.llm_overrides
+
+    medium = manager.evaluate(latency_budget_ms=1000)
+    assert medium.flags.get("skip_multi_hop") is True
+    assert "skip_revision" not in medium.llm_overrides
+
+    tight = manager.evaluate(latency_budget_ms=500)
+    assert tight.flags.get("skip_multi_hop") is True
+    assert tight.llm_overrides.get("skip_revision") is True
+
+
+def test_latency_budget_alone_leaves_decision_inactive():
+    manager = DegradePolicyManager(
+        metrics=MetricCollector(max_points_per_metric=50),
+        min_latency_samples=5,
+        latency_threshold_ms=9999,
+        budget_multi_hop_ms=1500,
+        budget_revision_ms=800,
+    )
+
+    decision = manager.evaluate(latency_budget_ms=500)
+
+    # A client's budget is not system degradation: no gauge, no degrade routing.
+    assert decision.active is False
+    assert decision.reasons == []
+    assert decision.flags["latency_budget_ms"] == 500
+    assert decision.llm_overrides.get("skip_revision") is True
+
+
+def test_percentile_nearest_rank_small_and_large_windows():
+    small = [300, 180, 240, 190, 210]
+    large = [float(value) for value in range(200, 0, -1)]
+
+    assert _percentile([], 95) == 0.0
+    assert _percentile(small, 95) == 300.0
+    assert _percentile(small, 50) == 210.0
+    assert _percentile(large, 95) == 190.0
+    assert _percentile(large, 50) == 100.0
+    assert _percentile(large, 100) == 200.0
+
+
+def test_metric_snapshot_is_reused_within_ttl(monkeypatch):
+    metrics = MetricCollector(max_points_per_metric=50)
+    for value in [100, 110, 120, 130, 140]:
+        metrics.record_histogram("rag_latency", value)
+    manager = DegradePolicyManager(
+        metrics=metrics,
+        min_latency_samples=5,
+        latency_threshold_ms=200,
+        snapshot_ttl_seconds=5.0,
+    )
+    clock = [10.0]
+    monkeypatch.setattr(degrade.time, "monotonic", lambda: clock[0])
+
+    first = manager.evaluate()
+    first.flags["citation_alignment_score"] = 0.1
+    for value in [900, 950, 990, 999, 1000]:
+        metrics.record_histogram("rag_latency", value)
+    second = manager.evaluate()
+
+    assert first.active is False and second.active is False
+    assert second is not first
+    assert "citation_alignment_score" not in second.flags
+
+    clock[0] += 5.0
+    assert manager.evaluate().active is True
@@ -0,0 +1,144 @@
+"""Tests for the answer quality filter."""
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from app.pipelines.quality_control import AnswerQualityFilter, TemplateFallbackBuilder
+from app.schemas import AnswerBody, AnswerPayload, CitationEntry, RAGAnswerRequest
+
+GOOD_PROFILE = (
+    "The Sun moves through your tenth house and lights up long-term ambitions this month. "
+    "Mars in a supportive aspect to Saturn rewards steady, disciplined effort at work. "
+    "Venus softens conversations at home, so shared plans feel easier to agree on now. "
+    "Use the retrograde phase later in the season to review commitments before expanding."
+)
+
+
+def _payload(general: str, strengths=("Focus",), watchouts=("Rest",)) -> AnswerPayload:
+    return AnswerPayload(
+        answer=AnswerBody(general_profile=general, strengths=list(strengths), watchouts=list(watchouts)),
+        citations=[CitationEntry(doc_id="doc-1", section=0, line_start=0, line_end=1)],
+    )
+
+
+def _split_count(text: str) -> int:
+    return len([segment for segment in re.split(r"[.!?]+", text) if segment.strip()])
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "...",
+        "One sentence",
+        "First. Second! Third?",
+        "Ellipsis... then more!?  And a tail",
+        "  .  . a . ",
+        "Mars\tsquares\nSaturn.\n\nVenus trines Jupiter.",
+    ],
+)
+def test_count_sentences_matches_split(text):
+    quality_filter = AnswerQualityFilter()
+
+    assert quality_filter._count_sentences(text) == _split_count(text)
+
+
+def test_count_sentences_stops_at_limit():
+    quality_filter = AnswerQualityFilter()
+
+    assert quality_filter._count_sentences("One. Two. Three. Four. Five.", limit=3) == 3
+    assert quality_filter._count_sentences("One. Two.", limit=3) == 2
+
+
+def test_evaluate_passes_complete_payload():
+    report = AnswerQualityFilter().evaluate(_payload(GOOD_PROFILE))
+
+    assert report.passed is True
+    assert report.issues == ()
+    assert report.primary_issue == "ok"
+
+
+def test_evaluate_skips_scans_for_empty_profile(monkeypatch):
+    quality_filter = AnswerQualityFilter()
+    monkeypatch.setattr(
+        quality_filter, "_count_sentences", lambda *args, **kwargs: pytest.fail("sentence scan ran")
+    )
+    monkeypatch.setattr(
+        quality_filter, "_has_min_signal_terms", lambda *args, **kwargs: pytest.fail("keyword scan ran")
+    )
+
+    report = quality_filter.evaluate(_payload("", strengths=(), watchouts=()))
+
+    assert report.issues == (
+        "general_profile_too_short",
+        "missing_astrology_signal",
+        "missing_strengths",
+        "missing_watchouts",
+    )
+
+
+def test_min_signal_terms_counts_distinct_keywords():
+    quality_filter = AnswerQualityFilter()
+    text = "The Sun, the sun and the Moon. Your Ascendant sits in a fire sign; sunny days ahead."
+
+    assert quality_filter._has_min_signal_terms(text, 4) is True
+    assert quality_filter._has_min_signal_terms(text, 5) is False
+    assert quality_filter._has_min_signal_terms("Sunday morning at the seaside", 1) is False
+    assert quality_filter._has_min_signal_terms("", 0) is True
+
+
+@pytest.mark.parametrize(
+    ("locale", "header", "strength"),
+    [
+        ("tr-TR", "Otomatik kalite denetimi devrede.", "Kariyer konusunda öğrenmeye açık"),
+        ("en-US", "Safety fallback engaged.", "Curiosity around Kariyer helps"),
+    ],
+)
+def test_fallback_builder_renders_language_templates(locale, header, strength):
+    request = RAGAnswerRequest(query="Kariyer yorumu", locale_settings={"locale": locale})
+    base = _payload("kısa", strengths=(), watchouts=())
+
+    fallback = TemplateFallbackBuilder().build(
+        request, {"main_themes": ["Kariyer", "Aşk"]}, None, base, ["missing_strengths"]
+    )
+
+    assert fallback.answer.general_profile.startswith(header)
+    assert fallback.answer.general_profile.endswith("(issues: missing_strengths)")
+    assert "Kariyer, Aşk" in fallback.answer.general_profile
+    assert len(fallback.answer.strengths) == 2
+    assert fallback.answer.strengths[0].startswith(strength)
+    assert len(fallback.answer.watchouts) == 2
+    assert fallback.answer.collective_note
+    assert fallback.citations == base.citations
+    assert fallback.limits.coverage_ok is False
+    assert fallback.limits.hallucination_risk == "medium"
+    assert base.limits.hallucination_risk is None
+
+
+def test_fallback_citations_resolve_ids_for_dicts_and_objects():
+    documents = [
+        {"content": "Dict doc", "metadata": {"doc_id": "from-metadata", "section": 2}},
+        SimpleNamespace(content="Object doc", metadata={"chunk_id": "chunk-7"}, source_id="source-1"),
+        SimpleNamespace(content="Bare doc", metadata=None, source_id="source-2"),
+    ]
+
+    citations = TemplateFallbackBuilder()._citations([], SimpleNamespace(documents=documents))
+
+    assert [citation.doc_id for citation in citations] == ["from-metadata", "chunk-7"]
+    assert citations[0].section == 2
+    assert citations[1].snippet == "Object doc"
+
+
+def test_fallback_citations_match_validated_entries():
+    documents = [{"content": "x" * 300, "metadata": {"chunk_id": 42, "section": "-3", "language": "tr"}}]
+    builder = TemplateFallbackBuilder()
+
+    citations = builder._citations([], SimpleNamespace(documents=documents))
+    placeholder = builder._citations([], SimpleNamespace(documents=[]))
+
+    assert citations == [
+        CitationEntry(doc_id="42", section=0, line_start=0, line_end=0, language="tr", snippet="x" * 200)
+    ]
+    assert placeholder[0].doc_id == "fallback-doc"
+    assert CitationEntry.model_validate(placeholder[0].model_dump()) == placeholder[0]
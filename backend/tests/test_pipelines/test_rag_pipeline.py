@@ -0,0 +1,91 @@
+"""Tests for the end-to-end RAG answer pipeline."""
+import pytest
+from fastapi import HTTPException
+
+import app.evaluation  # noqa: F401  - loads the pipeline modules in dependency order
+from app.evaluation.observability import MetricCollector, observability
+from app.pipelines.cache import SemanticCache
+from app.pipelines.degrade import DegradePolicyManager
+from app.pipelines.rag_pipeline import RAGAnswerPipeline
+from app.schemas import RAGAnswerRequest
+
+_BIRTH_DATA = {
+    "date": "1990-05-17",
+    "time": "14:30",
+    "tz": "Europe/Istanbul",
+    "lat": 41.0,
+    "lng": 29.0,
+}
+_CAREER_QUERY = (
+    "What does my chart say about my career prospects over the next few years "
+    "and how should I prepare for the changes ahead"
+)
+
+
+def _request(query: str, **kwargs) -> RAGAnswerRequest:
+    return RAGAnswerRequest(query=query, birth_data=_BIRTH_DATA, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_exact_repeat_is_served_from_cache():
+    pipeline = RAGAnswerPipeline(semantic_cache=SemanticCache())
+    first = await pipeline.run(_request(_CAREER_QUERY))
+
+    assert await pipeline.run(_request(_CAREER_QUERY)) is first
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    [
+        _CAREER_QUERY.replace("career", "marriage"),
+        _CAREER_QUERY.replace("should I", "should I not"),
+        "does venus square mars",
+    ],
+)
+async def test_reworded_queries_for_same_chart_miss_cache(query):
+    pipeline = RAGAnswerPipeline(semantic_cache=SemanticCache())
+    cached = [
+        await pipeline.run(_request(_CAREER_QUERY)),
+        await pipeline.run(_request("does mars square venus")),
+    ]
+
+    response = await pipeline.run(_request(query))
+
+    # A similarity hit would hand back a cached payload under the new request.
+    assert all(response.payload is not earlier.payload for earlier in cached)
+
+
+@pytest.mark.asyncio
+async def test_latency_budget_skips_do_not_raise_degrade_gauge():
+    pipeline = RAGAnswerPipeline(semantic_cache=SemanticCache())
+    # Fresh metrics keep earlier runs' latencies from tripping the p95 guard.
+    pipeline._degrade = DegradePolicyManager(
+        metrics=MetricCollector(max_points_per_metric=50),
+        budget_multi_hop_ms=1500,
+        budget_revision_ms=800,
+    )
+
+    response = await pipeline.run(_request(_CAREER_QUERY, constraints={"max_latency_ms": 500}))
+
+    assert response.debug.degrade["active"] is False
+    assert response.debug.degrade["llm_overrides"].get("skip_revision") is True
+    assert observability.metrics.gauges["rag_degrade_active"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_coverage_metric_is_recorded_when_payload_build_fails(monkeypatch):
+    pipeline = RAGAnswerPipeline(semantic_cache=SemanticCache())
+    metrics = MetricCollector(max_points_per_metric=50)
+    monkeypatch.setattr(observability, "metrics", metrics)
+
+    async def reject_payload(**kwargs):
+        raise HTTPException(status_code=422, detail="Citations required")
+
+    monkeypatch.setattr(pipeline, "_build_answer_payload", reject_payload)
+
+    with pytest.raises(HTTPException):
+        await pipeline.run(_request(_CAREER_QUERY))
+
+    assert len(metrics.get_metric_values("coverage_score", 60)) == 1
+    assert metrics.get_metric_values("rag_latency", 60) == []
@@ -0,0 +1,75 @@
+"""Tests for retrieval content sanitization."""
+import pytest
+
+from app.pipelines.sanitization import (
+    apply_ethics_notice,
+    mask_pii,
+    sanitize_sequence,
+    sanitize_sequence_async,
+    sanitize_text,
+)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("", ""),
+        ("  Mars   in\nAries \t", "Mars in Aries"),
+        ("Saturn<script>alert(1)</script> returns", "Saturn returns"),
+        ("<style>p{}</style><p>Venus</p> rising", "Venus rising"),
+        ("<SCRIPT type='x'>a</script>Moon<Style>b</STYLE> phase", "Moon phase"),
+        ("<script>a</style>b</script>Sun", "Sun"),
+        # Script blocks are stripped before style blocks, as they always were.
+        ("<style>a<script>b</style>c</script>d", "ad"),
+        ("See https://example.com/chart for details", "See [external-link] for details"),
+    ],
+)
+def test_sanitize_text(raw, expected):
+    assert sanitize_text(raw) == expected
+
+
+def test_sanitize_sequence_preserves_order():
+    assert sanitize_sequence(iter(["<b>Sun</b>", "Moon  ", ""])) == ["Sun", "Moon", ""]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("repeat", [1, 500])
+async def test_sanitize_sequence_async_matches_sync(repeat):
+    texts = ["<p>Mars  in Aries</p>" * repeat, "", "Moon https://x.io/a"]
+    assert await sanitize_sequence_async(iter(texts)) == sanitize_sequence(texts)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("<script>" * 2000, ""),
+        ("<style><script>" * 2000, ""),
+        ("<a" * 2000 + ">", ""),
+        ("x" + "<b" * 2000, "x" + "<b" * 2000),
+    ],
+)
+def test_sanitize_text_unterminated_markup(raw, expected):
+    # Lazy block regexes used to backtrack cubically on input like this.
+    assert sanitize_text(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("Venus rising", "Venus rising"),
+        ("T.C. Kimlik No listed", "*** listed"),
+        ("TC KİMLİK NO 12345678901", "*** ***"),
+        ("Born 1990-01-02 at 12:30, lat: 41.01", "Born *** at ***, ***"),
+    ],
+)
+def test_mask_pii(raw, expected):
+    assert mask_pii(raw) == expected
+
+
+@pytest.mark.parametrize("text", ["SAĞLIK konuları", "Sağlik", "hastalık", "YATIRIM planı", "medical advice"])
+def test_ethics_notice_detects_sensitive_topics(text):
+    assert apply_ethics_notice(text).endswith("danışmanlık alınız.")
+
+
+def test_ethics_notice_skips_neutral_text():
+    assert apply_ethics_notice("Mars in Aries") == "Mars in Aries"
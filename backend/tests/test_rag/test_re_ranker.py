@@ -0,0 +1,52 @@
+"""
+Tests for the BGE rerank wrapper
+"""
+from collections import OrderedDict
+
+from app.rag import re_ranker
+from app.rag.retriever import RetrievalResult
+
+
+class _CountingReranker:
+    def __init__(self):
+        self.scored_pairs = []
+
+    def compute_score(self, pairs, batch_size=256, max_length=512):
+        assert batch_size == len(pairs)
+        self.scored_pairs.extend(pairs)
+        return [float(len(passage)) for _, passage in pairs]
+
+
+def _docs(*contents):
+    return [
+        RetrievalResult(content=content, score=0.0, source_id=f"doc-{idx}")
+        for idx, content in enumerate(contents)
+    ]
+
+
+def test_rerank_reuses_cached_pair_scores(monkeypatch):
+    stub = _CountingReranker()
+    monkeypatch.setattr(re_ranker, "_BGE_RERANKER", stub)
+    monkeypatch.setattr(re_ranker, "_RERANK_EXECUTOR", None)
+    monkeypatch.setattr(re_ranker, "_RERANK_SCORE_CACHE", OrderedDict())
+
+    first = re_ranker.rerank("venus", _docs("a", "bbb"))
+    assert [doc.content for doc in first] == ["bbb", "a"]
+    assert len(stub.scored_pairs) == 2
+
+    second = re_ranker.rerank("venus", _docs("bbb", "cc", "a"))
+    assert [doc.content for doc in second] == ["bbb", "cc", "a"]
+    assert [doc.score for doc in second] == [3.0, 2.0, 1.0]
+    # Only the unseen passage is sent to the model.
+    assert stub.scored_pairs[2:] == [("venus", "cc")]
+
+
+def test_rerank_cache_is_bounded(monkeypatch):
+    stub = _CountingReranker()
+    monkeypatch.setattr(re_ranker, "_BGE_RERANKER", stub)
+    monkeypatch.setattr(re_ranker, "_RERANK_EXECUTOR", None)
+    monkeypatch.setattr(re_ranker, "_RERANK_SCORE_CACHE", OrderedDict())
+    monkeypatch.setattr(re_ranker, "_RERANK_CACHE_SIZE", 2)
+
+    re_ranker.rerank("mars", _docs("a", "bb", "ccc"))
+    assert list(re_ranker._RERANK_SCORE_CACHE) == [("mars", "bb"), ("mars", "ccc")]
@@ -1,10 +1,12 @@
 """
 Tests for RAG retrieval system
 """
+import asyncio
+
 import pytest
 from app.rag.retriever import (
     HybridRetriever, MockVectorStore, MockSparseStore, 
-    RetrievalQuery, RetrievalMethod
+    RetrievalQuery, RetrievalMethod, RetrievalResult, search_hybrid
 )
 
 @pytest.mark.asyncio
@@ -171,4 +173,43 @@ async def test_empty_query():
     results = await retriever.retrieve(query)
     
     # Should handle empty query gracefully
-    assert isinstance(results, list)
\ No newline at end of file
+    assert isinstance(results, list)
+
+
+class _StubStore:
+    """Async-only store that records when its search starts and finishes."""
+
+    def __init__(self, name, ids, events):
+        self.name = name
+        self.ids = ids
+        self.events = events
+
+    def search_dense(self, *args, **kwargs):
+        raise AssertionError("hybrid legs must use the async search path")
+
+    search_sparse = search_dense
+
+    async def search(self, query, top_k=10, filters=None):
+        self.events.append(f"{self.name}:start")
+        await asyncio.sleep(0.01)
+        self.events.append(f"{self.name}:end")
+        method = RetrievalMethod.DENSE if self.name == "dense" else RetrievalMethod.SPARSE
+        return [
+            RetrievalResult(content=doc_id, score=1.0 - idx * 0.1, source_id=doc_id, metadata={}, method=method)
+            for idx, doc_id in enumerate(self.ids[:top_k])
+        ]
+
+
+@pytest.mark.asyncio
+async def test_search_hybrid_queries_stores_concurrently_and_fuses_by_rank():
+    events = []
+    dense = _StubStore("dense", ["a", "b", "c"], events)
+    sparse = _StubStore("sparse", ["c", "a", "d"], events)
+
+    results = await search_hybrid("mars", 3, dense, sparse, fusion="rrf")
+
+    assert sorted(events[:2]) == ["dense:start", "sparse:start"]
+    assert [result.source_id for result in results] == ["a", "c", "b"]
+    assert results[0].score == pytest.approx(1 / 61 + 1 / 62)
+    assert all(result.method == RetrievalMethod.HYBRID for result in results)
+    assert results[0].metadata["hybrid_fusion"] == "rrf"